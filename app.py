@@ -6,10 +6,16 @@ A web-based application for analyzing personal finance survey data.
 import streamlit as st
 import pandas as pd
 import os
+from src.cache import SurveyDataCache
 from src.data_handler import DataHandler
 from src.analyzer import FinanceAnalyzer
 from src.visualizer import DataVisualizer
-from src.utils import format_currency, format_percentage
+from src.utils import (
+    enable_copy_on_write, format_currency, format_percentage
+)
+
+# The handler, analyzer and visualizer share one survey frame
+enable_copy_on_write()
 
 # Page configuration
 st.set_page_config(
@@ -48,14 +54,17 @@ def load_data_from_upload(uploaded_file):
         df = pd.read_csv(uploaded_file)
         data_handler = DataHandler()
         data_handler.data = df
-        data_handler.original_data = df.copy()
 
         if data_handler._validate_data_structure():
             data_handler._generate_data_info()
             st.session_state.data = data_handler.data
             st.session_state.data_handler = data_handler
-            st.session_state.analyzer = FinanceAnalyzer(data_handler.data)
-            st.session_state.visualizer = DataVisualizer(data_handler.data)
+            st.session_state.analyzer = FinanceAnalyzer(
+                data_handler.data, fingerprint=data_handler.get_fingerprint()
+            )
+            st.session_state.visualizer = DataVisualizer(
+                data_handler.data, fingerprint=data_handler.get_fingerprint()
+            )
             st.session_state.data_loaded = True
             return True, f"✅ Successfully loaded {len(df)} records!"
         else:
@@ -69,12 +78,18 @@ def load_sample_data():
     try:
         sample_path = 'data/sample_survey.csv'
         if os.path.exists(sample_path):
-            data_handler = DataHandler()
+            data_handler = DataHandler(cache=SurveyDataCache())
             if data_handler.load_csv(sample_path):
                 st.session_state.data = data_handler.data
                 st.session_state.data_handler = data_handler
-                st.session_state.analyzer = FinanceAnalyzer(data_handler.data)
-                st.session_state.visualizer = DataVisualizer(data_handler.data)
+                st.session_state.analyzer = FinanceAnalyzer(
+                    data_handler.data,
+                    fingerprint=data_handler.get_fingerprint()
+                )
+                st.session_state.visualizer = DataVisualizer(
+                    data_handler.data,
+                    fingerprint=data_handler.get_fingerprint()
+                )
                 st.session_state.data_loaded = True
                 return True, f"✅ Loaded {len(data_handler.data)} records!"
         return False, "❌ Sample file not found."
@@ -177,10 +192,9 @@ def main():
                     st.info(insight)
 
             st.markdown("### 📊 Visualizations")
-            fig = st.session_state.visualizer.create_spending_charts(
-                save_path=None)
-            if fig:
-                st.pyplot(fig)
+            image = st.session_state.visualizer.render_chart('spending')
+            if image:
+                st.image(image, use_column_width=True)
 
     elif analysis_option == "💰 Savings":
         st.subheader("💰 Savings Analysis")
@@ -205,10 +219,9 @@ def main():
                     st.info(insight)
 
             st.markdown("### 📊 Visualizations")
-            fig = st.session_state.visualizer.create_savings_charts(
-                save_path=None)
-            if fig:
-                st.pyplot(fig)
+            image = st.session_state.visualizer.render_chart('savings')
+            if image:
+                st.image(image, use_column_width=True)
 
     elif analysis_option == "📈 Investments":
         st.subheader("📈 Investment Analysis")
@@ -232,10 +245,9 @@ def main():
                     st.info(insight)
 
             st.markdown("### 📊 Visualizations")
-            fig = st.session_state.visualizer.create_investment_charts(
-                save_path=None)
-            if fig:
-                st.pyplot(fig)
+            image = st.session_state.visualizer.render_chart('investment')
+            if image:
+                st.image(image, use_column_width=True)
 
     elif analysis_option == "🎓 Literacy":
         st.subheader("🎓 Financial Literacy")
@@ -256,10 +268,9 @@ def main():
                     st.info(insight)
 
             st.markdown("### 📊 Visualizations")
-            fig = st.session_state.visualizer.create_financial_literacy_charts(
-                save_path=None)
-            if fig:
-                st.pyplot(fig)
+            image = st.session_state.visualizer.render_chart('literacy')
+            if image:
+                st.image(image, use_column_width=True)
 
     elif analysis_option == "📄 Complete Report":
         st.subheader("📄 Comprehensive Report")
@@ -277,10 +288,9 @@ def main():
             st.success(f"{i}. {finding}")
 
         st.markdown("## Dashboard")
-        fig = st.session_state.visualizer.create_comprehensive_dashboard(
-            save_path=None)
-        if fig:
-            st.pyplot(fig)
+        image = st.session_state.visualizer.render_chart('dashboard')
+        if image:
+            st.image(image, use_column_width=True)
 
 
 if __name__ == "__main__":
@@ -1,45 +1,135 @@
 const Pty = require('node-pty');
 const fs = require('fs');
+const net = require('net');
+const os = require('os');
+const path = require('path');
+const { spawn } = require('child_process');
+
+// Sessions are served by a pre-forked pool of run.py workers
+// (src/session_server.py): the app is imported once and each
+// connection gets a forked copy instead of a cold interpreter.
+const POOL = {
+    socket: path.join(os.tmpdir(), 'finance-sessions-' + process.pid + '.sock'),
+    size: process.env.SESSION_POOL_SIZE || '4',
+    maxSessions: process.env.SESSION_MAX || '20',
+    idleTimeout: process.env.SESSION_IDLE_TIMEOUT || '900',
+    server: null,
+    ready: false
+};
 
 exports.install = function () {
 
     ROUTE('/');
     WEBSOCKET('/', socket, ['raw']);
 
+    startPool();
+
 };
 
-function socket() {
+function startPool() {
 
-    this.encodedecode = false;
-    this.autodestroy();
+    POOL.ready = false;
+    POOL.server = spawn('python3', [
+        '-m', 'src.session_server',
+        '--socket', POOL.socket,
+        '--size', POOL.size,
+        '--max-sessions', POOL.maxSessions,
+        '--idle-timeout', POOL.idleTimeout
+    ], {
+        cwd: process.env.PWD,
+        env: process.env,
+        stdio: ['ignore', 'pipe', 'inherit']
+    });
 
-    this.on('open', function (client) {
+    POOL.server.stdout.on('data', function (data) {
+        process.stdout.write(data);
+        if (data.toString().indexOf('Serving sessions') !== -1)
+            POOL.ready = true;
+    });
+
+    POOL.server.on('exit', function (code, signal) {
+        console.log("Session pool exited (" + (signal || code) + "), restarting");
+        POOL.ready = false;
+        POOL.server = null;
+        setTimeout(startPool, 1000);
+    });
+
+}
+
+function spawnTerminal(client) {
+
+    // Spawn terminal
+    client.tty = Pty.spawn('python3', ['run.py'], {
+        name: 'xterm-color',
+        cols: 80,
+        rows: 24,
+        cwd: process.env.PWD,
+        env: process.env
+    });
 
-        // Spawn terminal
-        client.tty = Pty.spawn('python3', ['run.py'], {
-            name: 'xterm-color',
-            cols: 80,
-            rows: 24,
-            cwd: process.env.PWD,
-            env: process.env
-        });
+    client.tty.on('exit', function (code, signal) {
+        client.tty = null;
+        client.close();
+        console.log("Process killed");
+    });
 
-        client.tty.on('exit', function (code, signal) {
+    client.tty.on('data', function (data) {
+        client.send(data);
+    });
+
+}
+
+function connectSession(client) {
+
+    var started = false;
+    var session = net.connect(POOL.socket);
+    session.setEncoding('utf8');
+    client.tty = session;
+
+    session.on('data', function (data) {
+        started = true;
+        client.send(data);
+    });
+
+    session.on('error', function (err) {
+        if (!started && client.tty === session) {
+            // The pool is restarting: fall back to a cold process
+            console.log("Session pool unavailable: " + err.message);
+            session.destroy();
+            spawnTerminal(client);
+        }
+    });
+
+    session.on('close', function () {
+        if (client.tty === session) {
             client.tty = null;
             client.close();
-            console.log("Process killed");
-        });
+            console.log("Session ended");
+        }
+    });
 
-        client.tty.on('data', function (data) {
-            client.send(data);
-        });
+}
+
+function socket() {
 
+    this.encodedecode = false;
+    this.autodestroy();
+
+    this.on('open', function (client) {
+        if (POOL.ready)
+            connectSession(client);
+        else
+            spawnTerminal(client);
     });
 
     this.on('close', function (client) {
-        if (client.tty) {
-            client.tty.kill(9);
+        var tty = client.tty;
+        if (tty) {
             client.tty = null;
+            if (tty instanceof net.Socket)
+                tty.destroy();
+            else
+                tty.kill(9);
             console.log("Process killed and terminal unloaded");
         }
     });
@@ -49,6 +139,10 @@ function socket() {
     });
 }
 
+process.on('exit', function () {
+    POOL.server && POOL.server.kill();
+});
+
 if (process.env.CREDS != null) {
     console.log("Creating creds.json file.");
     fs.writeFile('creds.json', process.env.CREDS, 'utf8', function (err) {
@@ -57,4 +151,4 @@ if (process.env.CREDS != null) {
             socket.emit("console_output", "Error saving credentials: " + err);
         }
     });
-}
\ No newline at end of file
+}
@@ -2,21 +2,27 @@
 Personal Finance Survey Analyzer
 A command-line application with ASCII art visualization
 ADAPTED FOR CODE INSTITUTE TEMPLATE - HEROKU DEPLOYMENT
+
+Run without arguments for the interactive menu, or headless:
+
+    python3 run.py analyze --input data/ --report json --charts exports/charts
 """
 
+import argparse
+import json
 import os
 import sys
+import threading
 
-# Import matplotlib first and set backend before other imports
-import matplotlib
-matplotlib.use('Agg')  # Non-interactive backend for Heroku
-import matplotlib.pyplot as plt  # noqa: E402
+# Non-interactive backend for Heroku, used whenever matplotlib is first
+# imported. The plotting and Google Sheets stacks are imported where
+# they are first needed, keeping them off every session's startup.
+os.environ.setdefault('MPLBACKEND', 'Agg')
 
+from src.cache import SurveyDataCache  # noqa: E402
 from src.data_handler import DataHandler  # noqa: E402
 from src.analyzer import FinanceAnalyzer  # noqa: E402
-from src.visualizer import DataVisualizer  # noqa: E402
-from src.google_sheets_handler import GoogleSheetsHandler  # noqa: E402
-from src.utils import validate_choice  # noqa: E402
+from src.utils import enable_copy_on_write, validate_choice  # noqa: E402
 
 
 class ASCIIVisualizer:
@@ -228,13 +234,27 @@ class PersonalFinanceAnalyzer:
         """Initialize the application components."""
         self.data_handler = None
         self.analyzer = None
-        self.visualizer = None
+        self._visualizer = None
         self.sheets_handler = None
+        self.session_logger = None
         self.ascii_viz = ASCIIVisualizer()
         self.data_loaded = False
         self.sheets_connected = False
+        self.sheets_prewarmed = False
         self.username = ""
 
+    @property
+    def visualizer(self):
+        """DataVisualizer of the loaded data, created on first use."""
+        if self._visualizer is None:
+            # Imported here: loads matplotlib and seaborn
+            from src.visualizer import DataVisualizer
+            self._visualizer = DataVisualizer(
+                self.data_handler.data,
+                fingerprint=self.data_handler.get_fingerprint()
+            )
+        return self._visualizer
+
     def display_welcome(self):
         """Display welcome message."""
         print("=" * 70)
@@ -311,24 +331,26 @@ class PersonalFinanceAnalyzer:
             # Get absolute path to data file
             base_dir = os.path.dirname(os.path.abspath(__file__))
             file_path = os.path.join(base_dir, 'data', 'sample_survey.csv')
+            cache_dir = os.path.join(base_dir, '.cache', 'survey_data')
 
-            self.data_handler = DataHandler()
+            self.data_handler = DataHandler(
+                cache=SurveyDataCache(cache_dir)
+            )
             success = self.data_handler.load_csv(file_path)
 
             if success:
-                self.analyzer = FinanceAnalyzer(self.data_handler.data)
-                self.visualizer = DataVisualizer(self.data_handler.data)
+                self.analyzer = FinanceAnalyzer(
+                    self.data_handler.data,
+                    fingerprint=self.data_handler.get_fingerprint()
+                )
+                self._visualizer = None
                 self.data_loaded = True
                 print("✅ Data loaded successfully!")
                 record_count = len(self.data_handler.data)
                 print(f"📊 Dataset contains {record_count} responses")
 
                 # Log session if connected
-                if self.sheets_connected and self.sheets_handler:
-                    self.sheets_handler.log_user_session(
-                        self.username,
-                        "Loaded local CSV data"
-                    )
+                self.log_session("Loaded local CSV data")
             else:
                 print("❌ Failed to load data.")
 
@@ -338,6 +360,22 @@ class PersonalFinanceAnalyzer:
         input("\nPress Enter to continue...")
         return True
 
+    def prewarm_sheets(self):
+        """
+        Authorize Google Sheets in the background, once.
+
+        Started when the user picks a Sheets option before connecting,
+        so the connect that follows waits on neither the imports nor the
+        token. Sessions that never use Sheets never load its stack.
+        """
+        if self.sheets_prewarmed:
+            return
+        if os.environ.get('CREDS') or os.path.exists('creds.json'):
+            self.sheets_prewarmed = True
+            threading.Thread(
+                target=prewarm_sheets, name='sheets-prewarm', daemon=True
+            ).start()
+
     def connect_google_sheets(self):
         """Connect to Google Sheets API."""
         print("\n" + "-" * 70)
@@ -345,16 +383,18 @@ class PersonalFinanceAnalyzer:
         print("-" * 70)
 
         try:
+            # Imported here: loads gspread and google-auth
+            from src.google_sheets_handler import GoogleSheetsHandler
+            from src.session_logger import SessionLogger
+
             self.sheets_handler = GoogleSheetsHandler()
             success = self.sheets_handler.connect()
 
             if success:
                 self.sheets_connected = True
+                self.session_logger = SessionLogger(self.sheets_handler)
                 print("\n✅ Successfully connected to Google Sheets!")
-                self.sheets_handler.log_user_session(
-                    self.username,
-                    "Connected to Google Sheets"
-                )
+                self.log_session("Connected to Google Sheets")
             else:
                 print("\n❌ Connection failed.")
                 print("💡 TIP: The app works perfectly without "
@@ -369,6 +409,7 @@ class PersonalFinanceAnalyzer:
     def load_google_sheets_data(self):
         """Load data from Google Sheets."""
         if not self.sheets_connected:
+            self.prewarm_sheets()
             print("\n❌ Please connect to Google Sheets first (Option 2)")
             input("Press Enter to continue...")
             return True
@@ -391,22 +432,22 @@ class PersonalFinanceAnalyzer:
                 if not worksheet_name:
                     worksheet_name = 'survey_data'
 
-                data = self.sheets_handler.load_survey_data(worksheet_name)
+                data = self.sheets_handler.load_survey_data(
+                    worksheet_name, delta=True
+                )
 
                 if data is not None:
                     self.data_handler = DataHandler()
                     self.data_handler.data = data
-                    self.data_handler.original_data = data.copy()
-                    self.analyzer = FinanceAnalyzer(data)
-                    self.visualizer = DataVisualizer(data)
+                    self.analyzer = FinanceAnalyzer(
+                        data, fingerprint=self.data_handler.get_fingerprint()
+                    )
+                    self._visualizer = None
                     self.data_loaded = True
 
                     print(f"\n✅ Loaded {len(data)} records!")
 
-                    self.sheets_handler.log_user_session(
-                        self.username,
-                        f"Loaded data from {spreadsheet_name}"
-                    )
+                    self.log_session(f"Loaded data from {spreadsheet_name}")
 
         except (IOError, OSError) as e:
             print(f"❌ Error: {str(e)}")
@@ -872,9 +913,13 @@ class PersonalFinanceAnalyzer:
             os.makedirs(chart_dir, exist_ok=True)
 
             try:
-                # Export all matplotlib charts
-                self.visualizer.export_all_charts(chart_dir)
+                # Export all matplotlib charts; a render pool is only
+                # used where it pays off
+                self.visualizer.export_all_charts(chart_dir, workers='auto')
                 print("✅ PNG charts exported to exports/charts/")
+                for chart, seconds in (
+                        self.visualizer.render_timings.items()):
+                    print(f"   {chart}: {seconds:.2f}s")
             except (IOError, OSError) as e:
                 print(f"⚠️  Error exporting charts: {str(e)}")
 
@@ -889,11 +934,7 @@ class PersonalFinanceAnalyzer:
             print("❌ Invalid choice. Please select 1, 2, or 3.")
 
         # Log session if connected
-        if self.sheets_connected and self.sheets_handler:
-            self.sheets_handler.log_user_session(
-                self.username,
-                "Exported analysis results"
-            )
+        self.log_session("Exported analysis results")
 
         input("\nPress Enter to continue...")
         return True
@@ -901,6 +942,7 @@ class PersonalFinanceAnalyzer:
     def save_to_google_sheets(self):
         """Save analysis results to Google Sheets."""
         if not self.sheets_connected:
+            self.prewarm_sheets()
             print("\n❌ Please connect to Google Sheets first (Option 2)")
             print("💡 Or use Option 10 to export locally")
             input("Press Enter to continue...")
@@ -938,16 +980,14 @@ class PersonalFinanceAnalyzer:
             if choice == '2' or choice == '3':
                 self.sheets_handler.export_dataframe_to_sheets(
                     self.data_handler.data,
-                    'cleaned_survey_data'
+                    'cleaned_survey_data',
+                    delta=True
                 )
 
             if choice not in ['1', '2', '3']:
                 print("❌ Invalid choice.")
 
-            self.sheets_handler.log_user_session(
-                self.username,
-                "Saved results to Google Sheets"
-            )
+            self.log_session("Saved results to Google Sheets")
 
         except (IOError, OSError) as e:
             print(f"❌ Error: {str(e)}")
@@ -962,6 +1002,7 @@ class PersonalFinanceAnalyzer:
         print("-" * 70)
 
         if not self.sheets_connected:
+            self.prewarm_sheets()
             print("\n❌ Not connected to Google Sheets")
             print("💡 Use Option 2 to connect")
             print("\nNote: Google Sheets is optional!")
@@ -978,41 +1019,190 @@ class PersonalFinanceAnalyzer:
                 for name in info.get('worksheet_names', []):
                     print(f"  • {name}")
 
+            api_stats = self.sheets_handler.get_api_stats()
+            if api_stats:
+                print("\n📈 API Calls (attempts / retries / mean latency):")
+                for name, stats in api_stats.items():
+                    print(f"  • {name}: {stats['calls']} / "
+                          f"{stats['retries']} / {stats['mean_seconds']}s")
+
         input("\nPress Enter to continue...")
         return True
 
+    def log_session(self, action):
+        """
+        Log a session action to Google Sheets without waiting on it.
+
+        Args:
+            action (str): Action performed
+        """
+        if self.sheets_connected and self.session_logger:
+            self.session_logger.log(self.username, action)
+
+    def close_sheets(self):
+        """Write any queued session logs and close Google Sheets."""
+        if self.session_logger:
+            if not self.session_logger.close():
+                print("⚠️  Some session logs could not be written in time")
+            self.session_logger = None
+
+        if self.sheets_connected and self.sheets_handler:
+            self.sheets_handler.close_connection()
+            self.sheets_connected = False
+
     def run(self):
         """Main application loop."""
         self.display_welcome()
 
-        while True:
-            self.display_menu()
-            choice = input("\nEnter your choice (1-13): ").strip()
+        try:
+            while True:
+                self.display_menu()
+                choice = input("\nEnter your choice (1-13): ").strip()
 
-            if not validate_choice(choice, 1, 13):
-                print("\n❌ Invalid choice. Enter 1-13.")
-                input("Press Enter to continue...")
-                continue
+                if not validate_choice(choice, 1, 13):
+                    print("\n❌ Invalid choice. Enter 1-13.")
+                    input("Press Enter to continue...")
+                    continue
 
-            continue_app = self.handle_menu_choice(choice)
+                continue_app = self.handle_menu_choice(choice)
 
-            if not continue_app:
-                print("\n" + "=" * 70)
-                print(f"Thank you, {self.username}!")
-                print("=" * 70)
+                if not continue_app:
+                    print("\n" + "=" * 70)
+                    print(f"Thank you, {self.username}!")
+                    print("=" * 70)
+
+                    self.log_session("Exited application")
+                    break
+        finally:
+            # Queued logs are flushed however the loop ends
+            self.close_sheets()
 
-                if self.sheets_connected and self.sheets_handler:
-                    self.sheets_handler.log_user_session(
-                        self.username,
-                        "Exited application"
-                    )
-                    self.sheets_handler.close_connection()
 
-                break
+def prewarm_sheets():
+    """Import the Sheets stack and authorize a client for later use."""
+    from src.google_sheets_handler import GspreadBackend
+    from src.sheets_clients import CLIENT_POOL
 
+    try:
+        CLIENT_POOL.client(GspreadBackend(), 'creds.json')
+    except Exception:
+        # Reported when the user connects and authorization is retried
+        pass
+
+
+def parse_args(argv):
+    """
+    Parse command-line arguments.
+
+    Args:
+        argv (list): Arguments after the program name
+
+    Returns:
+        argparse.Namespace: Parsed arguments; command is None for the
+            interactive menu
+    """
+    parser = argparse.ArgumentParser(
+        description="Personal Finance Survey Analyzer. Run without a "
+                    "command for the interactive menu."
+    )
+    commands = parser.add_subparsers(dest='command')
+
+    analyze = commands.add_parser(
+        'analyze', help="analyze survey files without prompts"
+    )
+    analyze.add_argument(
+        '--input', nargs='+', required=True, metavar='PATH',
+        help="survey CSV files, directories or glob patterns"
+    )
+    analyze.add_argument(
+        '--report', choices=('json', 'text'),
+        help="write the comprehensive report in this format"
+    )
+    analyze.add_argument(
+        '--report-dir', default=os.path.join('exports', 'reports'),
+        help="directory for the reports (default %(default)s)"
+    )
+    analyze.add_argument(
+        '--charts', metavar='DIR',
+        help="export the PNG charts to DIR, in a subdirectory per file "
+             "when there are several"
+    )
+    analyze.add_argument(
+        '--data', metavar='DIR', help="export the cleaned data to DIR"
+    )
+    analyze.add_argument(
+        '--workers', type=int,
+        help="files analyzed at once (default: CPU count)"
+    )
+    analyze.add_argument(
+        '--timings', metavar='FILE',
+        help="write machine-readable results and timings as JSON to "
+             "FILE, or - for stdout"
+    )
+    return parser.parse_args(argv)
+
+
+def run_analyze(args):
+    """
+    Run the headless analysis described by parsed arguments.
+
+    Args:
+        args (argparse.Namespace): Arguments of the analyze command
+
+    Returns:
+        int: Exit status, 1 if any file failed
+    """
+    from src.batch import expand_inputs, run_batch
+
+    try:
+        files = expand_inputs(args.input)
+    except FileNotFoundError as e:
+        print(f"❌ {str(e)}", file=sys.stderr)
+        return 1
+
+    results = run_batch(
+        files,
+        report_dir=args.report_dir if args.report else None,
+        report_format=args.report,
+        chart_dir=args.charts,
+        data_dir=args.data,
+        workers=args.workers
+    )
+
+    for result in results['files']:
+        if result['status'] == 'ok':
+            print(f"✅ {result['input']}: {result['rows']} rows in "
+                  f"{result['timings']['total']:.2f}s", file=sys.stderr)
+        else:
+            print(f"❌ {result['input']}: {result['error']}",
+                  file=sys.stderr)
+    print(f"Analyzed {len(files)} file(s) with {results['workers']} "
+          f"worker(s) in {results['total_seconds']:.2f}s", file=sys.stderr)
+
+    if args.timings == '-':
+        print(json.dumps(results, indent=2))
+    elif args.timings:
+        with open(args.timings, 'w', encoding='utf-8') as output:
+            json.dump(results, output, indent=2)
+
+    failed = any(result['status'] != 'ok' for result in results['files'])
+    return 1 if failed else 0
+
+
+def main(argv=None):
+    """
+    Application entry point.
+
+    Args:
+        argv (list): Arguments after the program name, defaults to the
+            command line
+    """
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    # The handler, analyzer and visualizer share one survey frame
+    enable_copy_on_write()
+    if args.command == 'analyze':
+        sys.exit(run_analyze(args))
 
-def main():
-    """Application entry point."""
     try:
         app = PersonalFinanceAnalyzer()
         app.run()
@@ -0,0 +1,519 @@
+"""
+Survey Aggregates Module for Personal Finance Survey Analyzer.
+
+This module computes every statistic used by the analysis report in a
+single pass over the survey columns, so the individual analyses only
+have to format shared results instead of rescanning the data.
+"""
+
+import numpy as np
+from src.schema import SURVEY_SCHEMA
+from src.sketches import MedianWindow, QuantileSketch
+
+
+# Columns the analyzer derives from the survey data
+DERIVED_COLUMNS = ['total_spending', 'savings_rate']
+
+# Survey columns whose median and range appear in the report
+DISTRIBUTION_COLUMNS = ['monthly_savings', 'financial_literacy_score']
+
+# Columns whose median appears in the report
+MEDIAN_COLUMNS = DISTRIBUTION_COLUMNS + DERIVED_COLUMNS
+
+
+def column_array(data, column):
+    """
+    Get a survey column as a float64 NumPy array.
+
+    Args:
+        data (pd.DataFrame): Survey data
+        column (str): Column name
+
+    Returns:
+        np.ndarray: Column values with missing entries as NaN
+    """
+    return data[column].to_numpy(dtype='float64', na_value=np.nan)
+
+
+def flag_array(data, column):
+    """
+    Get a yes/no survey column as a bool NumPy array.
+
+    Args:
+        data (pd.DataFrame): Survey data
+        column (str): Column name
+
+    Returns:
+        np.ndarray: True where the answer is yes; missing answers count
+            as False
+    """
+    return data[column].to_numpy(dtype='bool', na_value=False)
+
+
+def present_values(values):
+    """
+    Drop missing entries from a float64 array, copying only if needed.
+
+    Args:
+        values (np.ndarray): Float64 values, NaN for missing
+
+    Returns:
+        np.ndarray: Values without NaN
+    """
+    missing = np.isnan(values)
+    return values[~missing] if missing.any() else values
+
+
+def summarize(values, median=False, extremes=False):
+    """
+    Summarize a numeric array, skipping missing values like pandas.
+
+    Args:
+        values (np.ndarray): Float64 values, NaN for missing
+        median (bool): Also compute the median (a partition pass)
+        extremes (bool): Also compute the minimum and maximum
+
+    Returns:
+        dict: count, sum and mean, plus median/min/max if requested
+    """
+    present = present_values(values)
+    total = present.sum()
+    summary = {
+        'count': present.size,
+        'sum': total,
+        'mean': total / present.size if present.size else np.nan
+    }
+
+    if median:
+        summary['median'] = np.median(present) if present.size else np.nan
+    if extremes:
+        summary['min'] = present.min() if present.size else np.nan
+        summary['max'] = present.max() if present.size else np.nan
+    return summary
+
+
+def merge_summaries(first, second):
+    """
+    Combine two summaries of disjoint rows.
+
+    Counts, sums and extremes merge exactly; a median cannot be merged,
+    so it is left out and must be recomputed over all rows.
+
+    Args:
+        first (dict): Summary from summarize()
+        second (dict): Summary of further rows with the same keys
+
+    Returns:
+        dict: Summary of both sets of rows, without a median
+    """
+    count = first['count'] + second['count']
+    total = first['sum'] + second['sum']
+    merged = {
+        'count': count,
+        'sum': total,
+        'mean': total / count if count else np.nan
+    }
+
+    if 'min' in first:
+        merged['min'] = np.fmin(first['min'], second['min'])
+        merged['max'] = np.fmax(first['max'], second['max'])
+    return merged
+
+
+def co_moments(x, y):
+    """
+    Means and centered second moments over rows where both are present.
+
+    These are the running (Welford) statistics behind a correlation and
+    can be merged across batches of rows with merge_co_moments().
+
+    Args:
+        x (np.ndarray): Float64 values, NaN for missing
+        y (np.ndarray): Float64 values, NaN for missing
+
+    Returns:
+        dict: n, mean_x, mean_y, m2_x, m2_y and c_xy
+    """
+    missing = np.isnan(x) | np.isnan(y)
+    if missing.any():
+        x = x[~missing]
+        y = y[~missing]
+    if not x.size:
+        return {'n': 0, 'mean_x': 0.0, 'mean_y': 0.0,
+                'm2_x': 0.0, 'm2_y': 0.0, 'c_xy': 0.0}
+
+    dx = x - x.mean()
+    dy = y - y.mean()
+    return {
+        'n': x.size,
+        'mean_x': x.mean(),
+        'mean_y': y.mean(),
+        'm2_x': np.dot(dx, dx),
+        'm2_y': np.dot(dy, dy),
+        'c_xy': np.dot(dx, dy)
+    }
+
+
+def merge_co_moments(first, second):
+    """
+    Combine co-moments of disjoint rows (Chan et al. parallel update).
+
+    Args:
+        first (dict): Co-moments from co_moments()
+        second (dict): Co-moments of further rows
+
+    Returns:
+        dict: Co-moments of both sets of rows
+    """
+    n = first['n'] + second['n']
+    if not first['n'] or not second['n']:
+        return dict(first if first['n'] else second)
+
+    delta_x = second['mean_x'] - first['mean_x']
+    delta_y = second['mean_y'] - first['mean_y']
+    weight = first['n'] * second['n'] / n
+    return {
+        'n': n,
+        'mean_x': first['mean_x'] + delta_x * second['n'] / n,
+        'mean_y': first['mean_y'] + delta_y * second['n'] / n,
+        'm2_x': first['m2_x'] + second['m2_x'] + delta_x * delta_x * weight,
+        'm2_y': first['m2_y'] + second['m2_y'] + delta_y * delta_y * weight,
+        'c_xy': first['c_xy'] + second['c_xy'] + delta_x * delta_y * weight
+    }
+
+
+def correlation(moments):
+    """
+    Pearson correlation from co-moments.
+
+    Args:
+        moments (dict): Co-moments from co_moments()
+
+    Returns:
+        float: Correlation coefficient, NaN if undefined
+    """
+    if moments['n'] < 2:
+        return np.nan
+    denominator = np.sqrt(moments['m2_x'] * moments['m2_y'])
+    return moments['c_xy'] / denominator if denominator else np.nan
+
+
+class SurveyAggregates:
+    """All statistics needed by the analysis report for one dataset."""
+
+    def __init__(self, data, quantile_error=None):
+        """
+        Compute every report statistic from the survey data.
+
+        Each column is converted to a NumPy array once and every mask
+        (high savers, literacy bands, tech enthusiasts) is built once.
+
+        Args:
+            data (pd.DataFrame): Survey data
+            quantile_error (float): If set, medians and percentiles are
+                estimated with mergeable quantile sketches of this rank
+                error instead of computed exactly
+        """
+        self.quantile_error = quantile_error
+        self.row_count = len(data)
+        self.columns = set(data.columns)
+        self.spending_columns = [
+            col for col in data.columns
+            if SURVEY_SCHEMA.is_spending_column(col) and
+            col not in DERIVED_COLUMNS
+        ]
+
+        self.stats = {}
+        self.spending_totals = {}
+        self.counts = {}
+        self.investment_counts = {}
+        self.correlations = {}
+        # Co-moments behind each literacy correlation, kept so that
+        # correlations can be updated from appended rows
+        self.moments = {}
+        # Derived arrays as row-ordered chunks, one per merged batch
+        self._derived_chunks = {}
+        # Quantile sketches per median column (approximate mode only)
+        self.sketches = {}
+        # Sorted values around each exact median, so that appended rows
+        # can be folded in without rescanning (exact mode only)
+        self.windows = {}
+        # Columns whose median is out of date after a merge
+        self.stale_medians = set()
+
+        arrays = {
+            col: column_array(data, col)
+            for col in ['age', 'annual_income', 'monthly_savings',
+                        'financial_literacy_score', 'emergency_fund_months']
+            if col in self.columns
+        }
+        for col in ['age', 'annual_income', 'monthly_savings',
+                    'financial_literacy_score']:
+            if col in arrays:
+                detailed = col in DISTRIBUTION_COLUMNS
+                self.stats[col] = self._summarize(
+                    col, arrays[col], median=detailed, extremes=detailed
+                )
+
+        monthly_income = (
+            arrays['annual_income'] / 12
+            if 'annual_income' in arrays else None
+        )
+
+        self._aggregate_spending(data, monthly_income)
+        self._aggregate_savings(arrays, monthly_income)
+        self._aggregate_adoption(data)
+        self._aggregate_literacy(arrays)
+
+    def _summarize(self, column, values, median=False, extremes=False):
+        """
+        Summarize a column, taking its median from a sketch if enabled,
+        or else from a MedianWindow kept for merges.
+
+        Args:
+            column (str): Column name the values belong to
+            values (np.ndarray): Float64 values, NaN for missing
+            median (bool): Also compute the median
+            extremes (bool): Also compute the minimum and maximum
+
+        Returns:
+            dict: Summary as returned by summarize()
+        """
+        if not median:
+            return summarize(values, extremes=extremes)
+        if not self.quantile_error:
+            window = MedianWindow(values)
+            self.windows[column] = window
+            summary = summarize(values, extremes=extremes)
+            summary['median'] = window.median()
+            return summary
+
+        sketch = QuantileSketch(self.quantile_error)
+        sketch.update(values)
+        self.sketches[column] = sketch
+
+        summary = summarize(values, extremes=extremes)
+        summary['median'] = sketch.median()
+        return summary
+
+    def _aggregate_spending(self, data, monthly_income):
+        """Aggregate per-category and total monthly spending."""
+        if not self.spending_columns:
+            return
+
+        total_spending = np.zeros(self.row_count)
+        for col in self.spending_columns:
+            values = column_array(data, col)
+            self.stats[col] = summarize(values)
+            self.spending_totals[col] = self.stats[col]['sum']
+            # Row totals skip missing categories, like sum(axis=1)
+            if self.stats[col]['count'] < self.row_count:
+                values = np.where(np.isnan(values), 0.0, values)
+            total_spending += values
+
+        self._derived_chunks['total_spending'] = [total_spending]
+        self.stats['total_spending'] = self._summarize(
+            'total_spending', total_spending, median=True, extremes=True
+        )
+
+        if monthly_income is not None:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                spending_ratio = total_spending / monthly_income
+            self.stats['spending_ratio'] = summarize(spending_ratio)
+
+    def _aggregate_savings(self, arrays, monthly_income):
+        """Aggregate savings rates and saver bands."""
+        if 'monthly_savings' not in arrays or monthly_income is None:
+            return
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            savings_rate = arrays['monthly_savings'] / monthly_income
+
+        self._derived_chunks['savings_rate'] = [savings_rate]
+        self.stats['savings_rate'] = self._summarize(
+            'savings_rate', savings_rate, median=True
+        )
+        self.counts['high_savers'] = int(np.count_nonzero(savings_rate > 0.2))
+        self.counts['low_savers'] = int(np.count_nonzero(savings_rate < 0.1))
+
+    def _aggregate_adoption(self, data):
+        """Aggregate investment preferences and technology adoption."""
+        if 'primary_investment' in self.columns:
+            # Unused categories would otherwise be counted as zero
+            self.investment_counts = {
+                inv_type: count
+                for inv_type, count in data[
+                    'primary_investment'
+                ].value_counts().items()
+                if count
+            }
+            # Missing answers are not 'none', so they count as investors
+            self.counts['active_investors'] = (
+                self.row_count - self.investment_counts.get('none', 0)
+            )
+
+        flags = {
+            col: flag_array(data, col)
+            for col in ['uses_mobile_banking', 'owns_crypto']
+            if col in self.columns
+        }
+        for col, values in flags.items():
+            self.counts[col] = int(np.count_nonzero(values))
+
+        if len(flags) == 2:
+            self.counts['tech_enthusiasts'] = int(np.count_nonzero(
+                flags['uses_mobile_banking'] & flags['owns_crypto']
+            ))
+
+    def _aggregate_literacy(self, arrays):
+        """Aggregate literacy score bands and correlations."""
+        if 'financial_literacy_score' not in arrays:
+            return
+
+        scores = arrays['financial_literacy_score']
+        self.counts['literacy_high'] = int(np.count_nonzero(scores >= 8))
+        self.counts['literacy_medium'] = int(np.count_nonzero(
+            (scores >= 6) & (scores < 8)
+        ))
+        self.counts['literacy_low'] = int(np.count_nonzero(scores < 6))
+
+        for col in ['annual_income', 'monthly_savings',
+                    'emergency_fund_months']:
+            if col in arrays:
+                self.moments[col] = co_moments(scores, arrays[col])
+                self.correlations[col] = correlation(self.moments[col])
+
+    @property
+    def derived(self):
+        """dict: Derived column arrays aligned with the survey rows."""
+        for name, chunks in self._derived_chunks.items():
+            if len(chunks) > 1:
+                chunks[:] = [np.concatenate(chunks)]
+        return {
+            name: chunks[0]
+            for name, chunks in self._derived_chunks.items() if chunks
+        }
+
+    @property
+    def derived_names(self):
+        """list: Names of the derived columns these aggregates produce."""
+        return list(self._derived_chunks)
+
+    def detach_derived(self):
+        """Drop the derived arrays, e.g. before sending to another process."""
+        for chunks in self._derived_chunks.values():
+            chunks.clear()
+
+    def attach_derived(self, derived):
+        """
+        Replace the derived arrays with ones covering every row.
+
+        Args:
+            derived (dict): Derived column name to full-length array
+        """
+        for name, values in derived.items():
+            self._derived_chunks[name] = [values]
+
+    def merge(self, other):
+        """
+        Fold in the aggregates of rows appended after this dataset.
+
+        Everything is updated from the two sets of aggregates alone, so
+        the cost depends on the appended rows only. In approximate mode
+        the quantile sketches are merged; in exact mode the median
+        windows are, and a median is marked stale (to be recomputed by
+        refresh_medians()) only if it moved out of its window or the
+        other rows were too many to be windowed whole, as with large
+        partitions.
+
+        Args:
+            other (SurveyAggregates): Aggregates of the appended rows
+
+        Raises:
+            ValueError: If the appended rows have different columns
+        """
+        if other.columns != self.columns:
+            raise ValueError("Appended rows must have the same columns")
+
+        self.row_count += other.row_count
+
+        for col, summary in self.stats.items():
+            merged = merge_summaries(summary, other.stats[col])
+            median = None
+            if col in self.sketches:
+                self.sketches[col].merge(other.sketches[col])
+                median = self.sketches[col].median()
+            elif (col in self.windows and col in other.windows
+                    and col not in self.stale_medians
+                    and self.windows[col].merge(other.windows[col])):
+                median = self.windows[col].median()
+            if median is not None:
+                merged['median'] = median
+            elif 'median' in summary or col in self.stale_medians:
+                self.stale_medians.add(col)
+            self.stats[col] = merged
+
+        for col in self.spending_totals:
+            self.spending_totals[col] = self.stats[col]['sum']
+
+        for name in self.counts:
+            self.counts[name] += other.counts[name]
+
+        for inv_type, count in other.investment_counts.items():
+            self.investment_counts[inv_type] = (
+                self.investment_counts.get(inv_type, 0) + count
+            )
+        # Keep the most common investment types first, like value_counts
+        self.investment_counts = dict(sorted(
+            self.investment_counts.items(), key=lambda item: -item[1]
+        ))
+
+        for col in self.moments:
+            self.moments[col] = merge_co_moments(
+                self.moments[col], other.moments[col]
+            )
+            self.correlations[col] = correlation(self.moments[col])
+
+        for name, chunks in self._derived_chunks.items():
+            chunks.extend(other._derived_chunks[name])
+
+    def refresh_medians(self, data):
+        """
+        Recompute medians marked stale by merge().
+
+        Args:
+            data (pd.DataFrame): All survey rows, including appended ones
+        """
+        derived = self.derived if self.stale_medians else {}
+        for col in self.stale_medians:
+            values = (
+                derived[col] if col in DERIVED_COLUMNS
+                else column_array(data, col)
+            )
+            self.windows[col] = MedianWindow(values)
+            self.stats[col]['median'] = self.windows[col].median()
+        self.stale_medians = set()
+
+    def percentiles(self, column, probabilities, data):
+        """
+        Get percentiles of a median column.
+
+        Args:
+            column (str): One of MEDIAN_COLUMNS
+            probabilities (list): Quantiles to compute, each in [0, 1]
+            data (pd.DataFrame): Survey rows, used in exact mode
+
+        Returns:
+            np.ndarray: Values at each quantile (sketch estimates in
+                approximate mode)
+        """
+        if column in self.sketches:
+            return self.sketches[column].quantiles(probabilities)
+
+        values = present_values(
+            self.derived[column] if column in DERIVED_COLUMNS
+            else column_array(data, column)
+        )
+        if not values.size:
+            return np.full(len(probabilities), np.nan)
+        return np.quantile(values, probabilities)
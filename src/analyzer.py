@@ -6,23 +6,208 @@ finance survey data including spending patterns, savings behavior,
 and investment preferences.
 """
 
+import functools
 import pandas as pd
-import numpy as np
-from src.utils import format_currency, format_percentage, safe_divide
+from src.aggregates import SurveyAggregates
+from src.cache import LRUCache, chain_fingerprint, dataset_fingerprint
+from src.parallel import aggregate_in_parallel
+from src.schema import SURVEY_SCHEMA
+from src.utils import format_currency, format_percentage, shared_copy
+
+
+# Analysis results shared by every analyzer, keyed by dataset fingerprint
+ANALYSIS_CACHE = LRUCache(maxsize=64)
+
+
+def memoized(method):
+    """
+    Memoize an analysis method on the dataset fingerprint and arguments.
+
+    Args:
+        method (callable): FinanceAnalyzer method returning a result dict
+
+    Returns:
+        callable: Wrapped method that serves repeat calls from the cache
+    """
+    missing = object()
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (
+            self.get_fingerprint(), self.quantile_error, method.__name__,
+            args, tuple(sorted(kwargs.items()))
+        )
+        result = self.cache.get(key, missing)
+        if result is missing:
+            result = method(self, *args, **kwargs)
+            self.cache.put(key, result)
+        return result
+
+    return wrapper
 
 
 class FinanceAnalyzer:
     """Core analysis class for personal finance survey data."""
 
-    def __init__(self, data):
+    def __init__(self, data, cache=None, quantile_error=None,
+                 aggregates=None, workers=None, fingerprint=None):
         """
         Initialize the analyzer with survey data.
 
+        With pandas copy-on-write enabled (see
+        utils.enable_copy_on_write) the analyzer shares the caller's
+        column buffers instead of copying them, and neither side can
+        modify the other's data; otherwise it takes a deep copy.
+
+        Analysis results are memoized in cache, which defaults to the
+        shared ANALYSIS_CACHE so a new analyzer over the same data reuses
+        earlier results. Returned dicts are shared and must not be
+        modified by callers.
+
         Args:
             data (pd.DataFrame): Survey data to analyze
+            cache (LRUCache): Optional cache for analysis results
+            quantile_error (float): If set, medians and percentile bands
+                are estimated from quantile sketches with this rank error
+                (approximate mode) instead of computed exactly
+            aggregates (SurveyAggregates): Optional statistics already
+                gathered for data, e.g. by DataHandler's chunked loader
+            workers (int): If greater than 1, statistics are computed on
+                row partitions in this many processes and merged
+            fingerprint (str): dataset_fingerprint of data if already
+                known (see DataHandler.get_fingerprint), saving a pass
+                over it
+        """
+        self.data = (
+            shared_copy(data) if data is not None else pd.DataFrame()
+        )
+        self.cache = cache if cache is not None else ANALYSIS_CACHE
+        self.quantile_error = quantile_error
+        self.workers = workers
+        self._aggregates = None
+
+        if aggregates is not None and aggregates.row_count == len(self.data):
+            self._aggregates = aggregates
+            self.quantile_error = aggregates.quantile_error
+        self._fingerprint = fingerprint
+
+    @property
+    def data(self):
+        """
+        pd.DataFrame: Analyzed survey rows.
+
+        Rows added by append() are kept as separate frames and joined
+        here, once, when all rows are next needed (exact percentiles,
+        recomputed statistics), not on every append.
+        """
+        if self._appended:
+            self._data = SURVEY_SCHEMA.concat(
+                [self._data] + self._appended
+            )
+            self._appended = []
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+        self._appended = []
+
+    @property
+    def empty(self):
+        """bool: True if there are no survey rows to analyze."""
+        return self._data.empty and not self._appended
+
+    @property
+    def derived_columns(self):
+        """
+        dict: Columns derived during analysis (total_spending,
+        savings_rate), kept as arrays aligned with self.data rather than
+        added to it; empty until the aggregates have been computed.
+        """
+        if self._aggregates is None:
+            return {}
+        return self._aggregates.derived
+
+    def get_fingerprint(self):
+        """
+        Get the fingerprint identifying the analyzed dataset.
+
+        Returns:
+            str: Dataset fingerprint used in analysis cache keys
+        """
+        if self._fingerprint is None:
+            self._fingerprint = dataset_fingerprint(self.data)
+        return self._fingerprint
+
+    def get_cache_stats(self):
+        """
+        Get hit/miss figures for the analysis result cache.
+
+        Returns:
+            dict: hits, misses, current size and maximum size
+        """
+        return self.cache.stats()
+
+    def get_aggregates(self):
+        """
+        Get the shared statistics behind every analysis.
+
+        The statistics are computed in a single pass on first use and
+        reused by all get_*_analysis methods.
+
+        Returns:
+            SurveyAggregates: Aggregated survey statistics
+        """
+        if self._aggregates is None:
+            if self.workers and self.workers > 1:
+                self._aggregates = aggregate_in_parallel(
+                    self.data, workers=self.workers,
+                    quantile_error=self.quantile_error
+                )
+            else:
+                self._aggregates = SurveyAggregates(
+                    self.data, quantile_error=self.quantile_error
+                )
+
+        # Merged partitions or appended rows leave exact medians stale
+        if self._aggregates.stale_medians:
+            self._aggregates.refresh_medians(self.data)
+        return self._aggregates
+
+    def append(self, rows, data=None):
+        """
+        Add newly collected survey responses to the analysis.
+
+        The running aggregates (medians included, see MedianWindow) and
+        the fingerprint are updated from the new rows alone, and the
+        rows are kept aside rather than concatenated, so the next report
+        costs time proportional to the new rows rather than the whole
+        dataset.
+
+        Args:
+            rows (pd.DataFrame): New rows, already cleaned (see
+                DataHandler.append)
+            data (pd.DataFrame): Optional combined frame the caller has
+                already built; shared instead of joining the rows
         """
-        self.data = data.copy() if data is not None else pd.DataFrame()
+        if rows is None or rows.empty:
+            return
+
+        if self._aggregates is not None and not self.empty:
+            self._aggregates.merge(
+                SurveyAggregates(rows, quantile_error=self.quantile_error)
+            )
+        else:
+            self._aggregates = None
+
+        if self._fingerprint is not None:
+            self._fingerprint = chain_fingerprint(self._fingerprint, rows)
+        if data is not None:
+            self.data = shared_copy(data)
+        else:
+            self._appended.append(shared_copy(rows))
 
+    @memoized
     def get_spending_analysis(self):
         """
         Analyze spending patterns across different categories.
@@ -30,13 +215,11 @@ class FinanceAnalyzer:
         Returns:
             dict: Comprehensive spending analysis
         """
-        if self.data.empty:
+        if self.empty:
             return {"error": "No data available"}
 
-        # Find spending columns (any column with 'spending' in the name)
-        spending_cols = [
-            col for col in self.data.columns if 'spending' in col.lower()
-        ]
+        aggregates = self.get_aggregates()
+        spending_cols = aggregates.spending_columns
 
         if not spending_cols:
             return {"error": "No spending data found"}
@@ -48,20 +231,14 @@ class FinanceAnalyzer:
             "Insights": []
         }
 
-        # Calculate total spending per person
-        self.data['total_spending'] = self.data[spending_cols].sum(axis=1)
-
         # Overall spending statistics
+        total_stats = aggregates.stats['total_spending']
         analysis["Spending Overview"] = {
-            "Average Total Spending": format_currency(
-                self.data['total_spending'].mean()
-            ),
-            "Median Total Spending": format_currency(
-                self.data['total_spending'].median()
-            ),
+            "Average Total Spending": format_currency(total_stats['mean']),
+            "Median Total Spending": format_currency(total_stats['median']),
             "Spending Range": (
-                f"{format_currency(self.data['total_spending'].min())} - "
-                f"{format_currency(self.data['total_spending'].max())}"
+                f"{format_currency(total_stats['min'])} - "
+                f"{format_currency(total_stats['max'])}"
             )
         }
 
@@ -71,9 +248,9 @@ class FinanceAnalyzer:
                 'monthly_spending_', ''
             ).replace('_', ' ').title()
             analysis["Category Breakdown"][category_name] = {
-                "Average": format_currency(self.data[col].mean()),
+                "Average": format_currency(aggregates.stats[col]['mean']),
                 "Percentage of Total": format_percentage(
-                    self.data[col].sum() / self.data['total_spending'].sum()
+                    aggregates.spending_totals[col] / total_stats['sum']
                 )
             }
 
@@ -82,7 +259,7 @@ class FinanceAnalyzer:
             # Find highest spending category
             category_totals = {
                 col.replace('monthly_spending_', '').title():
-                self.data[col].sum()
+                aggregates.spending_totals[col]
                 for col in spending_cols
             }
             highest_category = max(
@@ -93,11 +270,8 @@ class FinanceAnalyzer:
             )
 
             # Spending vs income ratio
-            if 'annual_income' in self.data.columns:
-                monthly_income = self.data['annual_income'] / 12
-                spending_ratio = (
-                    self.data['total_spending'] / monthly_income
-                ).mean()
+            if 'spending_ratio' in aggregates.stats:
+                spending_ratio = aggregates.stats['spending_ratio']['mean']
                 analysis["Insights"].append(
                     f"Average spending-to-income ratio: "
                     f"{format_percentage(spending_ratio)}"
@@ -105,6 +279,7 @@ class FinanceAnalyzer:
 
         return analysis
 
+    @memoized
     def get_savings_analysis(self):
         """
         Analyze savings behavior and patterns.
@@ -112,10 +287,12 @@ class FinanceAnalyzer:
         Returns:
             dict: Comprehensive savings analysis
         """
-        if (self.data.empty or
-                'monthly_savings' not in self.data.columns):
+        if (self.empty or
+                'monthly_savings' not in self._data.columns):
             return {"error": "No savings data available"}
 
+        aggregates = self.get_aggregates()
+
         analysis = {
             "Savings Overview": {},
             "Savings Rate Analysis": {},
@@ -123,48 +300,40 @@ class FinanceAnalyzer:
         }
 
         # Basic savings statistics
+        savings_stats = aggregates.stats['monthly_savings']
         analysis["Savings Overview"] = {
             "Average Monthly Savings": format_currency(
-                self.data['monthly_savings'].mean()
+                savings_stats['mean']
             ),
             "Median Monthly Savings": format_currency(
-                self.data['monthly_savings'].median()
+                savings_stats['median']
             ),
             "Savings Range": (
-                f"{format_currency(self.data['monthly_savings'].min())} - "
-                f"{format_currency(self.data['monthly_savings'].max())}"
+                f"{format_currency(savings_stats['min'])} - "
+                f"{format_currency(savings_stats['max'])}"
             )
         }
 
         # Savings rate analysis (if income data available)
-        if 'annual_income' in self.data.columns:
-            monthly_income = self.data['annual_income'] / 12
-            self.data['savings_rate'] = (
-                self.data['monthly_savings'] / monthly_income
-            )
+        if 'savings_rate' in aggregates.stats:
+            rate_stats = aggregates.stats['savings_rate']
+            high_savers = aggregates.counts['high_savers']
 
             analysis["Savings Rate Analysis"] = {
                 "Average Savings Rate": format_percentage(
-                    self.data['savings_rate'].mean()
+                    rate_stats['mean']
                 ),
                 "Median Savings Rate": format_percentage(
-                    self.data['savings_rate'].median()
-                ),
-                "High Savers (>20%)": (
-                    f"{len(self.data[self.data['savings_rate'] > 0.2])} "
-                    f"respondents"
+                    rate_stats['median']
                 ),
+                "High Savers (>20%)": f"{high_savers} respondents",
                 "Low Savers (<10%)": (
-                    f"{len(self.data[self.data['savings_rate'] < 0.1])} "
-                    f"respondents"
+                    f"{aggregates.counts['low_savers']} respondents"
                 )
             }
 
             # Generate insight
-            high_savers_pct = (
-                len(self.data[self.data['savings_rate'] > 0.2]) /
-                len(self.data)
-            )
+            high_savers_pct = high_savers / aggregates.row_count
             analysis["Insights"].append(
                 f"{format_percentage(high_savers_pct)} of respondents "
                 f"save more than 20% of their income"
@@ -172,6 +341,7 @@ class FinanceAnalyzer:
 
         return analysis
 
+    @memoized
     def get_investment_analysis(self):
         """
         Analyze investment preferences and cryptocurrency adoption.
@@ -179,9 +349,12 @@ class FinanceAnalyzer:
         Returns:
             dict: Investment and crypto analysis
         """
-        if self.data.empty:
+        if self.empty:
             return {"error": "No data available"}
 
+        aggregates = self.get_aggregates()
+        total = aggregates.row_count
+
         analysis = {
             "Investment Preferences": {},
             "Cryptocurrency Analysis": {},
@@ -189,41 +362,38 @@ class FinanceAnalyzer:
         }
 
         # Investment preferences
-        if 'primary_investment' in self.data.columns:
-            investment_counts = self.data['primary_investment'].value_counts()
-            total_investors = len(
-                self.data[self.data['primary_investment'] != 'none']
-            )
+        if 'primary_investment' in aggregates.columns:
+            total_investors = aggregates.counts['active_investors']
 
             analysis["Investment Preferences"]["Distribution"] = {
                 inv_type.title(): (
                     f"{count} respondents "
-                    f"({format_percentage(count / len(self.data))})"
+                    f"({format_percentage(count / total)})"
                 )
-                for inv_type, count in investment_counts.items()
+                for inv_type, count in aggregates.investment_counts.items()
             }
 
             analysis["Investment Preferences"]["Summary"] = {
                 "Total Active Investors": (
-                    f"{total_investors} out of {len(self.data)} respondents"
+                    f"{total_investors} out of {total} respondents"
                 ),
                 "Investment Rate": format_percentage(
-                    total_investors / len(self.data)
+                    total_investors / total
                 )
             }
 
         # Cryptocurrency analysis - THIS IS KEY FOR FINTECH!
-        if 'owns_crypto' in self.data.columns:
-            crypto_owners = self.data['owns_crypto'].sum()
-            crypto_rate = crypto_owners / len(self.data)
+        if 'owns_crypto' in aggregates.columns:
+            crypto_owners = aggregates.counts['owns_crypto']
+            crypto_rate = crypto_owners / total
 
             analysis["Cryptocurrency Analysis"] = {
                 "Total Crypto Owners": (
-                    f"{crypto_owners} out of {len(self.data)} respondents"
+                    f"{crypto_owners} out of {total} respondents"
                 ),
                 "Crypto Adoption Rate": format_percentage(crypto_rate),
                 "Non-Crypto Users": (
-                    f"{len(self.data) - crypto_owners} respondents"
+                    f"{total - crypto_owners} respondents"
                 )
             }
 
@@ -243,6 +413,7 @@ class FinanceAnalyzer:
 
         return analysis
 
+    @memoized
     def get_fintech_adoption_analysis(self):
         """
         Analyze fintech service adoption patterns.
@@ -250,9 +421,12 @@ class FinanceAnalyzer:
         Returns:
             dict: Fintech adoption analysis
         """
-        if self.data.empty:
+        if self.empty:
             return {"error": "No data available"}
 
+        aggregates = self.get_aggregates()
+        total = aggregates.row_count
+
         analysis = {
             "Mobile Banking": {},
             "Digital Adoption Patterns": {},
@@ -260,17 +434,17 @@ class FinanceAnalyzer:
         }
 
         # Mobile banking analysis
-        if 'uses_mobile_banking' in self.data.columns:
-            mobile_users = self.data['uses_mobile_banking'].sum()
-            adoption_rate = mobile_users / len(self.data)
+        if 'uses_mobile_banking' in aggregates.columns:
+            mobile_users = aggregates.counts['uses_mobile_banking']
+            adoption_rate = mobile_users / total
 
             analysis["Mobile Banking"] = {
                 "Total Users": (
-                    f"{mobile_users} out of {len(self.data)} respondents"
+                    f"{mobile_users} out of {total} respondents"
                 ),
                 "Adoption Rate": format_percentage(adoption_rate),
                 "Non-Users": (
-                    f"{len(self.data) - mobile_users} respondents"
+                    f"{total - mobile_users} respondents"
                 )
             }
 
@@ -289,18 +463,10 @@ class FinanceAnalyzer:
                 )
 
         # Combined digital adoption (mobile banking + crypto)
-        if ('uses_mobile_banking' in self.data.columns and
-                'owns_crypto' in self.data.columns):
-            tech_enthusiasts = self.data[
-                (self.data['uses_mobile_banking']) &
-                (self.data['owns_crypto'])
-            ]
-
+        if 'tech_enthusiasts' in aggregates.counts:
             # Calculate percentage
-            enthusiast_count = len(tech_enthusiasts)
-            enthusiast_pct = format_percentage(
-                enthusiast_count / len(self.data)
-            )
+            enthusiast_count = aggregates.counts['tech_enthusiasts']
+            enthusiast_pct = format_percentage(enthusiast_count / total)
 
             analysis["Digital Adoption Patterns"] = {
                 "Tech Enthusiasts (Both)": (
@@ -310,6 +476,7 @@ class FinanceAnalyzer:
 
         return analysis
 
+    @memoized
     def get_financial_literacy_analysis(self):
         """
         Analyze financial literacy scores and correlations.
@@ -317,10 +484,13 @@ class FinanceAnalyzer:
         Returns:
             dict: Financial literacy analysis
         """
-        if (self.data.empty or
-                'financial_literacy_score' not in self.data.columns):
+        if (self.empty or
+                'financial_literacy_score' not in self._data.columns):
             return {"error": "No financial literacy data available"}
 
+        aggregates = self.get_aggregates()
+        total = aggregates.row_count
+
         analysis = {
             "Literacy Overview": {},
             "Score Distribution": {},
@@ -329,72 +499,44 @@ class FinanceAnalyzer:
         }
 
         # Basic literacy statistics
+        score_stats = aggregates.stats['financial_literacy_score']
         analysis["Literacy Overview"] = {
-            "Average Score": (
-                f"{self.data['financial_literacy_score'].mean():.1f}/10"
-            ),
-            "Median Score": (
-                f"{self.data['financial_literacy_score'].median():.1f}/10"
-            ),
+            "Average Score": f"{score_stats['mean']:.1f}/10",
+            "Median Score": f"{score_stats['median']:.1f}/10",
             "Score Range": (
-                f"{self.data['financial_literacy_score'].min():.0f} - "
-                f"{self.data['financial_literacy_score'].max():.0f}"
+                f"{score_stats['min']:.0f} - {score_stats['max']:.0f}"
             )
         }
 
         # Score distribution - categorize people
-        high_literacy = len(
-            self.data[self.data['financial_literacy_score'] >= 8]
-        )
-        medium_literacy = len(self.data[
-            (self.data['financial_literacy_score'] >= 6) &
-            (self.data['financial_literacy_score'] < 8)
-        ])
-        low_literacy = len(
-            self.data[self.data['financial_literacy_score'] < 6]
-        )
+        high_literacy = aggregates.counts['literacy_high']
+        medium_literacy = aggregates.counts['literacy_medium']
+        low_literacy = aggregates.counts['literacy_low']
 
         analysis["Score Distribution"] = {
             "High Literacy (8-10)": (
                 f"{high_literacy} respondents "
-                f"({format_percentage(high_literacy / len(self.data))})"
+                f"({format_percentage(high_literacy / total)})"
             ),
             "Medium Literacy (6-7)": (
                 f"{medium_literacy} respondents "
-                f"({format_percentage(medium_literacy / len(self.data))})"
+                f"({format_percentage(medium_literacy / total)})"
             ),
             "Low Literacy (<6)": (
                 f"{low_literacy} respondents "
-                f"({format_percentage(low_literacy / len(self.data))})"
+                f"({format_percentage(low_literacy / total)})"
             )
         }
 
         # Correlations with other factors
         correlations = {}
-
-        if 'annual_income' in self.data.columns:
-            correlation = self.data['financial_literacy_score'].corr(
-                self.data['annual_income']
-            )
-            correlations["Income"] = (
-                f"{correlation:.3f} "
-                f"{'(positive)' if correlation > 0 else '(negative)'}"
-            )
-
-        if 'monthly_savings' in self.data.columns:
-            correlation = self.data['financial_literacy_score'].corr(
-                self.data['monthly_savings']
-            )
-            correlations["Savings"] = (
-                f"{correlation:.3f} "
-                f"{'(positive)' if correlation > 0 else '(negative)'}"
-            )
-
-        if 'emergency_fund_months' in self.data.columns:
-            correlation = self.data['financial_literacy_score'].corr(
-                self.data['emergency_fund_months']
-            )
-            correlations["Emergency Fund"] = (
+        labels = {
+            'annual_income': "Income",
+            'monthly_savings': "Savings",
+            'emergency_fund_months': "Emergency Fund"
+        }
+        for col, correlation in aggregates.correlations.items():
+            correlations[labels[col]] = (
                 f"{correlation:.3f} "
                 f"{'(positive)' if correlation > 0 else '(negative)'}"
             )
@@ -402,7 +544,7 @@ class FinanceAnalyzer:
         analysis["Correlations"] = correlations
 
         # Generate insights
-        avg_score = self.data['financial_literacy_score'].mean()
+        avg_score = score_stats['mean']
         if avg_score >= 8:
             analysis["Insights"].append(
                 "High overall financial literacy among respondents"
@@ -418,6 +560,44 @@ class FinanceAnalyzer:
 
         return analysis
 
+    @memoized
+    def get_percentile_bands(self, percentiles=(25, 50, 75, 90)):
+        """
+        Get percentile bands for spending, savings and literacy.
+
+        Args:
+            percentiles (tuple): Percentiles to report, each 0-100
+
+        Returns:
+            dict: Formatted values per measure and percentile
+        """
+        if self.empty:
+            return {"error": "No data available"}
+
+        aggregates = self.get_aggregates()
+        probabilities = [p / 100 for p in percentiles]
+        measures = [
+            ('total_spending', "Total Spending", format_currency),
+            ('monthly_savings', "Monthly Savings", format_currency),
+            ('savings_rate', "Savings Rate", format_percentage),
+            ('financial_literacy_score', "Literacy Score",
+             lambda score: f"{score:.1f}/10")
+        ]
+
+        bands = {}
+        for col, label, formatter in measures:
+            if col in aggregates.stats:
+                values = aggregates.percentiles(
+                    col, probabilities, self.data
+                )
+                bands[label] = {
+                    f"P{p}": formatter(value)
+                    for p, value in zip(percentiles, values)
+                }
+
+        return bands
+
+    @memoized
     def get_comprehensive_report(self):
         """
         Generate a comprehensive analysis report combining all analyses.
@@ -439,20 +619,22 @@ class FinanceAnalyzer:
         literacy_analysis = self.get_financial_literacy_analysis()
 
         # Executive summary - the big picture
-        if not self.data.empty:
+        if not self.empty:
+            aggregates = self.get_aggregates()
+            stats = aggregates.stats
             report["Executive Summary"] = {
-                "Total Respondents": len(self.data),
+                "Total Respondents": aggregates.row_count,
                 "Average Age": (
-                    f"{self.data['age'].mean():.1f} years"
-                    if 'age' in self.data.columns else "N/A"
+                    f"{stats['age']['mean']:.1f} years"
+                    if 'age' in stats else "N/A"
                 ),
                 "Average Income": (
-                    format_currency(self.data['annual_income'].mean())
-                    if 'annual_income' in self.data.columns else "N/A"
+                    format_currency(stats['annual_income']['mean'])
+                    if 'annual_income' in stats else "N/A"
                 ),
                 "Average Monthly Savings": (
-                    format_currency(self.data['monthly_savings'].mean())
-                    if 'monthly_savings' in self.data.columns else "N/A"
+                    format_currency(stats['monthly_savings']['mean'])
+                    if 'monthly_savings' in stats else "N/A"
                 )
             }
 
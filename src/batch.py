@@ -0,0 +1,290 @@
+"""
+Batch Analysis Module for Personal Finance Survey Analyzer.
+
+This module runs the analysis without prompts: it loads each survey
+file, writes the comprehensive report, the chart exports and the cleaned
+data, and records how long every step took. Files are processed
+concurrently, one process per file, so a directory of surveys can be
+analyzed on a schedule.
+"""
+
+import contextlib
+import glob
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from src.analyzer import FinanceAnalyzer
+from src.cache import SurveyDataCache
+from src.data_handler import DataHandler
+from src.utils import enable_copy_on_write
+
+
+def expand_inputs(inputs):
+    """
+    Expand input paths into survey files.
+
+    Args:
+        inputs (list): Files, directories (whose .csv files are used) or
+            glob patterns
+
+    Returns:
+        list: Survey file paths, in order and without duplicates
+
+    Raises:
+        FileNotFoundError: If an input matches no file
+    """
+    files = []
+    for pattern in inputs:
+        if os.path.isdir(pattern):
+            matches = sorted(glob.glob(os.path.join(pattern, '*.csv')))
+        elif os.path.isfile(pattern):
+            matches = [pattern]
+        else:
+            matches = sorted(glob.glob(pattern))
+        if not matches:
+            raise FileNotFoundError(f"No survey files match {pattern}")
+        files.extend(matches)
+    return list(dict.fromkeys(files))
+
+
+def output_names(files):
+    """
+    Name the outputs of survey files so that no two names clash.
+
+    A file is named after its base name, without the extension. Files
+    sharing it (e.g. w1/survey.csv and w2/survey.csv) are named after as
+    many trailing path components as tell them apart (w1_survey and
+    w2_survey), and a number is added if even their full paths clash.
+
+    Args:
+        files (list): Survey file paths, without duplicates
+
+    Returns:
+        dict: Output name of each file path
+    """
+    parts = {
+        file_path: os.path.splitext(
+            os.path.abspath(file_path)
+        )[0].strip(os.sep).split(os.sep)
+        for file_path in files
+    }
+    depth = dict.fromkeys(files, 1)
+    while True:
+        names = {
+            file_path: '_'.join(parts[file_path][-depth[file_path]:])
+            for file_path in files
+        }
+        holders = {}
+        for file_path, name in names.items():
+            holders.setdefault(name, []).append(file_path)
+        # Paths differing only in the extension are left to the numbers
+        clashing = [
+            file_path for group in holders.values()
+            if len({tuple(parts[file_path]) for file_path in group}) > 1
+            for file_path in group
+            if depth[file_path] < len(parts[file_path])
+        ]
+        if not clashing:
+            break
+        for file_path in clashing:
+            depth[file_path] += 1
+
+    taken = set()
+    for file_path in files:
+        name, number = names[file_path], 1
+        while name in taken:
+            number += 1
+            name = f"{names[file_path]}_{number}"
+        taken.add(name)
+        names[file_path] = name
+    return names
+
+
+def format_report_text(report, indent=0):
+    """
+    Render a comprehensive report as indented plain text.
+
+    Args:
+        report (dict): Report from FinanceAnalyzer.get_comprehensive_report
+        indent (int): Indentation level of this section
+
+    Returns:
+        str: Report text
+    """
+    pad = '  ' * indent
+    lines = []
+    for key, value in report.items():
+        if isinstance(value, dict):
+            lines.append(f"{pad}{key}:")
+            lines.append(format_report_text(value, indent + 1))
+        elif isinstance(value, list):
+            lines.append(f"{pad}{key}:")
+            lines.extend(f"{pad}  - {item}" for item in value)
+        else:
+            lines.append(f"{pad}{key}: {value}")
+    return '\n'.join(line for line in lines if line)
+
+
+def analyze_file(file_path, report_dir=None, report_format='json',
+                 chart_dir=None, data_dir=None, chart_workers=None,
+                 cache_dir='.cache/survey_data', name=None):
+    """
+    Analyze one survey file and write the requested outputs.
+
+    Messages the components print are captured, so the batch output
+    stays readable when files are processed concurrently.
+
+    Args:
+        file_path (str): Survey CSV file
+        report_dir (str): Directory for the report, None for no report
+        report_format (str): 'json' or 'text'
+        chart_dir (str): Directory for the PNG charts, None for none
+        data_dir (str): Directory for the cleaned CSV, None for none
+        chart_workers (int or str): Processes rendering the charts, or
+            'auto' (see DataVisualizer.export_all_charts)
+        cache_dir (str): Directory of the cleaned-data cache
+        name (str): Base name of the report and cleaned-data files,
+            defaults to the file's base name
+
+    Returns:
+        dict: Input, status, row count, output paths, per-step timings
+            in seconds and, on failure, the error
+    """
+    if name is None:
+        name = os.path.splitext(os.path.basename(file_path))[0]
+    result = {'input': file_path, 'status': 'ok', 'rows': 0,
+              'outputs': {}, 'timings': {}}
+    timings = result['timings']
+    messages = io.StringIO()
+    start_time = time.perf_counter()
+
+    def step(label, func):
+        step_start = time.perf_counter()
+        value = func()
+        timings[label] = round(time.perf_counter() - step_start, 4)
+        return value
+
+    try:
+        with contextlib.redirect_stdout(messages):
+            data_handler = DataHandler(cache=SurveyDataCache(cache_dir))
+            if not step('load', lambda: data_handler.load_csv(file_path)):
+                # The handler reports why with display_error_message
+                errors = [
+                    line[2:] for line in messages.getvalue().splitlines()
+                    if line.startswith('❌ ')
+                ]
+                raise ValueError(
+                    errors[-1] if errors else "Could not load data"
+                )
+            result['rows'] = len(data_handler.data)
+
+            if report_dir is not None:
+                report = step('report', lambda: FinanceAnalyzer(
+                    data_handler.data,
+                    fingerprint=data_handler.get_fingerprint()
+                ).get_comprehensive_report())
+                extension = 'json' if report_format == 'json' else 'txt'
+                report_path = os.path.join(report_dir, f"{name}.{extension}")
+                os.makedirs(report_dir, exist_ok=True)
+                with open(report_path, 'w', encoding='utf-8') as output:
+                    if report_format == 'json':
+                        json.dump(report, output, indent=2, default=str)
+                    else:
+                        output.write(format_report_text(report) + '\n')
+                result['outputs']['report'] = report_path
+
+            if chart_dir is not None:
+                # Imported here: loads matplotlib and seaborn
+                from src.visualizer import DataVisualizer
+
+                visualizer = DataVisualizer(
+                    data_handler.data,
+                    fingerprint=data_handler.get_fingerprint()
+                )
+                if not step('charts', lambda: visualizer.export_all_charts(
+                        chart_dir, workers=chart_workers)):
+                    raise ValueError("Could not export charts")
+                timings['chart_renders'] = dict(visualizer.render_timings)
+                result['outputs']['charts'] = chart_dir
+
+            if data_dir is not None:
+                data_path = os.path.join(data_dir, f"{name}_cleaned.csv")
+                if not step('data', lambda: data_handler.export_cleaned_data(
+                        data_path)):
+                    raise ValueError("Could not export cleaned data")
+                result['outputs']['data'] = data_path
+    except (ValueError, IOError, OSError) as e:
+        result['status'] = 'error'
+        result['error'] = str(e)
+
+    timings['total'] = round(time.perf_counter() - start_time, 4)
+    return result
+
+
+def run_batch(files, report_dir=None, report_format='json', chart_dir=None,
+              data_dir=None, workers=None, cache_dir='.cache/survey_data'):
+    """
+    Analyze survey files concurrently, one process per file.
+
+    With several files, each gets a subdirectory of chart_dir named
+    after it, and its charts are rendered in its own process only.
+    Outputs are named by output_names, so files with the same base name
+    in different directories do not overwrite each other's.
+
+    Args:
+        files (list): Survey CSV files
+        report_dir (str): Directory for the reports, None for none
+        report_format (str): 'json' or 'text'
+        chart_dir (str): Directory for the PNG charts, None for none
+        data_dir (str): Directory for the cleaned CSVs, None for none
+        workers (int): Files processed at once, defaults to the CPU
+            count
+        cache_dir (str): Directory of the cleaned-data cache
+
+    Returns:
+        dict: Per-file results of analyze_file, the worker count and
+            the total seconds
+    """
+    start_time = time.perf_counter()
+    workers = max(1, min(workers or os.cpu_count() or 1, len(files)))
+    enable_copy_on_write()
+
+    names = output_names(files)
+    jobs = []
+    for file_path in files:
+        name = names[file_path]
+        jobs.append({
+            'file_path': file_path,
+            'report_dir': report_dir,
+            'report_format': report_format,
+            'chart_dir': (
+                os.path.join(chart_dir, name)
+                if chart_dir is not None and len(files) > 1 else chart_dir
+            ),
+            'data_dir': data_dir,
+            # One file may render its charts in a pool, where it pays off
+            'chart_workers': 'auto' if len(files) == 1 else None,
+            'cache_dir': cache_dir,
+            'name': name
+        })
+
+    if workers == 1:
+        results = [analyze_file(**job) for job in jobs]
+    else:
+        # Workers started by spawn do not inherit the pandas options
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=enable_copy_on_write
+        ) as executor:
+            futures = [
+                executor.submit(analyze_file, **job) for job in jobs
+            ]
+            results = [future.result() for future in futures]
+
+    return {
+        'files': results,
+        'workers': workers,
+        'total_seconds': round(time.perf_counter() - start_time, 4)
+    }
@@ -0,0 +1,659 @@
+"""
+Data Cache Module for Personal Finance Survey Analyzer.
+
+This module stores cleaned survey data in a columnar (Feather) file so
+that later loads of the same CSV can skip parsing and cleaning, keeps
+the row-hash manifests used to delta-sync worksheets, and provides the
+in-memory caches and dataset fingerprints used to reuse analysis
+results.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from src.schema import SURVEY_SCHEMA
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # Cache is disabled without pyarrow
+    pa = None
+    feather = None
+
+
+class SurveyDataCache:
+    """Size-bounded on-disk cache of cleaned survey DataFrames."""
+
+    HASH_BLOCK_SIZE = 1024 * 1024
+
+    def __init__(self, cache_dir='.cache/survey_data',
+                 max_bytes=512 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir (str): Directory holding the cached Feather files
+            max_bytes (int): Total size the cache may grow to before the
+                least recently used entries are evicted
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        # Entry paths already worked out for (path, size, mtime) so a
+        # miss followed by a store hashes the source only once
+        self._entry_paths = {}
+
+    @property
+    def available(self):
+        """bool: True if pyarrow is installed and the cache can be used."""
+        return feather is not None
+
+    def _path_prefix(self, file_path):
+        """Get the cache file prefix shared by all versions of a source."""
+        abs_path = os.path.abspath(file_path)
+        return hashlib.sha256(abs_path.encode('utf-8')).hexdigest()[:16]
+
+    def _content_hash(self, file_path):
+        """Hash the bytes of a source file."""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(file_path, 'rb') as source:
+            for block in iter(
+                    lambda: source.read(self.HASH_BLOCK_SIZE), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _entry_path(self, file_path):
+        """
+        Build the cache file path for the current version of a source.
+
+        The name combines the source path with its size, modification
+        time and content hash, and the schema version, so any change to
+        the source or to the cleaning misses.
+
+        Args:
+            file_path (str): Path to the source CSV
+
+        Returns:
+            str: Path of the matching cache file
+        """
+        stat = os.stat(file_path)
+        source_key = (
+            os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns
+        )
+        if source_key not in self._entry_paths:
+            version = hashlib.sha256(
+                f"{stat.st_size}:{stat.st_mtime_ns}:"
+                f"{self._content_hash(file_path)}:"
+                f"{SURVEY_SCHEMA.version}".encode('utf-8')
+            ).hexdigest()[:16]
+            self._entry_paths[source_key] = os.path.join(
+                self.cache_dir,
+                f"{self._path_prefix(file_path)}-{version}.feather"
+            )
+        return self._entry_paths[source_key]
+
+    def load(self, file_path):
+        """
+        Load cleaned data for a source file if a valid entry exists.
+
+        Args:
+            file_path (str): Path to the source CSV
+
+        Returns:
+            pd.DataFrame or None: Cached cleaned data, or None on a miss
+        """
+        if not self.available:
+            return None
+
+        try:
+            entry_path = self._entry_path(file_path)
+            if not os.path.exists(entry_path):
+                return None
+
+            # Uncompressed Feather can be memory-mapped instead of read
+            table = feather.read_table(entry_path, memory_map=True)
+            data = table.to_pandas(split_blocks=True)
+
+            # Mark the entry as recently used for eviction
+            os.utime(entry_path)
+            return data
+
+        except (OSError, pa.ArrowException):
+            return None
+
+    def store(self, file_path, data):
+        """
+        Store cleaned data for a source file.
+
+        Older entries for the same source are removed, then the cache is
+        trimmed back under its size limit.
+
+        Args:
+            file_path (str): Path to the source CSV
+            data (pd.DataFrame): Cleaned survey data
+
+        Returns:
+            bool: True if the entry was written
+        """
+        if not self.available:
+            return False
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            entry_path = self._entry_path(file_path)
+
+            # Write to a temporary name so readers never see partial
+            # files; unique, as other processes may store the same entry
+            fd, temp_path = tempfile.mkstemp(
+                suffix='.tmp', prefix=f"{os.path.basename(entry_path)}.",
+                dir=self.cache_dir
+            )
+            os.close(fd)
+            try:
+                feather.write_feather(
+                    pa.Table.from_pandas(data),
+                    temp_path,
+                    compression='uncompressed'
+                )
+                os.replace(temp_path, entry_path)
+            except BaseException:
+                self._remove(temp_path)
+                raise
+
+            self._remove_stale_entries(file_path, entry_path)
+            self._evict()
+            return True
+
+        except (OSError, pa.ArrowException):
+            return False
+
+    @staticmethod
+    def _remove(path):
+        """Delete a cache file, unless another process already has."""
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+
+    def _remove_stale_entries(self, file_path, current_path):
+        """
+        Delete cache files for older versions of a source.
+
+        Temporary files are left alone: they belong to stores still in
+        progress, possibly in other processes.
+        """
+        prefix = self._path_prefix(file_path)
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if (name.startswith(prefix) and name.endswith('.feather')
+                    and path != current_path):
+                self._remove(path)
+
+    def _evict(self):
+        """Remove least recently used entries until under max_bytes."""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.feather'):
+                try:
+                    stat = os.stat(os.path.join(self.cache_dir, name))
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, name))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            self._remove(os.path.join(self.cache_dir, name))
+            total_bytes -= size
+
+    def clear(self):
+        """Remove every cached entry."""
+        if not os.path.isdir(self.cache_dir):
+            return
+        for name in os.listdir(self.cache_dir):
+            self._remove(os.path.join(self.cache_dir, name))
+
+
+def row_hashes(data):
+    """
+    Hash each row of a DataFrame, ignoring the index.
+
+    Args:
+        data (pd.DataFrame): Rows to hash
+
+    Returns:
+        np.ndarray: One uint64 hash per row
+    """
+    return pd.util.hash_pandas_object(data, index=False).to_numpy()
+
+
+class SheetSyncCache:
+    """On-disk sync state of Google Sheets worksheets for delta syncs."""
+
+    # Own writes remembered per spreadsheet
+    MAX_OWN_WRITES = 256
+
+    def __init__(self, cache_dir='.cache/sheets_sync'):
+        """
+        Initialize the sync cache.
+
+        For each worksheet it keeps a manifest of the row hashes last
+        pushed and a snapshot of the data last pulled, each tagged with
+        the spreadsheet's modification time at that sync. The app's own
+        writes (log rows, saved results) also change that time, so each
+        is recorded as a (before, after, worksheets written) step; a
+        worksheet is still current if only steps that did not write it
+        lead from its sync to the present (see is_current).
+
+        Args:
+            cache_dir (str): Directory holding manifests and snapshots
+        """
+        self.cache_dir = cache_dir
+
+    def _writes_path(self, spreadsheet_id):
+        """Build the path of the own-writes record of a spreadsheet."""
+        key = hashlib.sha256(
+            spreadsheet_id.encode('utf-8')
+        ).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{key}.writes.json")
+
+    def _load_writes(self, spreadsheet_id):
+        """Load the own writes recorded for a spreadsheet."""
+        try:
+            with open(self._writes_path(spreadsheet_id),
+                      encoding='utf-8') as record:
+                return json.load(record)
+        except (OSError, ValueError):
+            return {}
+
+    def _store_writes(self, spreadsheet_id, writes):
+        """Store the own writes recorded for a spreadsheet."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = self._writes_path(spreadsheet_id)
+            with open(f"{path}.tmp", 'w', encoding='utf-8') as record:
+                json.dump(writes, record)
+            os.replace(f"{path}.tmp", path)
+        except OSError:
+            pass
+
+    def tracks(self, spreadsheet_id):
+        """
+        Check whether delta syncs keep state for a spreadsheet.
+
+        Args:
+            spreadsheet_id (str): Spreadsheet ID
+
+        Returns:
+            bool: True if own writes to it should be recorded
+        """
+        return os.path.exists(self._writes_path(spreadsheet_id))
+
+    def record_write(self, spreadsheet_id, before, after, worksheet_names):
+        """
+        Record a write of the app's own to a spreadsheet.
+
+        Args:
+            spreadsheet_id (str): Spreadsheet ID
+            before (str): Modification time read just before the write
+            after (str): Modification time read just after it
+            worksheet_names (iterable): Worksheets the write changed
+        """
+        if before == after:
+            return
+        writes = self._load_writes(spreadsheet_id)
+        writes.pop(before, None)
+        writes[before] = {'after': after, 'worksheets': sorted(
+            set(worksheet_names)
+        )}
+        # Keep the most recent steps (dicts keep insertion order)
+        for stale in list(writes)[:-self.MAX_OWN_WRITES]:
+            del writes[stale]
+        self._store_writes(spreadsheet_id, writes)
+
+    def is_current(self, spreadsheet_id, worksheet_name, synced, modified):
+        """
+        Check whether a worksheet is unchanged since a sync.
+
+        Args:
+            spreadsheet_id (str): Spreadsheet ID
+            worksheet_name (str): Worksheet name
+            synced (str): Spreadsheet modification time at the sync
+            modified (str): Current spreadsheet modification time
+
+        Returns:
+            bool: True if the spreadsheet was not modified since, or
+                only by own writes to other worksheets
+        """
+        writes = None
+        seen = set()
+        while synced != modified:
+            if writes is None:
+                writes = self._load_writes(spreadsheet_id)
+            write = writes.get(synced)
+            if (write is None or synced in seen
+                    or worksheet_name in write['worksheets']):
+                return False
+            seen.add(synced)
+            synced = write['after']
+        return True
+
+    def _path(self, spreadsheet_id, worksheet_name, suffix):
+        """Build the path of a sync file for a worksheet."""
+        key = hashlib.sha256(
+            f"{spreadsheet_id}/{worksheet_name}".encode('utf-8')
+        ).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{key}.{suffix}")
+
+    def load_manifest(self, spreadsheet_id, worksheet_name):
+        """
+        Load the manifest of the rows last pushed to a worksheet.
+
+        Args:
+            spreadsheet_id (str): Spreadsheet ID
+            worksheet_name (str): Worksheet name
+
+        Returns:
+            dict or None: 'columns', 'hashes' (np.ndarray) and
+                'modified', or None if there is no usable manifest
+        """
+        try:
+            with np.load(
+                    self._path(spreadsheet_id, worksheet_name, 'npz')
+            ) as manifest:
+                return {
+                    'columns': manifest['columns'].tolist(),
+                    'hashes': manifest['hashes'],
+                    'modified': str(manifest['modified'])
+                }
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def store_manifest(self, spreadsheet_id, worksheet_name, columns,
+                       hashes, modified):
+        """
+        Store the manifest of the rows just pushed to a worksheet.
+
+        Args:
+            spreadsheet_id (str): Spreadsheet ID
+            worksheet_name (str): Worksheet name
+            columns (list): Header row
+            hashes (np.ndarray): Row hashes (see row_hashes)
+            modified (str): Spreadsheet modification time after the push
+
+        Returns:
+            bool: True if the manifest was written
+        """
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = self._path(spreadsheet_id, worksheet_name, 'npz')
+            temp_path = f"{path}.tmp.npz"
+            np.savez(
+                temp_path, columns=np.array(columns, dtype=str),
+                hashes=hashes, modified=np.array(modified)
+            )
+            os.replace(temp_path, path)
+            if not self.tracks(spreadsheet_id):
+                self._store_writes(spreadsheet_id, {})
+            return True
+        except OSError:
+            return False
+
+    def load_snapshot(self, spreadsheet_id, worksheet_name, modified):
+        """
+        Load the data last pulled from a worksheet, if still current.
+
+        Args:
+            spreadsheet_id (str): Spreadsheet ID
+            worksheet_name (str): Worksheet name
+            modified (str): Current spreadsheet modification time
+
+        Returns:
+            pd.DataFrame or None: Pulled data, or None if the worksheet
+                may have changed since (or there is no snapshot)
+        """
+        if feather is None:
+            return None
+
+        path = self._path(spreadsheet_id, worksheet_name, 'feather')
+        try:
+            with open(f"{path}.json", encoding='utf-8') as info:
+                synced = json.load(info).get('modified')
+            if not self.is_current(
+                    spreadsheet_id, worksheet_name, synced, modified):
+                return None
+            return feather.read_table(path).to_pandas()
+        except (OSError, ValueError, pa.ArrowException):
+            return None
+
+    def store_snapshot(self, spreadsheet_id, worksheet_name, modified,
+                       data):
+        """
+        Store the data just pulled from a worksheet.
+
+        Args:
+            spreadsheet_id (str): Spreadsheet ID
+            worksheet_name (str): Worksheet name
+            modified (str): Spreadsheet modification time of the pull
+            data (pd.DataFrame): Pulled data
+
+        Returns:
+            bool: True if the snapshot was written
+        """
+        if feather is None:
+            return False
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = self._path(spreadsheet_id, worksheet_name, 'feather')
+            feather.write_feather(
+                pa.Table.from_pandas(data), f"{path}.tmp",
+                compression='uncompressed'
+            )
+            os.replace(f"{path}.tmp", path)
+            with open(f"{path}.json", 'w', encoding='utf-8') as info:
+                json.dump({'modified': modified}, info)
+            if not self.tracks(spreadsheet_id):
+                self._store_writes(spreadsheet_id, {})
+            return True
+        except (OSError, pa.ArrowException):
+            return False
+
+
+def dataset_fingerprint(data):
+    """
+    Build an identifier for the contents of a survey DataFrame.
+
+    The fingerprint covers the column names and dtypes and every value,
+    so any edit gives a new fingerprint. NumPy columns are hashed as raw
+    buffers, nullable ones as their values and missing mask, and others
+    (categorical, text) through pd.util.hash_pandas_object. It costs
+    about 0.1s per million rows, so it is computed once per load (see
+    DataHandler.get_fingerprint).
+
+    Args:
+        data (pd.DataFrame): Survey data
+
+    Returns:
+        str: Hex digest identifying the dataset
+    """
+    digest = hashlib.blake2b(digest_size=32)
+    digest.update(repr(data.shape).encode('utf-8'))
+    digest.update(repr(list(zip(data.columns, map(str, data.dtypes))))
+                  .encode('utf-8'))
+
+    for column in data.columns:
+        values = data[column]
+        dtype = values.dtype
+        if isinstance(dtype, np.dtype) and dtype.kind in 'biuf':
+            digest.update(np.ascontiguousarray(values.to_numpy()).data)
+        elif (isinstance(dtype, pd.api.extensions.ExtensionDtype)
+                and dtype.kind in 'biuf'):
+            # Nullable numbers: the missing mask, then the values
+            digest.update(values.isna().to_numpy().data)
+            digest.update(values.to_numpy(
+                dtype=dtype.numpy_dtype, na_value=0
+            ).data)
+        else:
+            digest.update(
+                pd.util.hash_pandas_object(values, index=False).to_numpy()
+                .data
+            )
+
+    return digest.hexdigest()
+
+
+def chain_fingerprint(fingerprint, rows):
+    """
+    Fingerprint a dataset after appending rows to it.
+
+    Only the appended rows are hashed, so it costs time proportional to
+    them. The result identifies the combined contents but is not the
+    dataset_fingerprint of the combined frame: data built up by appends
+    and the same data loaded at once are cached separately.
+
+    Args:
+        fingerprint (str): Fingerprint of the dataset before the append
+        rows (pd.DataFrame): Appended rows
+
+    Returns:
+        str: Hex digest identifying the combined dataset
+    """
+    digest = hashlib.blake2b(digest_size=32)
+    digest.update(fingerprint.encode('utf-8'))
+    digest.update(dataset_fingerprint(rows).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache with hit/miss counters."""
+
+    def __init__(self, maxsize=128):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize (int): Maximum number of entries kept
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Look up an entry and mark it as recently used.
+
+        Args:
+            key (hashable): Entry key
+            default: Value returned on a miss
+
+        Returns:
+            Cached value, or default if the key is not cached
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        """
+        Store an entry, evicting the least recently used if full.
+
+        Args:
+            key (hashable): Entry key
+            value: Value to cache
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """
+        Get cache usage figures.
+
+        Returns:
+            dict: hits, misses, current size and maximum size
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries),
+                'maxsize': self.maxsize
+            }
+
+
+class FigureCache(LRUCache):
+    """LRU cache of rendered figure bytes bounded by their total size."""
+
+    def __init__(self, max_bytes=128 * 1024 * 1024, maxsize=256):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes (int): Total size of the cached images before the
+                least recently used are evicted
+            maxsize (int): Maximum number of images kept
+        """
+        super().__init__(maxsize)
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+
+    def put(self, key, value):
+        """
+        Store rendered image bytes, evicting the least recently used
+        images until the cache is within both of its bounds.
+
+        Args:
+            key (hashable): Entry key
+            value (bytes): Rendered image
+        """
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= len(self._entries[key])
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self.nbytes += len(value)
+            while self._entries and (
+                    len(self._entries) > self.maxsize
+                    or self.nbytes > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= len(evicted)
+
+    def clear(self):
+        """Remove every image and reset the counters."""
+        with self._lock:
+            self.nbytes = 0
+        super().clear()
+
+    def stats(self):
+        """
+        Get cache usage figures.
+
+        Returns:
+            dict: hits, misses, size and maximum size, plus the bytes
+                held and the byte bound
+        """
+        stats = super().stats()
+        with self._lock:
+            stats.update(nbytes=self.nbytes, max_bytes=self.max_bytes)
+        return stats
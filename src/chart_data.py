@@ -0,0 +1,500 @@
+"""
+Chart Data Module for Personal Finance Survey Analyzer.
+
+This module reduces survey data to the compact summaries the charts
+draw (bin counts, group means, crosstabs and regression lines), so each
+dataset is summarized once and drawing does not depend on row count.
+"""
+
+import numpy as np
+import pandas as pd
+from src.aggregates import co_moments, column_array, present_values
+from src.schema import SURVEY_SCHEMA
+
+
+# Age groups shared by the savings, investment and literacy charts
+AGE_BINS = [0, 30, 40, 50, 100]
+AGE_LABELS = ['<30', '30-40', '40-50', '50+']
+
+# Number of points a trend line is drawn through
+TREND_POINTS = 50
+
+# Scatter plots with more points than this switch to large-N rendering:
+# a density grid ('density') or a stratified sample ('sample')
+SCATTER_POINT_LIMIT = 10_000
+LARGE_SCATTER_MODES = ('density', 'sample')
+
+# Bins per axis of the density grid, and x strata used for sampling
+DENSITY_BINS = 60
+SAMPLE_STRATA = 20
+
+
+def histogram(values, bins):
+    """
+    Bin a column for a histogram, skipping missing values.
+
+    Args:
+        values (np.ndarray): Float64 values, NaN for missing
+        bins (int): Number of equal-width bins
+
+    Returns:
+        dict: Bin counts and the bin edges
+    """
+    counts, edges = np.histogram(present_values(values), bins=bins)
+    return {'counts': counts, 'edges': edges}
+
+
+def group_means(groups, values):
+    """
+    Average values per group, like Series.groupby(groups).mean().
+
+    Args:
+        groups (pd.Series): Categorical group of each row
+        values (np.ndarray): Float64 values, NaN for missing
+
+    Returns:
+        pd.Series: Mean per category (NaN for empty groups)
+    """
+    codes = groups.cat.codes.to_numpy()
+    valid = (codes >= 0) & ~np.isnan(values)
+    size = len(groups.cat.categories)
+
+    sums = np.bincount(codes[valid], weights=values[valid], minlength=size)
+    counts = np.bincount(codes[valid], minlength=size)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        means = sums / counts
+
+    return pd.Series(
+        means,
+        index=pd.CategoricalIndex(groups.cat.categories, name=groups.name)
+    )
+
+
+def value_counts(values):
+    """
+    Count respondents per value, like Series.value_counts.
+
+    Args:
+        values (pd.Series): Answers to one question
+
+    Returns:
+        pd.Series: Counts, most common first, without the unused
+            categories a categorical column would list as zero
+    """
+    counts = values.value_counts()
+    return counts[counts > 0]
+
+
+def crosstab(rows, columns):
+    """
+    Count respondents per pair of categories, like pd.crosstab.
+
+    Args:
+        rows (pd.Series): Categories for the table rows
+        columns (pd.Series): Categories for the table columns
+
+    Returns:
+        pd.DataFrame: Counts, without rows or columns that are all empty
+    """
+    rows = rows.astype('category')
+    columns = columns.astype('category')
+    row_codes = rows.cat.codes.to_numpy().astype('int64')
+    column_codes = columns.cat.codes.to_numpy().astype('int64')
+    valid = (row_codes >= 0) & (column_codes >= 0)
+
+    shape = (len(rows.cat.categories), len(columns.cat.categories))
+    counts = np.bincount(
+        row_codes[valid] * shape[1] + column_codes[valid],
+        minlength=shape[0] * shape[1]
+    ).reshape(shape)
+
+    table = pd.DataFrame(
+        counts,
+        index=pd.CategoricalIndex(rows.cat.categories, name=rows.name),
+        columns=pd.CategoricalIndex(
+            columns.cat.categories, name=columns.name
+        )
+    )
+    return table.loc[counts.sum(axis=1) > 0, counts.sum(axis=0) > 0]
+
+
+def stratified_sample(x, y, limit, seed=0):
+    """
+    Pick about limit points, spread across the x range.
+
+    Rows are split into equal-width x strata and each stratum keeps its
+    share of the sample (at least one point), so sparse tails are not
+    lost the way they can be with a plain random sample.
+
+    Args:
+        x (np.ndarray): Float64 values, NaN for missing
+        y (np.ndarray): Float64 values, NaN for missing
+        limit (int): Approximate number of points to keep
+        seed (int): Random seed, fixed so charts are reproducible
+
+    Returns:
+        tuple: Sampled x and y arrays
+    """
+    rows = np.flatnonzero(~(np.isnan(x) | np.isnan(y)))
+    if rows.size <= limit:
+        return x[rows], y[rows]
+
+    edges = np.linspace(x[rows].min(), x[rows].max(), SAMPLE_STRATA + 1)
+    strata = np.digitize(x[rows], edges[1:-1])
+
+    # Shuffle within each stratum, then keep the first rows of each
+    rng = np.random.default_rng(seed)
+    order = np.lexsort((rng.random(rows.size), strata))
+    sizes = np.bincount(strata, minlength=SAMPLE_STRATA)
+    quotas = np.where(
+        sizes > 0, np.maximum(1, np.round(sizes * limit / rows.size)), 0
+    ).astype(int)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    rank = np.arange(rows.size) - np.repeat(starts, sizes)
+    chosen = rows[order[rank < np.repeat(quotas, sizes)]]
+    return x[chosen], y[chosen]
+
+
+def scatter_data(x, y, limit=SCATTER_POINT_LIMIT, mode='density'):
+    """
+    Build a scatter plot payload, bounded in size for large datasets.
+
+    Args:
+        x (np.ndarray): Float64 values, NaN for missing
+        y (np.ndarray): Float64 values, NaN for missing
+        limit (int): Most points drawn individually
+        mode (str): Large-N rendering, 'density' or 'sample'
+
+    Returns:
+        dict: {'kind': 'points', 'x', 'y'} or, above the limit in density
+            mode, {'kind': 'density', 'counts', 'x_edges', 'y_edges'}
+    """
+    if len(x) <= limit or mode == 'sample':
+        x, y = stratified_sample(x, y, limit)
+        return {'kind': 'points', 'x': x, 'y': y}
+
+    present = ~(np.isnan(x) | np.isnan(y))
+    counts, x_edges, y_edges = np.histogram2d(
+        x[present], y[present], bins=DENSITY_BINS
+    )
+    return {
+        'kind': 'density',
+        'counts': counts,
+        'x_edges': x_edges,
+        'y_edges': y_edges
+    }
+
+
+def trend_line(x, y):
+    """
+    Fit a least-squares line over rows where both values are present.
+
+    Args:
+        x (np.ndarray): Float64 values, NaN for missing
+        y (np.ndarray): Float64 values, NaN for missing
+
+    Returns:
+        dict: Slope, intercept and points spanning the x range, or None
+            if no line can be fitted
+    """
+    moments = co_moments(x, y)
+    if moments['n'] < 2 or not moments['m2_x']:
+        return None
+
+    slope = moments['c_xy'] / moments['m2_x']
+    intercept = moments['mean_y'] - slope * moments['mean_x']
+    grid = np.linspace(np.nanmin(x), np.nanmax(x), TREND_POINTS)
+    return {
+        'slope': slope,
+        'intercept': intercept,
+        'x': grid,
+        'y': intercept + slope * grid
+    }
+
+
+def category_label(column):
+    """
+    Turn a spending column name into a chart label.
+
+    Args:
+        column (str): Spending column name
+
+    Returns:
+        str: Label such as 'Food'
+    """
+    return column.replace('monthly_spending_', '').replace('_', ' ').title()
+
+
+class ChartData:
+    """Plot payloads for one survey dataset, each built on first use."""
+
+    CHARTS = ['spending', 'savings', 'investment', 'literacy', 'dashboard']
+
+    def __init__(self, data, scatter_limit=SCATTER_POINT_LIMIT,
+                 large_scatter='density'):
+        """
+        Initialize the chart data for a survey dataset.
+
+        Args:
+            data (pd.DataFrame): Survey data
+            scatter_limit (int): Most points a scatter plot draws one by
+                one; larger datasets use large_scatter rendering
+            large_scatter (str): 'density' for a 2D histogram or 'sample'
+                for a stratified sample of scatter_limit points
+        """
+        if large_scatter not in LARGE_SCATTER_MODES:
+            raise ValueError(
+                f"large_scatter must be one of {LARGE_SCATTER_MODES}"
+            )
+
+        self.data = data
+        self.scatter_limit = scatter_limit
+        self.large_scatter = large_scatter
+        self.columns = set(data.columns)
+        self.spending_columns = [
+            col for col in data.columns
+            if SURVEY_SCHEMA.is_spending_column(col)
+        ]
+        self._payloads = {}
+        self._arrays = {}
+        self._age_groups = None
+        self._total_spending = None
+
+    def payload(self, chart):
+        """
+        Get the payload a chart is drawn from.
+
+        Payloads are plain dicts of small arrays and frames whose size
+        does not grow with the row count, so they can be sent to chart
+        render processes.
+
+        Args:
+            chart (str): One of CHARTS
+
+        Returns:
+            dict or None: Chart payload, None if the data cannot be charted
+        """
+        if chart not in self._payloads:
+            self._payloads[chart] = (
+                getattr(self, f"_build_{chart}")()
+                if not self.data.empty else None
+            )
+        return self._payloads[chart]
+
+    def _array(self, column):
+        """Get a column as a float64 array, converting it only once."""
+        if column not in self._arrays:
+            self._arrays[column] = column_array(self.data, column)
+        return self._arrays[column]
+
+    def _age_group_series(self):
+        """Assign every respondent to an age group, once per dataset."""
+        if self._age_groups is None:
+            self._age_groups = pd.cut(
+                self.data['age'], bins=AGE_BINS, labels=AGE_LABELS
+            )
+        return self._age_groups
+
+    def _total_spending_array(self):
+        """Total monthly spending per respondent, once per dataset."""
+        if self._total_spending is None:
+            # Row totals skip missing categories, like sum(axis=1)
+            total = np.zeros(len(self.data))
+            for col in self.spending_columns:
+                total += np.nan_to_num(self._array(col))
+            self._total_spending = total
+        return self._total_spending
+
+    def _scatter(self, x, y):
+        """Build a scatter payload using the configured large-N mode."""
+        return scatter_data(
+            x, y, limit=self.scatter_limit, mode=self.large_scatter
+        )
+
+    def _emergency_fund_counts(self):
+        """Count respondents per emergency fund band."""
+        months = self._array('emergency_fund_months')
+        return [
+            int(np.count_nonzero(months < 3)),
+            int(np.count_nonzero((months >= 3) & (months < 6))),
+            int(np.count_nonzero(months >= 6))
+        ]
+
+    def _build_spending(self):
+        """Build the spending chart payload."""
+        if not self.spending_columns:
+            return None
+
+        total_spending = self._total_spending_array()
+        payload = {
+            'totals': {
+                category_label(col): self.data[col].sum()
+                for col in self.spending_columns
+            },
+            'averages': {
+                category_label(col): self.data[col].mean()
+                for col in self.spending_columns
+            },
+            'total_histogram': histogram(total_spending, bins=10),
+            'age_scatter': None,
+            'age_trend': None
+        }
+
+        if 'age' in self.columns:
+            payload['age_scatter'] = self._scatter(
+                self._array('age'), total_spending
+            )
+            payload['age_trend'] = trend_line(
+                self._array('age'), total_spending
+            )
+        return payload
+
+    def _build_savings(self):
+        """Build the savings chart payload."""
+        if 'monthly_savings' not in self.columns:
+            return None
+
+        savings = self._array('monthly_savings')
+        payload = {
+            'savings_histogram': histogram(savings, bins=12),
+            'income_scatter': None,
+            'income_trend': None,
+            'rate_by_age': None,
+            'emergency_fund_counts': None
+        }
+
+        if 'annual_income' in self.columns:
+            income = self._array('annual_income')
+            payload['income_scatter'] = self._scatter(income, savings)
+            payload['income_trend'] = trend_line(income, savings)
+
+            if 'age' in self.columns:
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    savings_rate = savings / (income / 12)
+                payload['rate_by_age'] = group_means(
+                    self._age_group_series(), savings_rate
+                )
+
+        if 'emergency_fund_months' in self.columns:
+            payload['emergency_fund_counts'] = self._emergency_fund_counts()
+        return payload
+
+    def _build_investment(self):
+        """Build the investment chart payload."""
+        payload = {
+            'investment_counts': None,
+            'crypto_counts': None,
+            'investment_by_age': None,
+            'tech_adoption': None
+        }
+
+        if 'primary_investment' in self.columns:
+            payload['investment_counts'] = value_counts(
+                self.data['primary_investment']
+            )
+            if 'age' in self.columns:
+                payload['investment_by_age'] = crosstab(
+                    self._age_group_series(),
+                    self.data['primary_investment']
+                )
+
+        if 'owns_crypto' in self.columns:
+            payload['crypto_counts'] = self.data['owns_crypto'].value_counts()
+            if 'uses_mobile_banking' in self.columns:
+                payload['tech_adoption'] = crosstab(
+                    self.data['uses_mobile_banking'],
+                    self.data['owns_crypto']
+                )
+        return payload
+
+    def _build_literacy(self):
+        """Build the financial literacy chart payload."""
+        if 'financial_literacy_score' not in self.columns:
+            return None
+
+        scores = self._array('financial_literacy_score')
+        payload = {
+            'score_histogram': histogram(scores, bins=10),
+            'income_scatter': None,
+            'income_trend': None,
+            'score_by_age': None,
+            'level_counts': [
+                int(np.count_nonzero(scores < 6)),
+                int(np.count_nonzero((scores >= 6) & (scores < 8))),
+                int(np.count_nonzero(scores >= 8))
+            ]
+        }
+
+        if 'annual_income' in self.columns:
+            income = self._array('annual_income')
+            payload['income_scatter'] = self._scatter(scores, income)
+            payload['income_trend'] = trend_line(scores, income)
+
+        if 'age' in self.columns:
+            payload['score_by_age'] = group_means(
+                self._age_group_series(), scores
+            )
+        return payload
+
+    def _build_dashboard(self):
+        """Build the comprehensive dashboard payload."""
+        columns = self.columns
+        payload = {
+            'age_histogram': None,
+            'income_histogram': None,
+            'savings_scatter': None,
+            'investment_counts': None,
+            'tech_users': None,
+            'spending_totals': None,
+            'score_histogram': None,
+            'emergency_fund_counts': None
+        }
+
+        if 'age' in columns:
+            payload['age_histogram'] = histogram(self._array('age'), bins=8)
+        if 'annual_income' in columns:
+            payload['income_histogram'] = histogram(
+                self._array('annual_income'), bins=8
+            )
+            if 'monthly_savings' in columns:
+                payload['savings_scatter'] = self._scatter(
+                    self._array('annual_income'),
+                    self._array('monthly_savings')
+                )
+        if 'primary_investment' in columns:
+            payload['investment_counts'] = value_counts(
+                self.data['primary_investment']
+            )
+        if 'uses_mobile_banking' in columns and 'owns_crypto' in columns:
+            payload['tech_users'] = [
+                self.data['uses_mobile_banking'].sum(),
+                self.data['owns_crypto'].sum()
+            ]
+        if self.spending_columns:
+            payload['spending_totals'] = {
+                category_label(col): self.data[col].sum()
+                for col in self.spending_columns
+            }
+        if 'financial_literacy_score' in columns:
+            payload['score_histogram'] = histogram(
+                self._array('financial_literacy_score'), bins=10
+            )
+        if 'emergency_fund_months' in columns:
+            payload['emergency_fund_counts'] = self._emergency_fund_counts()
+
+        payload['summary'] = [
+            ['Total Respondents', len(self.data)],
+            ['Avg Age', (
+                f"{self.data['age'].mean():.1f}"
+                if 'age' in columns else 'N/A'
+            )],
+            ['Avg Income', (
+                f"${self.data['annual_income'].mean():,.0f}"
+                if 'annual_income' in columns else 'N/A'
+            )],
+            ['Avg Savings', (
+                f"${self.data['monthly_savings'].mean():.0f}"
+                if 'monthly_savings' in columns else 'N/A'
+            )],
+        ]
+        return payload
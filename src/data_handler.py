@@ -5,28 +5,147 @@ This module handles CSV file loading, data validation, and preprocessing
 for the personal finance survey analysis application.
 """
 
+import operator
+import numpy as np
 import pandas as pd
 import os
+import time
+import weakref
+from src.aggregates import SurveyAggregates
+from src.cache import chain_fingerprint, dataset_fingerprint
+from src.filter_index import FilterIndex, RowSelection, index_usable
+from src.schema import SURVEY_SCHEMA
 from src.utils import (
-    handle_file_error, display_success_message, display_error_message
+    handle_file_error, display_success_message, display_error_message,
+    get_peak_memory_mb, shared_copy, start_peak_memory_window
 )
 
 
+# Columns every survey file must have
+REQUIRED_COLUMNS = [
+    'respondent_id', 'age', 'annual_income', 'monthly_savings',
+    'uses_mobile_banking', 'owns_crypto', 'primary_investment'
+]
+
+# Rows missing any of these cannot be analyzed and are dropped
+CRITICAL_COLUMNS = ['age', 'annual_income']
+
+# filter_data criteria: name -> (column, comparison with the value)
+ROW_FILTERS = {
+    'min_age': ('age', operator.ge),
+    'max_age': ('age', operator.le),
+    'min_income': ('annual_income', operator.ge),
+    'max_income': ('annual_income', operator.le),
+    'uses_mobile_banking': ('uses_mobile_banking', operator.eq),
+    'owns_crypto': ('owns_crypto', operator.eq),
+    'investment_type': ('primary_investment', operator.eq),
+}
+
+# Columns filtered by range (kept sorted) and by value (kept as bitmaps)
+RANGE_COLUMNS = sorted({
+    column for column, compare in ROW_FILTERS.values()
+    if compare is not operator.eq
+})
+VALUE_COLUMNS = sorted({
+    column for column, compare in ROW_FILTERS.values()
+    if compare is operator.eq
+})
+
+# Once the rows appended after the filter index was built outnumber
+# this share of the indexed rows, the index is rebuilt
+INDEX_REBUILD_SHARE = 0.25
+
+
+def clean_frame(data):
+    """
+    Clean and preprocess a frame of survey rows.
+
+    Args:
+        data (pd.DataFrame): Raw survey rows (a file, chunk or partition)
+
+    Returns:
+        pd.DataFrame: Cleaned rows
+    """
+    # Convert numeric, yes/no and category columns to schema types
+    data = SURVEY_SCHEMA.coerce(data)
+
+    # Remove rows with critical missing data
+    data.dropna(subset=CRITICAL_COLUMNS, inplace=True)
+    return data
+
+
 class DataHandler:
     """Handles data loading, validation, and preprocessing operations."""
 
-    def __init__(self):
-        """Initialize the DataHandler."""
+    def __init__(self, cache=None, quantile_error=None):
+        """
+        Initialize the DataHandler.
+
+        Args:
+            cache (SurveyDataCache): Optional cache of cleaned data; when
+                given, repeat loads of an unchanged CSV skip parsing
+            quantile_error (float): If set, chunked loads also gather the
+                analysis statistics (with sketched medians of this rank
+                error) as the chunks stream in; see self.aggregates
+        """
         self.data = None
-        self.original_data = None
         self.data_info = {}
+        self.load_stats = {}
+        self.cache = cache
+        self.quantile_error = quantile_error
+        # Statistics of the rows as loaded, for FinanceAnalyzer
+        self.aggregates = None
+        # (Partition, start, stop) row positions when loaded from a
+        # PartitionedDataset; the partition keys are filter criteria
+        self.partition_bounds = []
+        # Built by the first filter, see select_rows
+        self.filter_index = None
+        # (weak reference to the data, its dataset_fingerprint)
+        self._fingerprint = (None, None)
+        self.last_filter_stats = {}
+
+    @property
+    def data(self):
+        """
+        pd.DataFrame or None: The loaded survey data.
 
-    def load_csv(self, file_path):
+        Rows added by append() are kept as separate frames and joined
+        here, once, when the data is next used, so that a run of appends
+        does not copy the whole frame each time.
+        """
+        if self._appended:
+            self._data = SURVEY_SCHEMA.concat(
+                [self._data] + self._appended
+            )
+            self._appended = []
+            if self._appended_fingerprint is not None:
+                self._fingerprint = (
+                    weakref.ref(self._data), self._appended_fingerprint
+                )
+                self._appended_fingerprint = None
+            if self.filter_index is not None:
+                # Existing rows keep their positions; filters scan the
+                # new ones until the index is rebuilt
+                self.filter_index.track(self._data)
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+        self._appended = []
+        # Fingerprint of the data with the appended rows, while they are
+        # kept apart
+        self._appended_fingerprint = None
+
+    def load_csv(self, file_path, chunksize=None):
         """
         Load CSV file and perform initial validation.
 
         Args:
             file_path (str): Path to the CSV file
+            chunksize (int): Optional number of rows to read at a time.
+                When set, the file is streamed and cleaned chunk by chunk
+                so the whole raw text frame is never held at once.
 
         Returns:
             bool: True if successful, False otherwise
@@ -37,12 +156,44 @@ class DataHandler:
                 display_error_message(f"File not found: {file_path}")
                 return False
 
-            # Load the CSV file
-            self.data = pd.read_csv(file_path)
-            self.original_data = self.data.copy()
+            start_time = time.perf_counter()
+            start_rss = start_peak_memory_window()
+            mode = 'chunked' if chunksize else 'full'
+            self.aggregates = None
+            self.filter_index = None
+            self.partition_bounds = []
+            cached_data = (
+                self.cache.load(file_path) if self.cache is not None
+                else None
+            )
 
-            # Validate the loaded data
-            if self._validate_data_structure():
+            if cached_data is not None:
+                # Cached data is already validated and cleaned
+                self.data = cached_data
+                mode = 'cache'
+                loaded = True
+            elif chunksize:
+                loaded = self._load_csv_chunked(file_path, chunksize)
+            else:
+                # Load the CSV file, parsing straight into schema types
+                columns = pd.read_csv(file_path, nrows=0).columns
+                try:
+                    self.data = pd.read_csv(
+                        file_path, **SURVEY_SCHEMA.read_csv_kwargs(columns)
+                    )
+                except (ValueError, TypeError):
+                    # Some values do not fit the declared types; parse
+                    # leniently and let _clean_data coerce them
+                    self.data = pd.read_csv(file_path)
+
+                # Validate the loaded data
+                loaded = self._validate_data_structure()
+
+            if loaded and mode != 'cache' and self.cache is not None:
+                self.cache.store(file_path, self.data)
+
+            if loaded:
+                self._record_load_stats(mode, start_time, start_rss)
                 self._generate_data_info()
                 display_success_message(
                     f"Successfully loaded {len(self.data)} records")
@@ -54,6 +205,267 @@ class DataHandler:
             handle_file_error(e, file_path)
             return False
 
+    def load_dataset(self, dataset, **filters):
+        """
+        Load the rows of a partitioned dataset that match filters.
+
+        Only partitions whose statistics allow a match are read, so a
+        filtered load touches just the relevant files.
+
+        Args:
+            dataset (PartitionedDataset): Dataset to load
+            **filters: Criteria of filter_data, or partition key values
+                (e.g. region='EU')
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            start_time = time.perf_counter()
+            start_rss = start_peak_memory_window()
+            self.aggregates = None
+            self.filter_index = None
+            partitions = dataset.prune(**filters)
+            data, bounds = dataset.read(partitions)
+            if len(data) == 0:
+                display_error_message("No survey rows match the filters")
+                return False
+
+            self.data = data
+            self.partition_bounds = bounds
+            if filters:
+                # One scan: indexing rows about to be dropped would cost
+                # more than it saves
+                positions = np.flatnonzero(
+                    self._scan_mask(self._filter_conditions(filters))
+                )
+                self.partition_bounds = [
+                    (partition,
+                     *np.searchsorted(positions, [start, stop]).tolist())
+                    for partition, start, stop in bounds
+                ]
+                # As read() does: the selected rows may not use every
+                # category, nor have missing values in a nullable column
+                self.data = SURVEY_SCHEMA.compact(
+                    data.iloc[positions].reset_index(drop=True)
+                )
+
+            self._record_load_stats('dataset', start_time, start_rss)
+            self.load_stats['partitions'] = len(dataset.partitions)
+            self.load_stats['partitions_read'] = len(partitions)
+            self._generate_data_info()
+            display_success_message(
+                f"Successfully loaded {len(self.data)} records from "
+                f"{len(partitions)} of {len(dataset.partitions)} partitions"
+            )
+            return True
+
+        except Exception as e:
+            display_error_message(f"Error loading dataset: {str(e)}")
+            return False
+
+    def append(self, rows):
+        """
+        Append newly collected survey responses to the loaded data.
+
+        Only the new rows are cleaned; the existing data is left as is.
+        The rows are kept apart until the data is next used (see data),
+        and the fingerprint is chained from them (see chain_fingerprint).
+
+        Args:
+            rows (pd.DataFrame or list): New responses, as a DataFrame or
+                a list of dicts keyed by column name
+
+        Returns:
+            pd.DataFrame or None: The cleaned new rows (pass them to
+                FinanceAnalyzer.append), or None if they were rejected
+        """
+        if self._data is None:
+            display_error_message("No data loaded")
+            return None
+
+        try:
+            rows = pd.DataFrame(rows)
+            missing_columns = self._missing_required_columns(rows.columns)
+            if missing_columns:
+                display_error_message(
+                    f"Missing required columns: {missing_columns}")
+                return None
+
+            # Match the loaded columns and continue the row labels
+            last = self._appended[-1] if self._appended else self._data
+            start = last.index[-1] + 1 if len(last) else 0
+            rows = rows.reindex(columns=self._data.columns)
+            rows.index = pd.RangeIndex(start, start + len(rows))
+
+            cleaned = SURVEY_SCHEMA.compact(self._clean_frame(rows))
+            fingerprint = self._appended_fingerprint
+            if not self._appended:
+                # Checked before joining: unifying the categories
+                # rewrites (without changing the values of) the loaded
+                # categorical columns
+                if (self.filter_index is not None
+                        and not self.filter_index.describes(self._data)):
+                    self.filter_index = None
+                data_ref, fingerprint = self._fingerprint
+                if data_ref is None or data_ref() is not self._data:
+                    fingerprint = None
+
+            self._appended.append(shared_copy(cleaned))
+            if fingerprint is not None:
+                self._appended_fingerprint = chain_fingerprint(
+                    fingerprint, cleaned
+                )
+            self._update_data_info(cleaned)
+            # The load-time statistics no longer cover every row
+            self.aggregates = None
+            return cleaned
+
+        except Exception as e:
+            display_error_message(f"Error appending data: {str(e)}")
+            return None
+
+    def _load_csv_chunked(self, file_path, chunksize):
+        """
+        Stream a CSV file in chunks, cleaning each chunk as it arrives.
+
+        Only the cleaned chunks are kept, so the raw text frame for the
+        whole file is never held in memory alongside its copy. With a
+        quantile_error set, the analysis statistics are gathered from the
+        same chunks.
+
+        Args:
+            file_path (str): Path to the CSV file
+            chunksize (int): Number of rows per chunk
+
+        Returns:
+            bool: True if data structure is valid
+        """
+        columns = pd.read_csv(file_path, nrows=0).columns
+        missing_columns = self._missing_required_columns(columns)
+        if missing_columns:
+            display_error_message(
+                f"Missing required columns: {missing_columns}")
+            return False
+
+        try:
+            cleaned_chunks, raw_rows = self._clean_csv_chunks(
+                file_path, chunksize, SURVEY_SCHEMA.read_csv_kwargs(columns)
+            )
+        except (ValueError, TypeError):
+            # Some values do not fit the declared types; parse leniently
+            # and let _clean_frame coerce them
+            cleaned_chunks, raw_rows = self._clean_csv_chunks(
+                file_path, chunksize, {}
+            )
+
+        if raw_rows == 0:
+            display_error_message("CSV file is empty")
+            return False
+
+        self.data = SURVEY_SCHEMA.compact(
+            SURVEY_SCHEMA.concat(cleaned_chunks)
+        )
+        return True
+
+    def _clean_csv_chunks(self, file_path, chunksize, read_kwargs):
+        """
+        Read a CSV file chunk by chunk and clean each chunk.
+
+        Args:
+            file_path (str): Path to the CSV file
+            chunksize (int): Number of rows per chunk
+            read_kwargs (dict): Extra keyword arguments for pd.read_csv
+
+        Returns:
+            tuple: (list of cleaned chunks, number of raw rows read)
+        """
+        cleaned_chunks = []
+        raw_rows = 0
+        self.aggregates = None
+
+        for chunk in pd.read_csv(
+                file_path, chunksize=chunksize, **read_kwargs):
+            raw_rows += len(chunk)
+            cleaned = self._clean_frame(chunk)
+            cleaned_chunks.append(cleaned)
+
+            if self.quantile_error is not None and len(cleaned):
+                chunk_aggregates = SurveyAggregates(
+                    cleaned, quantile_error=self.quantile_error
+                )
+                if self.aggregates is None:
+                    self.aggregates = chunk_aggregates
+                else:
+                    self.aggregates.merge(chunk_aggregates)
+
+        return cleaned_chunks, raw_rows
+
+    def get_fingerprint(self):
+        """
+        Get the content fingerprint of the loaded data.
+
+        It is computed once per load (or reassignment of self.data) and
+        shared by the analyzer and visualizer cache keys; appends chain
+        it from the appended rows. Data edited in place must be
+        reassigned to get a new one.
+
+        Returns:
+            str or None: dataset_fingerprint of self.data, None if no
+                data is loaded
+        """
+        if self._data is None:
+            return None
+        if self._appended_fingerprint is not None:
+            return self._appended_fingerprint
+        data_ref, fingerprint = self._fingerprint
+        if data_ref is None or data_ref() is not self.data:
+            fingerprint = dataset_fingerprint(self.data)
+            self._fingerprint = (weakref.ref(self.data), fingerprint)
+        return fingerprint
+
+    def _record_load_stats(self, mode, start_time, start_rss=None):
+        """
+        Record throughput and memory figures for the last load.
+
+        peak_rss_mb is the process's peak RSS during the load where the
+        peak can be reset (Linux), and its lifetime high-water mark
+        otherwise; load_peak_mb, the growth over the RSS at the start
+        of the load, is only recorded in the first case.
+
+        Args:
+            mode (str): Load mode ('full', 'chunked' or 'cache')
+            start_time (float): perf_counter() value when loading started
+            start_rss (float): RSS in megabytes when loading started, as
+                returned by start_peak_memory_window()
+        """
+        elapsed = time.perf_counter() - start_time
+        peak_rss = get_peak_memory_mb()
+        self.load_stats = {
+            'mode': mode,
+            'rows': len(self.data),
+            'seconds': round(elapsed, 3),
+            'rows_per_sec': round(len(self.data) / elapsed)
+            if elapsed > 0 else None,
+            'peak_rss_mb': peak_rss,
+            'load_peak_mb': (
+                round(peak_rss - start_rss, 1)
+                if start_rss is not None and peak_rss is not None else None
+            )
+        }
+
+    def _missing_required_columns(self, columns):
+        """
+        Find required columns that are absent from a set of columns.
+
+        Args:
+            columns (iterable): Column names to check
+
+        Returns:
+            list: Names of missing required columns
+        """
+        return [col for col in REQUIRED_COLUMNS if col not in columns]
+
     def _validate_data_structure(self):
         """
         Validate that the CSV has required columns.
@@ -61,13 +473,7 @@ class DataHandler:
         Returns:
             bool: True if data structure is valid
         """
-        required_columns = [
-            'respondent_id', 'age', 'annual_income', 'monthly_savings',
-            'uses_mobile_banking', 'owns_crypto', 'primary_investment'
-        ]
-
-        missing_columns = [
-            col for col in required_columns if col not in self.data.columns]
+        missing_columns = self._missing_required_columns(self.data.columns)
 
         if missing_columns:
             display_error_message(
@@ -87,54 +493,34 @@ class DataHandler:
     def _clean_data(self):
         """Clean and preprocess the data."""
         try:
-            # Clean numeric columns
-            numeric_columns = [
-                'age',
-                'annual_income',
-                'monthly_savings',
-                'financial_literacy_score']
-            for col in numeric_columns:
-                if col in self.data.columns:
-                    self.data[col] = pd.to_numeric(
-                        self.data[col], errors='coerce')
-
-            # Clean spending columns if they exist
-            spending_columns = [
-                col for col in self.data.columns
-                if 'spending' in col.lower()
-            ]
-            for col in spending_columns:
-                self.data[col] = pd.to_numeric(
-                    self.data[col], errors='coerce'
-                )
-
-            # Clean yes/no columns - convert to True/False
-            yes_no_columns = ['uses_mobile_banking', 'owns_crypto']
-            for col in yes_no_columns:
-                if col in self.data.columns:
-                    self.data[col] = self.data[col].str.lower().map(
-                        {'yes': True, 'no': False})
-
-            # Remove rows with critical missing data
-            critical_columns = ['age', 'annual_income']
-            self.data = self.data.dropna(subset=critical_columns)
+            self.data = SURVEY_SCHEMA.compact(self._clean_frame(self.data))
 
         except Exception as e:
             display_error_message(f"Error cleaning data: {str(e)}")
 
+    def _clean_frame(self, data):
+        """
+        Clean and preprocess a frame of survey rows.
+
+        Args:
+            data (pd.DataFrame): Raw survey rows (whole file or one chunk)
+
+        Returns:
+            pd.DataFrame: Cleaned rows
+        """
+        return clean_frame(data)
+
     def _generate_data_info(self):
         """Generate summary information about the loaded data."""
         self.data_info = {
             'total_records': len(self.data),
             'columns_count': len(self.data.columns),
             'numeric_columns': list(
-                self.data.select_dtypes(
-                    include=['int64', 'float64']
-                ).columns
+                self.data.select_dtypes(include='number').columns
             ),
             'categorical_columns': list(
                 self.data.select_dtypes(
-                    include=['object', 'bool']
+                    include=['object', 'bool', 'boolean', 'category']
                 ).columns
             ),
             'age_range': (
@@ -146,6 +532,24 @@ class DataHandler:
             ) if 'annual_income' in self.data.columns else None
         }
 
+    def _update_data_info(self, rows):
+        """
+        Update summary information with appended rows.
+
+        Args:
+            rows (pd.DataFrame): Cleaned rows just appended to the data
+        """
+        self.data_info['total_records'] = (
+            self.data_info.get('total_records', 0) + len(rows)
+        )
+        for key, col in [('age_range', 'age'),
+                         ('income_range', 'annual_income')]:
+            if self.data_info.get(key) is not None and len(rows):
+                low, high = self.data_info[key]
+                self.data_info[key] = (
+                    min(low, rows[col].min()), max(high, rows[col].max())
+                )
+
     def get_data_summary(self):
         """
         Get a comprehensive summary of the loaded data.
@@ -212,6 +616,8 @@ class DataHandler:
         # Add investment preferences if available
         if 'primary_investment' in self.data.columns:
             investment_counts = self.data['primary_investment'].value_counts()
+            # Unused categories would otherwise be listed as zero
+            investment_counts = investment_counts[investment_counts > 0]
             summary["Investment Preferences"] = {
                 inv_type.title(): (
                     f"{count} ({count / len(self.data) * 100:.1f}%)"
@@ -225,6 +631,12 @@ class DataHandler:
         """
         Filter data based on provided criteria.
 
+        The criteria are looked up in the filter index (see select_rows)
+        and the matching rows are copied once. For data loaded from a
+        PartitionedDataset, partition keys (e.g. region='EU') can be used
+        as criteria. Rows with a missing value never match a criterion
+        on that column.
+
         Args:
             **kwargs: Filter criteria (e.g., min_age=25, max_income=100000)
 
@@ -234,52 +646,137 @@ class DataHandler:
         if self.data is None:
             return pd.DataFrame()
 
-        filtered_data = self.data.copy()
+        if not self._filter_conditions(kwargs):
+            self.last_filter_stats = {}
+            return self.data.copy()
 
-        try:
-            # Age filters
-            if 'min_age' in kwargs:
-                filtered_data = filtered_data[
-                    filtered_data['age'] >= kwargs['min_age']
-                ]
-            if 'max_age' in kwargs:
-                filtered_data = filtered_data[
-                    filtered_data['age'] <= kwargs['max_age']
-                ]
+        selection = self.select_rows(**kwargs)
+        if selection is None:
+            return self.data.copy()
+        return selection.to_frame()
 
-            # Income filters
-            if 'min_income' in kwargs:
-                filtered_data = filtered_data[
-                    filtered_data['annual_income'] >= kwargs['min_income']
-                ]
-            if 'max_income' in kwargs:
-                filtered_data = filtered_data[
-                    filtered_data['annual_income'] <= kwargs['max_income']
-                ]
+    def select_rows(self, **kwargs):
+        """
+        Select the rows matching filter criteria without copying them.
 
-            # Boolean filters
-            if 'uses_mobile_banking' in kwargs:
-                filtered_data = filtered_data[
-                    filtered_data['uses_mobile_banking'] ==
-                    kwargs['uses_mobile_banking']
-                ]
-            if 'owns_crypto' in kwargs:
-                filtered_data = filtered_data[
-                    filtered_data['owns_crypto'] == kwargs['owns_crypto']
-                ]
+        The first call builds a filter index of the loaded data: sorted
+        arrays of the range-filtered columns and bitmaps of the values
+        of the others. Each criterion is then a lookup, and the lookups
+        are combined with a bitmap AND, so repeated filters do not scan
+        the data. Rows appended after the index was built are scanned.
+        Without pandas copy-on-write, in-place edits of the data cannot
+        be detected, so every filter scans instead.
 
-            # Investment type filter
-            if 'investment_type' in kwargs:
-                filtered_data = filtered_data[
-                    filtered_data['primary_investment'] ==
-                    kwargs['investment_type']
-                ]
+        Args:
+            **kwargs: Criteria of filter_data
+
+        Returns:
+            RowSelection or None: The matching rows (use len(), positions
+                or to_frame()), or None if the filter failed
+        """
+        if self.data is None:
+            display_error_message("No data loaded")
+            return None
+
+        try:
+            conditions = self._filter_conditions(kwargs)
+            if not index_usable():
+                self.filter_index = None
+                self.last_filter_stats = {
+                    'rows': len(self.data),
+                    'rows_indexed': 0,
+                    'rows_scanned': len(self.data)
+                }
+                return RowSelection(
+                    self.data, np.packbits(self._scan_mask(conditions))
+                )
+
+            index = self._current_filter_index()
+            bitmap, unindexed = index.select(conditions)
+
+            scanned = len(self.data) - index.rows
+            if scanned or unindexed:
+                mask = np.empty(len(self.data), dtype=bool)
+                mask[:index.rows] = np.unpackbits(
+                    bitmap, count=index.rows
+                ).view(bool)
+                if unindexed:
+                    mask[:index.rows] &= self._scan_mask(
+                        unindexed, 0, index.rows
+                    )
+                    scanned = len(self.data)
+                mask[index.rows:] = self._scan_mask(conditions, index.rows)
+                bitmap = np.packbits(mask)
+
+            self.last_filter_stats = {
+                'rows': len(self.data),
+                'rows_indexed': index.rows,
+                'rows_scanned': scanned
+            }
+            return RowSelection(self.data, bitmap)
 
         except Exception as e:
             display_error_message(f"Error filtering data: {str(e)}")
-            return self.data.copy()
+            return None
 
-        return filtered_data
+    def _filter_conditions(self, filters):
+        """
+        Translate filter criteria into (column, compare, value) tuples.
+
+        Args:
+            filters (dict): Criteria of filter_data
+
+        Returns:
+            list: Conditions a matching row satisfies
+        """
+        return [
+            (column, compare, filters[name])
+            for name, (column, compare) in ROW_FILTERS.items()
+            if name in filters
+        ] + [
+            (key, operator.eq, str(filters[key]))
+            for key in self._partition_keys() if key in filters
+        ]
+
+    def _current_filter_index(self):
+        """Get the filter index of the loaded data, building it if needed."""
+        index = self.filter_index
+        if (index is None or not index.describes(self.data)
+                or len(self.data) - index.rows
+                > index.rows * INDEX_REBUILD_SHARE):
+            self.filter_index = index = FilterIndex(
+                self.data, RANGE_COLUMNS,
+                VALUE_COLUMNS + self._partition_keys()
+            )
+        return index
+
+    def _scan_mask(self, conditions, start=0, stop=None):
+        """
+        Evaluate conditions on a range of rows by scanning them.
+
+        Args:
+            conditions (list): (column, compare, value) tuples
+            start (int): First row position
+            stop (int): Row position after the last, defaults to the end
+
+        Returns:
+            np.ndarray: Bool mask of the rows in the range
+        """
+        if stop is None:
+            stop = len(self.data)
+        mask = np.ones(stop - start, dtype=bool)
+        for column, compare, value in conditions:
+            mask &= compare(
+                self.data[column].iloc[start:stop], value
+            ).to_numpy(dtype=bool, na_value=False)
+        return mask
+
+    def _partition_keys(self):
+        """Get the partition keys of data loaded from a dataset."""
+        return sorted({
+            key for partition, _, _ in self.partition_bounds
+            for key in partition.keys
+        })
 
     def get_data_validation_report(self):
         """
@@ -0,0 +1,324 @@
+"""
+Partitioned Dataset Module for Personal Finance Survey Analyzer.
+
+This module treats a directory of survey files as one dataset. Files are
+laid out in key=value directories, e.g.
+
+    surveys/wave=2026Q1/region=EU/part-0.csv
+    surveys/wave=2026Q1/region=US/part-0.parquet
+
+and each file is a partition whose keys become columns of the loaded
+data. Per-partition statistics (row count, min/max of the range-filtered
+columns and the distinct values of the others) are kept in a manifest,
+so filtered loads skip files that cannot hold a matching row.
+"""
+
+import hashlib
+import json
+import operator
+import os
+
+import numpy as np
+import pandas as pd
+from src.data_handler import (
+    RANGE_COLUMNS, REQUIRED_COLUMNS, ROW_FILTERS, VALUE_COLUMNS, clean_frame
+)
+from src.schema import SURVEY_SCHEMA
+
+
+FILE_EXTENSIONS = ('.csv', '.parquet')
+
+# Statistics computed by other cleaning code or for other columns are
+# recomputed
+STATS_VERSION = hashlib.sha256(json.dumps(
+    [SURVEY_SCHEMA.version, RANGE_COLUMNS, VALUE_COLUMNS]
+).encode('utf-8')).hexdigest()[:16]
+
+
+def _json_value(value):
+    """Convert a NumPy scalar to a JSON-compatible Python value."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+class Partition:
+    """One file of a partitioned dataset and its statistics."""
+
+    def __init__(self, path, keys, stats):
+        """
+        Initialize the partition.
+
+        Args:
+            path (str): Path of the file
+            keys (dict): Partition key values from the directory names
+            stats (dict): Row count, 'ranges' (column -> [min, max]) and
+                'values' (column -> distinct values) of the cleaned rows
+        """
+        self.path = path
+        self.keys = keys
+        self.stats = stats
+
+    @property
+    def rows(self):
+        """int: Cleaned rows in the partition."""
+        return self.stats['rows']
+
+    def may_match(self, filters):
+        """
+        Check whether any row of the partition can pass the filters.
+
+        Uses the criteria of DataHandler.filter_data, plus partition keys
+        (e.g. region='EU'). Unknown criteria never exclude anything.
+
+        Args:
+            filters (dict): Filter criteria
+
+        Returns:
+            bool: False only if no row can match
+        """
+        if self.rows == 0:
+            return False
+
+        for name, value in filters.items():
+            if name in self.keys:
+                if self.keys[name] != str(value):
+                    return False
+            elif name in ROW_FILTERS:
+                column, compare = ROW_FILTERS[name]
+                if compare is operator.eq:
+                    values = self.stats['values'].get(column)
+                    if values is not None and value not in values:
+                        return False
+                    continue
+                low, high = self.stats['ranges'].get(column, (None, None))
+                if low is None:
+                    return False
+                # Some row must lie on the kept side of the bound
+                extreme = high if compare is operator.ge else low
+                if not compare(extreme, value):
+                    return False
+        return True
+
+
+class PartitionedDataset:
+    """Survey dataset stored as key=value partitioned CSV/Parquet files."""
+
+    def __init__(self, root, cache=None, stats_dir='.cache/dataset_stats'):
+        """
+        Discover the partitions under a directory.
+
+        Statistics of new or changed files are computed here, reading
+        only the columns they cover, and saved for the next run.
+
+        Args:
+            root (str): Dataset directory
+            cache (SurveyDataCache): Optional cache of cleaned CSV
+                partitions, so repeat reads skip parsing
+            stats_dir (str): Directory of the statistics manifests
+
+        Raises:
+            FileNotFoundError: If root is not a directory
+        """
+        if not os.path.isdir(root):
+            raise FileNotFoundError(f"Dataset directory not found: {root}")
+
+        self.root = root
+        self.cache = cache
+        self.stats_dir = stats_dir
+        self.partitions = self._discover()
+        self.partition_keys = sorted(
+            {key for partition in self.partitions for key in partition.keys}
+        )
+
+    def _manifest_path(self):
+        """Get the path of this dataset's statistics manifest."""
+        name = hashlib.sha256(
+            os.path.abspath(self.root).encode('utf-8')
+        ).hexdigest()[:16]
+        return os.path.join(self.stats_dir, f"{name}.json")
+
+    def _discover(self):
+        """Find the partition files and load or compute their stats."""
+        manifest_path = self._manifest_path()
+        try:
+            with open(manifest_path, encoding='utf-8') as manifest_file:
+                manifest = json.load(manifest_file)
+        except (OSError, ValueError):
+            manifest = {}
+
+        partitions = []
+        updated = {}
+        for directory, subdirectories, files in os.walk(self.root):
+            # Walk partitions in a stable order
+            subdirectories.sort()
+            relative_dir = os.path.relpath(directory, self.root)
+            keys = dict(
+                part.split('=', 1)
+                for part in relative_dir.split(os.sep) if '=' in part
+            )
+            for name in sorted(files):
+                if not name.endswith(FILE_EXTENSIONS):
+                    continue
+                path = os.path.join(directory, name)
+                relative_path = os.path.relpath(path, self.root)
+                status = os.stat(path)
+                signature = [
+                    status.st_size, status.st_mtime_ns, STATS_VERSION
+                ]
+
+                entry = manifest.get(relative_path)
+                if entry is None or entry['signature'] != signature:
+                    entry = {
+                        'signature': signature,
+                        'stats': self._compute_stats(path)
+                    }
+                updated[relative_path] = entry
+                partitions.append(Partition(path, keys, entry['stats']))
+
+        if updated != manifest:
+            os.makedirs(self.stats_dir, exist_ok=True)
+            with open(manifest_path, 'w', encoding='utf-8') as manifest_file:
+                json.dump(updated, manifest_file)
+        return partitions
+
+    def _compute_stats(self, path):
+        """Compute a partition's statistics from its cleaned rows."""
+        data = clean_frame(self._read_file(
+            path, columns=RANGE_COLUMNS + VALUE_COLUMNS
+        ))
+        stats = {'rows': len(data), 'ranges': {}, 'values': {}}
+        for column in RANGE_COLUMNS:
+            if column in data.columns and data[column].notna().any():
+                stats['ranges'][column] = [
+                    _json_value(data[column].min()),
+                    _json_value(data[column].max())
+                ]
+        for column in VALUE_COLUMNS:
+            if column in data.columns:
+                stats['values'][column] = sorted(
+                    _json_value(value)
+                    for value in data[column].dropna().unique()
+                )
+        return stats
+
+    def _read_file(self, path, columns=None):
+        """
+        Read a partition file, parsing into schema types where possible.
+
+        Args:
+            path (str): CSV or Parquet file
+            columns (list): Only read these columns, if present
+
+        Returns:
+            pd.DataFrame: Raw rows
+        """
+        if path.endswith('.parquet'):
+            if columns is not None:
+                # Imported here: only needed to list the columns
+                import pyarrow.parquet as pq
+                present = pq.read_schema(path).names
+                columns = [col for col in columns if col in present]
+            return pd.read_parquet(path, columns=columns)
+
+        header = pd.read_csv(path, nrows=0).columns
+        if columns is not None:
+            header = [col for col in header if col in columns]
+        kwargs = {'usecols': list(header)} if columns is not None else {}
+        try:
+            return pd.read_csv(
+                path, **kwargs, **SURVEY_SCHEMA.read_csv_kwargs(header)
+            )
+        except (ValueError, TypeError):
+            # Some values do not fit the declared types; parse leniently
+            # and let clean_frame coerce them
+            return pd.read_csv(path, **kwargs)
+
+    def prune(self, **filters):
+        """
+        Get the partitions that may hold rows matching the filters.
+
+        Args:
+            **filters: Criteria of DataHandler.filter_data, or partition
+                key values (e.g. wave='2026Q1')
+
+        Returns:
+            list: Partition objects that cannot be ruled out
+        """
+        return [
+            partition for partition in self.partitions
+            if partition.may_match(filters)
+        ]
+
+    def read(self, partitions=None):
+        """
+        Read and clean partitions into one frame.
+
+        Partition keys are added as categorical columns and the rows are
+        numbered from 0, in partition order.
+
+        Args:
+            partitions (list): Partitions to read, defaults to all
+
+        Returns:
+            tuple: (pd.DataFrame, list of (Partition, start, stop) row
+                positions of each partition in the frame)
+
+        Raises:
+            ValueError: If a partition lacks required columns
+        """
+        if partitions is None:
+            partitions = self.partitions
+
+        frames = []
+        bounds = []
+        start = 0
+        for partition in partitions:
+            data = self._read_partition(partition)
+            for key in self.partition_keys:
+                data[key] = partition.keys.get(key)
+            frames.append(data)
+            bounds.append((partition, start, start + len(data)))
+            start += len(data)
+
+        if not frames:
+            return pd.DataFrame(columns=REQUIRED_COLUMNS), bounds
+
+        data = SURVEY_SCHEMA.concat(frames).reset_index(drop=True)
+        for key in self.partition_keys:
+            data[key] = data[key].astype('category')
+        return SURVEY_SCHEMA.compact(data), bounds
+
+    def _read_partition(self, partition):
+        """Read and clean one partition, using the cache for CSV files."""
+        use_cache = (
+            self.cache is not None and self.cache.available
+            and partition.path.endswith('.csv')
+        )
+        if use_cache:
+            data = self.cache.load(partition.path)
+            if data is not None:
+                return data
+
+        data = self._read_file(partition.path)
+        missing = [col for col in REQUIRED_COLUMNS if col not in data.columns]
+        if missing:
+            raise ValueError(
+                f"{partition.path} is missing required columns: {missing}"
+            )
+        data = SURVEY_SCHEMA.compact(clean_frame(data))
+
+        if use_cache:
+            self.cache.store(partition.path, data)
+        return data
+
+    def get_stats(self):
+        """
+        Get a summary of the dataset.
+
+        Returns:
+            dict: Partition and row counts, and the partition keys
+        """
+        return {
+            'partitions': len(self.partitions),
+            'rows': sum(partition.rows for partition in self.partitions),
+            'partition_keys': self.partition_keys
+        }
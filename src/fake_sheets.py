@@ -0,0 +1,557 @@
+"""
+Fake Sheets Service Module for Personal Finance Survey Analyzer.
+
+This module provides an in-process stand-in for the Google Sheets API
+that GoogleSheetsHandler can use as its backend. It implements the
+subset of the gspread client, spreadsheet and worksheet interfaces the
+handler calls, with configurable latency, per-minute quotas and error
+rates, so the Sheets code paths can be benchmarked and checked offline
+and reproducibly.
+
+Run it as a module to benchmark the handler against the fake service:
+
+    python -m src.fake_sheets [survey.csv]
+"""
+
+import collections
+import json
+import math
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import gspread
+import pandas as pd
+import requests
+from gspread.utils import a1_range_to_grid_range
+
+
+def _api_error(status, message):
+    """Build the gspread APIError the live service would cause."""
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps({
+        'error': {'code': status, 'message': message, 'status': message}
+    }).encode('utf-8')
+    return gspread.exceptions.APIError(response)
+
+
+def _sent(payload):
+    """
+    Encode a request payload the way gspread sends it.
+
+    requests serializes JSON bodies with allow_nan=False, so values the
+    live API cannot receive (NaN, pd.NA, NumPy scalars) fail here the
+    same way, before any request is made.
+
+    Args:
+        payload: Request body or values
+
+    Returns:
+        The payload as the service decodes it
+
+    Raises:
+        TypeError: For values JSON cannot encode
+        ValueError: For NaN or infinite floats
+    """
+    return json.loads(json.dumps(payload, allow_nan=False))
+
+
+def _format_value(value):
+    """Format a written value the way Sheets displays it."""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ''
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _cell_value(cell):
+    """Get the value of Sheets API CellData."""
+    entered = cell.get('userEnteredValue', {})
+    return next(iter(entered.values()), None)
+
+
+class FakeSheetsService:
+    """In-process Sheets service with injectable latency and failures."""
+
+    def __init__(self, latency=0.0, latency_per_cell=0.0, read_quota=None,
+                 write_quota=None, error_rate=0.0, seed=0):
+        """
+        Initialize an empty service.
+
+        Args:
+            latency (float): Seconds added to every request
+            latency_per_cell (float): Seconds added per cell sent or
+                received, to model transfer time
+            read_quota (int): Read requests allowed per rolling minute
+                before answering 429, None for no limit
+            write_quota (int): Write requests allowed per rolling minute
+            error_rate (float): Fraction of requests failing with 503
+            seed (int): Seed for the injected errors, so runs repeat
+        """
+        self.latency = latency
+        self.latency_per_cell = latency_per_cell
+        self.quotas = {'read': read_quota, 'write': write_quota}
+        self.error_rate = error_rate
+        self.spreadsheets = {}
+        self.requests = collections.Counter()
+        self.cells = collections.Counter()
+        self.rejected = collections.Counter()
+        self._windows = {'read': collections.deque(),
+                         'write': collections.deque()}
+        self._rng = random.Random(seed)
+        self._version = 0
+        self._lock = threading.RLock()
+
+    def authorize(self, credentials_file=None):
+        """
+        Get a client for the service (backend interface).
+
+        Args:
+            credentials_file (str): Ignored; no credentials are needed
+
+        Returns:
+            FakeClient: Client bound to this service
+        """
+        return FakeClient(self)
+
+    def add_spreadsheet(self, title, worksheets=None):
+        """
+        Create a spreadsheet without going through the API.
+
+        Args:
+            title (str): Spreadsheet title
+            worksheets (dict): Worksheet name to DataFrame (written with
+                its header row) or list of rows
+
+        Returns:
+            FakeSpreadsheet: The new spreadsheet
+        """
+        spreadsheet = FakeSpreadsheet(self, title)
+        for name, data in (worksheets or {}).items():
+            if isinstance(data, pd.DataFrame):
+                data = [data.columns.tolist()] + data.values.tolist()
+            worksheet = spreadsheet._add(name, len(data) + 100, 26)
+            worksheet._write(0, 0, data)
+        with self._lock:
+            self.spreadsheets[title] = spreadsheet
+        return spreadsheet
+
+    def request(self, kind, name):
+        """
+        Admit one API request or fail it like the live service.
+
+        Args:
+            kind (str): 'read' or 'write'
+            name (str): API method, for the request counters
+
+        Raises:
+            gspread.exceptions.APIError: 429 when over quota, 503 for an
+                injected error
+        """
+        with self._lock:
+            quota = self.quotas[kind]
+            if quota is not None:
+                window = self._windows[kind]
+                now = time.monotonic()
+                while window and now - window[0] >= 60:
+                    window.popleft()
+                if len(window) >= quota:
+                    self.rejected['quota'] += 1
+                    raise _api_error(429, 'RESOURCE_EXHAUSTED')
+                window.append(now)
+
+            if self.error_rate and self._rng.random() < self.error_rate:
+                self.rejected['error'] += 1
+                raise _api_error(503, 'UNAVAILABLE')
+
+            self.requests[name] += 1
+
+        if self.latency:
+            time.sleep(self.latency)
+
+    def transfer(self, kind, cells):
+        """Count cells sent or received and wait for their transfer."""
+        with self._lock:
+            self.cells[kind] += cells
+        if self.latency_per_cell and cells:
+            time.sleep(self.latency_per_cell * cells)
+
+    def modified(self):
+        """Record a write and return the new modification time."""
+        with self._lock:
+            self._version += 1
+            return self.modified_time()
+
+    def modified_time(self):
+        """Get the modification time, advancing 1 ms per write."""
+        stamp = datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(
+            milliseconds=self._version
+        )
+        return stamp.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+
+    def stats(self):
+        """
+        Get request figures since the service was created.
+
+        Returns:
+            dict: Requests per API method, cells read and written, and
+                requests rejected by quota or injected errors
+        """
+        with self._lock:
+            return {
+                'requests': dict(self.requests),
+                'total_requests': sum(self.requests.values()),
+                'cells': dict(self.cells),
+                'rejected': dict(self.rejected)
+            }
+
+
+class FakeClient:
+    """gspread.Client stand-in."""
+
+    def __init__(self, service):
+        """
+        Initialize the client.
+
+        Args:
+            service (FakeSheetsService): Service the client talks to
+        """
+        self.service = service
+
+    def open(self, title):
+        """Open a spreadsheet by title."""
+        self.service.request('read', 'open')
+        with self.service._lock:
+            if title not in self.service.spreadsheets:
+                raise gspread.exceptions.SpreadsheetNotFound(title)
+            return self.service.spreadsheets[title]
+
+    def create(self, title):
+        """Create a spreadsheet with one empty worksheet."""
+        self.service.request('write', 'create')
+        spreadsheet = FakeSpreadsheet(self.service, title)
+        spreadsheet._add('Sheet1', 1000, 26)
+        with self.service._lock:
+            self.service.spreadsheets[title] = spreadsheet
+        return spreadsheet
+
+
+class FakeSpreadsheet:
+    """gspread.Spreadsheet stand-in."""
+
+    def __init__(self, service, title):
+        """
+        Initialize an empty spreadsheet.
+
+        Args:
+            service (FakeSheetsService): Service holding the spreadsheet
+            title (str): Spreadsheet title
+        """
+        self.service = service
+        self.title = title
+        self.id = f"fake-{len(service.spreadsheets) + 1}"
+        self.url = f"https://docs.google.com/spreadsheets/d/{self.id}"
+        self._worksheets = []
+        self._modified = service.modified_time()
+
+    def _add(self, title, rows, cols):
+        """Add a worksheet without an API request."""
+        worksheet = FakeWorksheet(
+            self, title, len(self._worksheets), rows, cols
+        )
+        self._worksheets.append(worksheet)
+        return worksheet
+
+    def _touch(self):
+        """Mark the spreadsheet as modified."""
+        self._modified = self.service.modified()
+
+    def worksheet(self, title):
+        """Get a worksheet by title."""
+        self.service.request('read', 'worksheet')
+        for worksheet in self._worksheets:
+            if worksheet.title == title:
+                return worksheet
+        raise gspread.exceptions.WorksheetNotFound(title)
+
+    def worksheets(self):
+        """Get every worksheet."""
+        self.service.request('read', 'worksheets')
+        return list(self._worksheets)
+
+    def get_worksheet(self, index):
+        """Get a worksheet by position."""
+        self.service.request('read', 'get_worksheet')
+        return self._worksheets[index]
+
+    @property
+    def sheet1(self):
+        """The first worksheet."""
+        return self.get_worksheet(0)
+
+    def add_worksheet(self, title, rows, cols):
+        """Add a worksheet."""
+        self.service.request('write', 'add_worksheet')
+        if any(ws.title == title for ws in self._worksheets):
+            raise _api_error(400, f"A sheet named '{title}' exists")
+        self._touch()
+        return self._add(title, rows, cols)
+
+    def batch_update(self, body):
+        """Apply spreadsheet batch requests (appendCells only)."""
+        body = _sent(body)
+        self.service.request('write', 'batch_update')
+        by_id = {ws.id: ws for ws in self._worksheets}
+        for request in body['requests']:
+            if set(request) != {'appendCells'}:
+                raise _api_error(400, f"Unsupported request {request}")
+            append = request['appendCells']
+            rows = [
+                [_cell_value(cell) for cell in row['values']]
+                for row in append['rows']
+            ]
+            by_id[append['sheetId']]._append(rows)
+        self._touch()
+        return {'replies': [{} for _ in body['requests']]}
+
+    def get_lastUpdateTime(self):
+        """Get the modification time, as the Drive API reports it."""
+        self.service.request('read', 'get_lastUpdateTime')
+        return self._modified
+
+
+class FakeWorksheet:
+    """gspread.Worksheet stand-in holding formatted cell values."""
+
+    def __init__(self, spreadsheet, title, sheet_id, rows, cols):
+        """
+        Initialize an empty worksheet.
+
+        Args:
+            spreadsheet (FakeSpreadsheet): Parent spreadsheet
+            title (str): Worksheet title
+            sheet_id (int): Worksheet ID
+            rows (int): Grid rows
+            cols (int): Grid columns
+        """
+        self.spreadsheet = spreadsheet
+        self.service = spreadsheet.service
+        self.title = title
+        self.id = sheet_id
+        self.row_count = rows
+        self.col_count = cols
+        self._cells = []
+
+    def _bounds(self, range_name):
+        """Get 0-based (row, col, end row, end col) of an A1 range."""
+        grid = a1_range_to_grid_range(range_name)
+        return (
+            grid.get('startRowIndex', 0),
+            grid.get('startColumnIndex', 0),
+            grid.get('endRowIndex', self.row_count),
+            grid.get('endColumnIndex', self.col_count)
+        )
+
+    def _write(self, row, col, values):
+        """Write rows of values at a position, growing the grid."""
+        with self.service._lock:
+            for offset, values_row in enumerate(values):
+                index = row + offset
+                while len(self._cells) <= index:
+                    self._cells.append([])
+                cells = self._cells[index]
+                if len(cells) < col + len(values_row):
+                    cells.extend([''] * (col + len(values_row) - len(cells)))
+                cells[col:col + len(values_row)] = map(
+                    _format_value, values_row
+                )
+                self.col_count = max(self.col_count, len(cells))
+            self.row_count = max(self.row_count, len(self._cells))
+        self.service.transfer('write', sum(map(len, values)))
+
+    def _append(self, rows):
+        """Write rows after the last row holding a value."""
+        with self.service._lock:
+            last = len(self._cells)
+            while last and not any(self._cells[last - 1]):
+                last -= 1
+            self._write(last, 0, rows)
+
+    def get_values(self, range_name=None):
+        """Get formatted values, padded to a rectangle like gspread."""
+        self.service.request('read', 'get_values')
+        row, col, end_row, end_col = (
+            self._bounds(range_name) if range_name
+            else (0, 0, self.row_count, self.col_count)
+        )
+        with self.service._lock:
+            rows = [
+                cells[col:end_col] for cells in self._cells[row:end_row]
+            ]
+        while rows and not any(rows[-1]):
+            rows.pop()
+        width = max(
+            (len(r) - next(
+                (i for i, v in enumerate(reversed(r)) if v), len(r)
+            ) for r in rows),
+            default=0
+        )
+        rows = [r[:width] + [''] * (width - len(r)) for r in rows]
+        self.service.transfer('read', sum(map(len, rows)))
+        return rows
+
+    def get_all_values(self):
+        """Get every formatted value."""
+        return self.get_values()
+
+    def update(self, range_name, values=None):
+        """Write values starting at the range's top-left cell."""
+        if not isinstance(range_name, str):
+            # gspread 6 also takes (values, range_name)
+            range_name, values = values, range_name
+        values = _sent(values)
+        self.service.request('write', 'update')
+        row, col, _, _ = self._bounds(range_name or 'A1')
+        self._write(row, col, values)
+        self.spreadsheet._touch()
+
+    def batch_update(self, data):
+        """Write several ranges in one request."""
+        data = _sent(data)
+        self.service.request('write', 'values_batch_update')
+        for update in data:
+            row, col, _, _ = self._bounds(update['range'])
+            self._write(row, col, update['values'])
+        self.spreadsheet._touch()
+
+    def batch_clear(self, ranges):
+        """Clear several ranges in one request."""
+        self.service.request('write', 'batch_clear')
+        with self.service._lock:
+            for range_name in ranges:
+                row, col, end_row, end_col = self._bounds(range_name)
+                for cells in self._cells[row:end_row]:
+                    cells[col:end_col] = [''] * len(cells[col:end_col])
+        self.spreadsheet._touch()
+
+    def clear(self):
+        """Clear every value."""
+        self.service.request('write', 'clear')
+        with self.service._lock:
+            self._cells = []
+        self.spreadsheet._touch()
+
+    def append_rows(self, values, **kwargs):
+        """Append rows after the last row holding a value."""
+        values = _sent(values)
+        self.service.request('write', 'append_rows')
+        self._append(values)
+        self.spreadsheet._touch()
+
+    def append_row(self, values, **kwargs):
+        """Append one row after the last row holding a value."""
+        values = _sent(values)
+        self.service.request('write', 'append_row')
+        self._append([values])
+        self.spreadsheet._touch()
+
+    def resize(self, rows=None, cols=None):
+        """Change the grid size, dropping values outside it."""
+        self.service.request('write', 'resize')
+        with self.service._lock:
+            if rows is not None:
+                self.row_count = rows
+                del self._cells[rows:]
+            if cols is not None:
+                self.col_count = cols
+                for cells in self._cells:
+                    del cells[cols:]
+        self.spreadsheet._touch()
+
+    def update_title(self, title):
+        """Rename the worksheet."""
+        self.service.request('write', 'update_title')
+        self.title = title
+        self.spreadsheet._touch()
+
+
+def run_benchmark(data, latency=0.05, latency_per_cell=2e-6, quota=None,
+                  error_rate=0.0, seed=0):
+    """
+    Time the handler's Sheets paths against a fake service.
+
+    Args:
+        data (pd.DataFrame): Survey rows seeded into the 'survey_data'
+            worksheet
+        latency (float): Seconds added to every request
+        latency_per_cell (float): Seconds added per cell transferred
+        quota (int): Read and write requests per minute, None for none;
+            the handler's rate limiter is set to the same quota
+        error_rate (float): Fraction of requests failing with 503
+        seed (int): Seed for the injected errors
+
+    Returns:
+        dict: Seconds taken by each step, and the service stats
+    """
+    # Imported here: the handler module imports this one's consumers
+    from src.cache import SheetSyncCache
+    from src.google_sheets_handler import GoogleSheetsHandler
+    from src.session_logger import SessionLogger
+    from src.sheets_api import SheetsApiCaller
+    import tempfile
+
+    service = FakeSheetsService(
+        latency=latency, latency_per_cell=latency_per_cell,
+        read_quota=quota, write_quota=quota, error_rate=error_rate,
+        seed=seed
+    )
+    service.add_spreadsheet('Benchmark', {'survey_data': data})
+    api = SheetsApiCaller(
+        requests_per_minute=quota or 60_000, base_delay=0.05, max_delay=1
+    )
+    timings = {}
+
+    with tempfile.TemporaryDirectory() as sync_dir:
+        handler = GoogleSheetsHandler(
+            backend=service, api=api, sync_cache=SheetSyncCache(sync_dir)
+        )
+        steps = [
+            ('connect', handler.connect),
+            ('open', lambda: handler.open_spreadsheet('Benchmark')),
+            ('load', lambda: handler.load_survey_data(delta=True)),
+            ('load_unchanged', lambda: handler.load_survey_data(delta=True)),
+            ('export_full', lambda: handler.export_dataframe_to_sheets(
+                data, 'export', delta=True)),
+            ('export_delta', lambda: handler.export_dataframe_to_sheets(
+                data.iloc[::-1].iloc[::-1], 'export', delta=True)),
+        ]
+        for name, step in steps:
+            start_time = time.perf_counter()
+            step()
+            timings[name] = round(time.perf_counter() - start_time, 3)
+
+        logger = SessionLogger(handler)
+        start_time = time.perf_counter()
+        for number in range(100):
+            logger.log('benchmark', f"Action {number}")
+        timings['log_100_enqueue'] = round(
+            time.perf_counter() - start_time, 4
+        )
+        logger.close()
+        timings['log_100_total'] = round(time.perf_counter() - start_time, 3)
+        handler.close_connection()
+
+    return {'timings': timings, 'service': service.stats(),
+            'api': api.stats()}
+
+
+if __name__ == '__main__':
+    source = sys.argv[1] if len(sys.argv) > 1 else 'data/sample_survey.csv'
+    results = run_benchmark(pd.read_csv(source))
+    print(json.dumps(results, indent=2))
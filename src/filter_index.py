@@ -0,0 +1,386 @@
+"""
+Filter Index Module for Personal Finance Survey Analyzer.
+
+This module indexes the cleaned survey data so that repeated filters do
+not rescan it. Range-filtered columns (age, income) are kept as sorted
+arrays, and equality-filtered columns (yes/no answers, investment type)
+as one bitmap per value. A filter looks its criteria up in the index,
+ANDs the resulting bitmaps and returns a RowSelection, which refers to
+the matching rows without copying them.
+
+Bitmaps are packed, one bit per row, in the layout of np.packbits.
+
+The index holds a view of every column it indexed. Under copy-on-write,
+writing to such a column, even in place with .loc, gives the frame a
+new array for it, so the index can tell that it no longer describes the
+data. Without copy-on-write such writes cannot be seen, and no index is
+trusted (see index_usable).
+"""
+
+import math
+import operator
+import weakref
+
+import numpy as np
+import pandas as pd
+
+from src.utils import copy_on_write_enabled
+
+
+# Prefix bitmaps kept per range column; a range lookup sets the bits of
+# at most len(data) / (2 * RANGE_BINS) rows on top of one of them
+RANGE_BINS = 32
+
+
+def _flip_bits(bitmap, positions):
+    """
+    Flip the bits of rows in a packed bitmap, in place.
+
+    Args:
+        bitmap (np.ndarray): Packed bitmap (uint8)
+        positions (np.ndarray): Distinct row positions
+    """
+    positions = positions.astype(np.intp, copy=False)
+    np.bitwise_xor.at(
+        bitmap, positions >> 3,
+        (np.uint8(128) >> (positions & 7)).astype(np.uint8)
+    )
+
+
+def index_usable():
+    """
+    Check whether writes to indexed columns can be detected.
+
+    Returns:
+        bool: True if pandas copy-on-write is enabled
+    """
+    return copy_on_write_enabled()
+
+
+def _column_values(column):
+    """
+    Get the array holding a column's values, without copying.
+
+    Args:
+        column (pd.Series): Column of a frame
+
+    Returns:
+        np.ndarray or ExtensionArray: Values of the column
+    """
+    if isinstance(column.dtype, pd.api.extensions.ExtensionDtype):
+        return column.array
+    return column.to_numpy()
+
+
+def _same_values(column, other):
+    """
+    Check whether two columns are backed by the same array.
+
+    Args:
+        column (pd.Series): Column of a frame
+        other (pd.Series): Column of a frame
+
+    Returns:
+        bool: True if neither was written since one was taken from the
+            other (or both from the same frame)
+    """
+    values, other_values = _column_values(column), _column_values(other)
+    if isinstance(values, np.ndarray) and isinstance(
+            other_values, np.ndarray):
+        return (values.__array_interface__['data'][0]
+                == other_values.__array_interface__['data'][0])
+    return values is other_values
+
+
+class SortedIndex:
+    """Sorted values of one column, with prefix bitmaps at bin edges."""
+
+    def __init__(self, values, bins=RANGE_BINS):
+        """
+        Sort a column and build its prefix bitmaps.
+
+        Args:
+            values (np.ndarray): Column values, NaN for missing
+            bins (int): Number of bins between the prefix bitmaps
+        """
+        # Radix sort for whole numbers; ties may come in any order
+        order = np.argsort(
+            values, kind='stable' if values.dtype.kind in 'iub' else None
+        )
+        if values.dtype.kind == 'f':
+            # NaN sorts last and never matches a range
+            present = len(values) - int(np.isnan(values).sum())
+        else:
+            present = len(values)
+        position_type = np.int32 if len(values) < 2 ** 31 else np.int64
+        self.order = order[:present].astype(position_type)
+        self.sorted_values = values[self.order]
+
+        # prefixes[k] has the rows at sorted positions < edges[k]
+        self.edges = np.linspace(0, present, bins + 1).astype(np.intp)
+        self.prefixes = np.empty(
+            (bins + 1, (len(values) + 7) // 8), dtype=np.uint8
+        )
+        mask = np.zeros(len(values), dtype=bool)
+        for k, edge in enumerate(self.edges):
+            if k:
+                mask[self.order[self.edges[k - 1]:edge]] = True
+            self.prefixes[k] = np.packbits(mask)
+
+    def _position(self, value, side):
+        """
+        Find the sorted position of a bound.
+
+        The search is done in the column's own type, as a pandas
+        comparison would: converting the bound makes NumPy cast the
+        whole column instead.
+
+        Args:
+            value: Bound
+            side (str): 'left' for a lower bound, 'right' for an upper
+
+        Returns:
+            int: Sorted position
+        """
+        values = self.sorted_values
+        if value != value:
+            # NaN matches nothing
+            return len(values) if side == 'left' else 0
+        if values.dtype.kind in 'iu':
+            info = np.iinfo(values.dtype)
+            if value < info.min:
+                return 0
+            if value > info.max:
+                return len(values)
+            # Whole numbers: round a fractional bound inwards
+            value = math.ceil(value) if side == 'left' else math.floor(value)
+        return int(np.searchsorted(
+            values, values.dtype.type(value), side=side
+        ))
+
+    def bounds(self, low=None, high=None):
+        """
+        Find the sorted positions of values within inclusive bounds.
+
+        Args:
+            low: Smallest value kept, None for no lower bound
+            high: Largest value kept, None for no upper bound
+
+        Returns:
+            tuple: (start, stop) sorted positions
+        """
+        start, stop = 0, len(self.sorted_values)
+        if low is not None:
+            start = self._position(low, 'left')
+        if high is not None:
+            stop = self._position(high, 'right')
+        return start, max(start, stop)
+
+    def bitmap(self, start, stop):
+        """
+        Get the rows at sorted positions [start, stop) as a bitmap.
+
+        Args:
+            start (int): First sorted position
+            stop (int): Sorted position after the last
+
+        Returns:
+            np.ndarray: Packed bitmap
+        """
+        if start == stop:
+            return np.zeros(self.prefixes.shape[1], dtype=np.uint8)
+
+        # Start from the bin edges nearest the bounds and flip the rows
+        # between each edge and its bound
+        low_edge, high_edge = (
+            int(np.abs(self.edges - position).argmin())
+            for position in (start, stop)
+        )
+        bitmap = self.prefixes[high_edge] ^ self.prefixes[low_edge]
+        for edge, position in ((low_edge, start), (high_edge, stop)):
+            edge_position = self.edges[edge]
+            _flip_bits(bitmap, self.order[
+                min(edge_position, position):max(edge_position, position)
+            ])
+        return bitmap
+
+
+class FilterIndex:
+    """Sorted and bitmap indexes over the filter columns of survey data."""
+
+    def __init__(self, data, range_columns, value_columns, bins=RANGE_BINS):
+        """
+        Build the indexes of a survey frame.
+
+        Columns missing from the frame are not indexed.
+
+        Args:
+            data (pd.DataFrame): Cleaned survey data
+            range_columns (list): Columns filtered by >= and <=
+            value_columns (list): Columns filtered by ==
+            bins (int): Prefix bitmaps kept per range column
+        """
+        self.rows = len(data)
+        self._data = weakref.ref(data)
+        self._columns = {}
+
+        self.ranges = {}
+        for column in range_columns:
+            if column in data.columns:
+                values = data[column]
+                if isinstance(values.dtype, pd.api.extensions.ExtensionDtype):
+                    values = values.to_numpy(dtype='float64', na_value=np.nan)
+                else:
+                    values = values.to_numpy()
+                self.ranges[column] = SortedIndex(values, bins)
+                self._columns[column] = data[column]
+
+        # Missing values are in no bitmap, so they never match
+        self._empty = np.zeros((self.rows + 7) // 8, dtype=np.uint8)
+        self.values = {}
+        for column in value_columns:
+            if column in data.columns:
+                codes, uniques = pd.factorize(data[column])
+                self.values[column] = {
+                    value: np.packbits(codes == code)
+                    for code, value in enumerate(uniques.tolist())
+                }
+                self._columns[column] = data[column]
+
+    def describes(self, data):
+        """
+        Check whether the index was built for, or tracks, a frame.
+
+        Besides being the same frame, none of the indexed columns may
+        have been written since, e.g. with data.loc[rows, 'age'] = 75.
+        Without copy-on-write that cannot be told, so it is never true.
+
+        Args:
+            data (pd.DataFrame): Survey data
+
+        Returns:
+            bool: True if the index covers the first self.rows rows
+        """
+        return index_usable() and self._data() is data and all(
+            column in data.columns and _same_values(data[column], held)
+            for column, held in self._columns.items()
+        )
+
+    def track(self, data):
+        """
+        Follow a frame whose first self.rows rows are the indexed ones.
+
+        Used when rows are appended: the index keeps covering the
+        original rows and filters scan the new ones.
+
+        Args:
+            data (pd.DataFrame): Survey data with the appended rows
+        """
+        self._data = weakref.ref(data)
+        self._columns = {column: data[column] for column in self._columns}
+
+    @property
+    def nbytes(self):
+        """int: Memory held by the indexes."""
+        total = 0
+        for index in self.ranges.values():
+            total += (index.order.nbytes + index.sorted_values.nbytes
+                      + index.prefixes.nbytes)
+        for bitmaps in self.values.values():
+            total += sum(bitmap.nbytes for bitmap in bitmaps.values())
+        return total
+
+    def select(self, conditions):
+        """
+        AND the index lookups of filter conditions.
+
+        Args:
+            conditions (list): (column, compare, value) tuples, compare
+                being operator.ge, operator.le or operator.eq
+
+        Returns:
+            tuple: (packed bitmap of the indexed rows matching every
+                indexed condition, list of conditions the index does
+                not cover)
+        """
+        lookups = []
+        unindexed = []
+
+        # Bounds on the same column make one range lookup
+        bounds = {}
+        for column, compare, value in conditions:
+            if column in self.ranges and compare is operator.ge:
+                low, high = bounds.get(column, (None, None))
+                bounds[column] = (
+                    value if low is None else max(low, value), high
+                )
+            elif column in self.ranges and compare is operator.le:
+                low, high = bounds.get(column, (None, None))
+                bounds[column] = (
+                    low, value if high is None else min(high, value)
+                )
+            elif column in self.values and compare is operator.eq:
+                lookups.append(self.values[column].get(value, self._empty))
+            else:
+                unindexed.append((column, compare, value))
+
+        for column, (low, high) in bounds.items():
+            index = self.ranges[column]
+            lookups.append(index.bitmap(*index.bounds(low, high)))
+
+        if not lookups:
+            return np.packbits(np.ones(self.rows, dtype=bool)), unindexed
+        bitmap = lookups[0].copy()
+        for lookup in lookups[1:]:
+            bitmap &= lookup
+        return bitmap, unindexed
+
+
+class RowSelection:
+    """Rows of a survey frame picked by a filter, not yet copied."""
+
+    def __init__(self, data, bitmap):
+        """
+        Initialize the selection.
+
+        Args:
+            data (pd.DataFrame): Survey data the rows are selected from
+            bitmap (np.ndarray): Packed bitmap of the selected rows
+        """
+        self.data = data
+        self.bitmap = bitmap
+        self._count = None
+        self._positions = None
+
+    def __len__(self):
+        """Number of selected rows."""
+        if self._count is None:
+            self._count = int(np.count_nonzero(self.mask))
+        return self._count
+
+    @property
+    def mask(self):
+        """np.ndarray: Bool array, True for the selected rows."""
+        return np.unpackbits(
+            self.bitmap, count=len(self.data)
+        ).view(bool)
+
+    @property
+    def positions(self):
+        """np.ndarray: Row positions of the selected rows, in order."""
+        if self._positions is None:
+            self._positions = np.flatnonzero(self.mask)
+        return self._positions
+
+    def to_frame(self, columns=None):
+        """
+        Copy the selected rows into a DataFrame.
+
+        Args:
+            columns (list): Columns to include, defaults to all
+
+        Returns:
+            pd.DataFrame: Selected rows, keeping their index labels
+        """
+        data = self.data if columns is None else self.data[columns]
+        return data.iloc[self.positions]
@@ -7,10 +7,19 @@ and storing analysis results in the cloud.
 
 import gspread
 from google.oauth2.service_account import Credentials
+from gspread.utils import rowcol_to_a1
 import pandas as pd
 from datetime import datetime
 import os
 import json
+import numbers
+import numpy as np
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from src.cache import SheetSyncCache, row_hashes
+from src.schema import SURVEY_SCHEMA
+from src.sheets_api import SHEETS_API
+from src.sheets_clients import CLIENT_POOL, credentials_key
 from src.utils import (
     display_success_message,
     display_error_message,
@@ -18,8 +27,192 @@ from src.utils import (
 )
 
 
-class GoogleSheetsHandler:
-    """Handles Google Sheets API integration for data management."""
+def _cell_data(value):
+    """
+    Convert a Python value to Sheets API cell data.
+
+    Values are stored as entered, like a RAW append: numbers and booleans
+    keep their type and anything else is written as a string.
+
+    Args:
+        value: Cell value
+
+    Returns:
+        dict: CellData with a userEnteredValue
+    """
+    if isinstance(value, bool):
+        entered = {'boolValue': value}
+    elif isinstance(value, numbers.Integral):
+        entered = {'numberValue': int(value)}
+    elif isinstance(value, numbers.Real):
+        entered = {'numberValue': float(value)}
+    else:
+        entered = {'stringValue': '' if value is None else str(value)}
+    return {'userEnteredValue': entered}
+
+
+def sheet_rows(df):
+    """
+    Convert the rows of a DataFrame to cell values for a write.
+
+    Values are plain Python objects the API request can encode as JSON:
+    missing values (NaN, pd.NA) become empty cells, and float32 columns
+    are widened through their shortest repr, so that 123.45 is written
+    as 123.45 and not 123.44999694824219.
+
+    Args:
+        df (pd.DataFrame): Rows to write
+
+    Returns:
+        list: One list of cell values per row
+    """
+    columns = []
+    for _, column in df.items():
+        if column.dtype == np.float32:
+            values = column.to_numpy().astype(str).astype(np.float64)
+            values = values.astype(object)
+        else:
+            values = column.to_numpy(dtype=object, copy=True)
+        values[column.isna().to_numpy()] = ''
+        columns.append(values.tolist())
+    return [list(row) for row in zip(*columns)]
+
+
+def _value_bytes(rows):
+    """Count the characters of cell values sent or received."""
+    return sum(len(str(value)) for row in rows for value in row)
+
+
+def changed_row_runs(old_hashes, new_hashes):
+    """
+    Find the runs of rows that differ between two versions of a table.
+
+    Args:
+        old_hashes (np.ndarray): Row hashes of the old version
+        new_hashes (np.ndarray): Row hashes of the new version
+
+    Returns:
+        list: (start, stop) row positions of each run of changed or
+            added rows in the new version
+    """
+    common = min(len(old_hashes), len(new_hashes))
+    changed = np.concatenate([
+        np.flatnonzero(old_hashes[:common] != new_hashes[:common]),
+        np.arange(common, len(new_hashes))
+    ])
+    if not changed.size:
+        return []
+
+    breaks = np.flatnonzero(np.diff(changed) > 1) + 1
+    starts = changed[np.r_[0, breaks]]
+    stops = changed[np.r_[breaks - 1, changed.size - 1]] + 1
+    return list(zip(starts.tolist(), stops.tolist()))
+
+
+def _typed_block(rows, columns):
+    """Convert a block of string rows to schema-typed columns."""
+    width = len(columns)
+    rows = [row[:width] + [''] * (width - len(row)) for row in rows]
+    block = SURVEY_SCHEMA.coerce(pd.DataFrame(rows, columns=columns))
+    # Columns left as strings still view the frame's 2-D block of every
+    # raw string; copying keeps only the strings they use
+    return block.copy()
+
+
+def read_worksheet(worksheet, block_rows=5000, workers=4, stats=None,
+                   api=SHEETS_API):
+    """
+    Read a worksheet into a typed DataFrame, one block of rows at a time.
+
+    Row blocks are fetched concurrently and each is converted to schema
+    types as soon as it arrives, so the raw strings of the whole sheet
+    are never held at once. The result matches converting the output of
+    get_all_values() in one go.
+
+    Args:
+        worksheet (gspread.Worksheet): Worksheet whose first row holds
+            the headers (anything with get_values and row_count works)
+        block_rows (int): Rows fetched per request
+        workers (int): Requests in flight at once
+        stats (dict): Optional counters; 'requests' and 'bytes' (of
+            cell values received) are added to
+        api (SheetsApiCaller): Rate limiter and retry policy for the
+            requests
+
+    Returns:
+        pd.DataFrame or None: Survey data, or None if the worksheet has
+            no data rows
+    """
+    stats = stats if stats is not None else {}
+    stats.setdefault('requests', 0)
+    stats.setdefault('bytes', 0)
+
+    def fetch(start):
+        stop = min(start + block_rows - 1, worksheet.row_count)
+        return api.call(
+            'read', worksheet.get_values,
+            f"A{start}:{rowcol_to_a1(stop, worksheet.col_count)}"
+        )
+
+    first = fetch(1)
+    stats['requests'] += 1
+    stats['bytes'] += _value_bytes(first)
+    if len(first) < 2:
+        return None
+    columns = first[0]
+    blocks = {0: _typed_block(first[1:], columns)}
+    lengths = {0: len(first) - 1}
+    del first
+
+    starts = enumerate(
+        range(1 + block_rows, worksheet.row_count + 1, block_rows), start=1
+    )
+    pending = {}
+
+    def submit_next():
+        # Keep at most `workers` blocks in flight (or waiting to be
+        # converted), so raw rows never pile up
+        for number, start in starts:
+            pending[executor.submit(fetch, start)] = number
+            return
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for _ in range(workers):
+            submit_next()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                number = pending.pop(future)
+                submit_next()
+                rows = future.result()
+                stats['requests'] += 1
+                stats['bytes'] += _value_bytes(rows)
+                lengths[number] = len(rows)
+                if rows:
+                    blocks[number] = _typed_block(rows, columns)
+                del rows
+
+    # Empty rows at the end of a block are not returned, but they are
+    # part of the data if a later block has rows
+    last = max(blocks)
+    frames = []
+    for number in range(last + 1):
+        if number in blocks:
+            frames.append(blocks[number])
+        expected = block_rows - 1 if number == 0 else block_rows
+        if number < last and lengths[number] < expected:
+            frames.append(_typed_block(
+                [[]] * (expected - lengths[number]), columns
+            ))
+
+    # Blocks may have settled on different types (e.g. a column with
+    # missing values in one block only), so coerce the combined columns
+    data = SURVEY_SCHEMA.concat(frames).reset_index(drop=True)
+    return SURVEY_SCHEMA.compact(SURVEY_SCHEMA.coerce(data))
+
+
+class GspreadBackend:
+    """Sheets backend for the live Google service, through gspread."""
 
     # Define the scope for Google Sheets and Google Drive access
     SCOPE = [
@@ -28,17 +221,107 @@ class GoogleSheetsHandler:
         "https://www.googleapis.com/auth/drive"
     ]
 
-    def __init__(self, credentials_file='creds.json'):
+    def cache_key(self, credentials_file):
+        """Identify the credentials a client is authorized with."""
+        return ('gspread',) + credentials_key(credentials_file)
+
+    def authorize(self, credentials_file):
+        """
+        Authorize a gspread client with service account credentials.
+
+        Args:
+            credentials_file (str): Path to the credentials JSON file,
+                used unless the CREDS environment variable holds them
+
+        Returns:
+            gspread.Client: Authorized client
+
+        Raises:
+            FileNotFoundError: If the credentials file does not exist
+            json.JSONDecodeError: If the credentials are not valid JSON
+        """
+        # Try to get credentials from environment variable first
+        creds_json = os.environ.get('CREDS')
+
+        if creds_json:
+            # Running on Heroku - use environment variable
+            creds_dict = json.loads(creds_json)
+            creds = Credentials.from_service_account_info(
+                creds_dict, scopes=self.SCOPE)
+        else:
+            # Running locally - load from file
+            if not os.path.exists(credentials_file):
+                raise FileNotFoundError(credentials_file)
+
+            creds = Credentials.from_service_account_file(
+                credentials_file,
+                scopes=self.SCOPE
+            )
+
+        return gspread.authorize(creds)
+
+
+class GoogleSheetsHandler:
+    """Handles Google Sheets API integration for data management."""
+
+    SCOPE = GspreadBackend.SCOPE
+
+    # Rows fetched per request, and requests in flight, when reading
+    READ_BLOCK_ROWS = 5000
+    READ_WORKERS = 4
+
+    # Buffered rows are written once this many are waiting...
+    WRITE_BATCH_SIZE = 50
+    # ...or this many seconds after the first of them was buffered
+    WRITE_FLUSH_INTERVAL = 30
+
+    def __init__(self, credentials_file='creds.json',
+                 batch_size=WRITE_BATCH_SIZE,
+                 flush_interval=WRITE_FLUSH_INTERVAL, sync_cache=None,
+                 api=None, backend=None, client_pool=None):
         """
         Initialize Google Sheets handler.
 
+        Rows logged or saved to worksheets are buffered and written in a
+        single batch request per flush, and worksheet handles are looked
+        up once, to keep the number of API calls (and quota) down.
+
         Args:
             credentials_file (str): Path to the credentials JSON file
+            batch_size (int): Buffered rows that trigger a flush
+            flush_interval (float): Seconds after which buffered rows
+                are flushed even if the batch is not full
+            sync_cache (SheetSyncCache): Optional store of the manifests
+                used by delta syncs
+            api (SheetsApiCaller): Optional rate limiter and retry policy
+                for API calls, defaults to the shared SHEETS_API
+            backend: Object whose authorize(credentials_file) returns a
+                gspread-compatible client; defaults to GspreadBackend
+                (the live service), e.g. FakeSheetsService for offline
+                runs
+            client_pool (SheetsClientPool): Optional cache of authorized
+                clients, defaults to the shared CLIENT_POOL
         """
         self.credentials_file = credentials_file
         self.client = None
         self.spreadsheet = None
         self.connected = False
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._worksheets = {}
+        self._pending_rows = {}
+        self._flush_timer = None
+        self._write_lock = threading.RLock()
+        self.sync_cache = (
+            sync_cache if sync_cache is not None else SheetSyncCache()
+        )
+        self.api = api if api is not None else SHEETS_API
+        self.backend = backend if backend is not None else GspreadBackend()
+        self.client_pool = (
+            client_pool if client_pool is not None else CLIENT_POOL
+        )
+        # Requests, bytes and rows of the last load or export
+        self.last_sync_stats = {}
 
     def connect(self):
         """
@@ -50,32 +333,10 @@ class GoogleSheetsHandler:
         try:
             display_loading_message("Connecting to Google Sheets...")
 
-            # Try to get credentials from environment variable first
-            creds_json = os.environ.get('CREDS')
-
-            if creds_json:
-                # Running on Heroku - use environment variable
-                creds_dict = json.loads(creds_json)
-                creds = Credentials.from_service_account_info(
-                    creds_dict, scopes=self.SCOPE)
-            else:
-                # Running locally - load from file
-                if not os.path.exists(self.credentials_file):
-                    display_error_message(
-                        f"Credentials file not found: {self.credentials_file}"
-                    )
-                    display_error_message(
-                        "Please ensure creds.json is in the project root"
-                    )
-                    return False
-
-                creds = Credentials.from_service_account_file(
-                    self.credentials_file,
-                    scopes=self.SCOPE
-                )
-
-            # Authorize the client
-            self.client = gspread.authorize(creds)
+            # Reuse the process's client for these credentials, if any
+            self.client = self.client_pool.client(
+                self.backend, self.credentials_file
+            )
             self.connected = True
 
             display_success_message("Successfully connected to Google Sheets!")
@@ -92,7 +353,7 @@ class GoogleSheetsHandler:
         except json.JSONDecodeError:
             display_error_message("Invalid JSON in credentials file")
             return False
-        except (IOError, OSError) as e:
+        except (gspread.exceptions.APIError, IOError, OSError) as e:
             display_error_message(
                 f"Failed to connect to Google Sheets: {str(e)}"
             )
@@ -118,7 +379,12 @@ class GoogleSheetsHandler:
             display_loading_message(
                 f"Opening spreadsheet: {spreadsheet_name}..."
             )
-            self.spreadsheet = self.client.open(spreadsheet_name)
+            # Buffered rows and handles belong to the previous spreadsheet
+            self.flush()
+            self._worksheets = {}
+            self.spreadsheet = self.api.call(
+                'read', self.client.open, spreadsheet_name
+            )
             display_success_message(
                 f"Spreadsheet '{spreadsheet_name}' opened successfully!"
             )
@@ -132,16 +398,27 @@ class GoogleSheetsHandler:
                 "Please check the spreadsheet name and sharing permissions"
             )
             return False
-        except (IOError, OSError) as e:
+        except (gspread.exceptions.APIError, IOError, OSError) as e:
             display_error_message(f"Error opening spreadsheet: {str(e)}")
             return False
 
-    def load_survey_data(self, worksheet_name='survey_data'):
+    def load_survey_data(self, worksheet_name='survey_data',
+                         block_rows=READ_BLOCK_ROWS, workers=READ_WORKERS,
+                         delta=False):
         """
         Load survey data from a Google Sheets worksheet.
 
+        The worksheet is read in blocks of rows, several at a time (see
+        read_worksheet), instead of one request for every value. In
+        delta mode the data pulled last time is reused when the
+        spreadsheet has not been modified since, other than by the
+        app's own writes to other worksheets.
+
         Args:
             worksheet_name (str): Name of the worksheet containing survey data
+            block_rows (int): Rows fetched per request
+            workers (int): Requests in flight at once
+            delta (bool): Skip the read if the spreadsheet is unchanged
 
         Returns:
             pd.DataFrame or None: Survey data as DataFrame, or None if error
@@ -157,51 +434,56 @@ class GoogleSheetsHandler:
                 f"Loading data from worksheet: {worksheet_name}..."
             )
 
+            stats = {'mode': 'full', 'requests': 0, 'bytes': 0}
+            self.last_sync_stats = stats
+
+            if delta:
+                # Sheets has no per-row change feed, but the Drive
+                # modification time tells whether anything changed
+                modified = self.api.call(
+                    'read', self.spreadsheet.get_lastUpdateTime
+                )
+                stats['requests'] += 1
+                df = self.sync_cache.load_snapshot(
+                    self.spreadsheet.id, worksheet_name, modified
+                )
+                if df is not None:
+                    stats.update(mode='unchanged', rows=len(df))
+                    display_success_message(
+                        f"Loaded {len(df)} records (unchanged since the "
+                        f"last sync, {stats['requests']} request)"
+                    )
+                    return df
+
             # Get the worksheet
-            worksheet = self.spreadsheet.worksheet(worksheet_name)
+            worksheet = self.get_worksheet(worksheet_name)
 
-            # Get all values from the worksheet
-            data = worksheet.get_all_values()
+            # Fetch and convert to schema types block by block
+            df = read_worksheet(
+                worksheet, block_rows=block_rows, workers=workers,
+                stats=stats, api=self.api
+            )
 
-            if not data or len(data) < 2:
+            if df is None:
                 display_error_message("Worksheet is empty or has no data")
                 return None
 
-            # Convert to DataFrame (first row as headers)
-            df = pd.DataFrame(data[1:], columns=data[0])
-
-            # Convert numeric columns
-            numeric_columns = [
-                'age', 'annual_income', 'monthly_savings',
-                'financial_literacy_score', 'emergency_fund_months'
-            ]
-
-            spending_cols = [
-                col for col in df.columns if 'spending' in col.lower()
-            ]
-            numeric_columns.extend(spending_cols)
-
-            for col in numeric_columns:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
-
-            # Convert boolean columns
-            boolean_columns = ['uses_mobile_banking', 'owns_crypto']
-            for col in boolean_columns:
-                if col in df.columns:
-                    df[col] = df[col].str.lower().map(
-                        {'yes': True, 'no': False}
-                    )
+            stats['rows'] = len(df)
+            if delta:
+                self.sync_cache.store_snapshot(
+                    self.spreadsheet.id, worksheet_name, modified, df
+                )
 
             display_success_message(
-                f"Loaded {len(df)} records from Google Sheets!"
+                f"Loaded {len(df)} records from Google Sheets! "
+                f"({stats['requests']} requests, {stats['bytes']} bytes)"
             )
             return df
 
         except gspread.exceptions.WorksheetNotFound:
             display_error_message(f"Worksheet '{worksheet_name}' not found")
             return None
-        except (IOError, OSError) as e:
+        except (gspread.exceptions.APIError, IOError, OSError) as e:
             display_error_message(f"Error loading data: {str(e)}")
             return None
 
@@ -230,20 +512,14 @@ class GoogleSheetsHandler:
                 "Saving analysis results to Google Sheets..."
             )
 
-            # Try to get existing worksheet, create if doesn't exist
-            try:
-                worksheet = self.spreadsheet.worksheet(worksheet_name)
-            except gspread.exceptions.WorksheetNotFound:
-                worksheet = self.spreadsheet.add_worksheet(
-                    title=worksheet_name,
-                    rows=100,
-                    cols=10
-                )
-                # Add headers if new worksheet
-                worksheet.append_row([
+            # Get existing worksheet, create it (with headers) if needed
+            self.get_worksheet(
+                worksheet_name, rows=100, cols=10,
+                headers=[
                     'Timestamp', 'Analysis Type', 'Total Respondents',
                     'Key Finding', 'Details'
-                ])
+                ]
+            )
 
             # Prepare data for insertion
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -257,13 +533,13 @@ class GoogleSheetsHandler:
                 str(analysis_data.get('details', {}))
             ]
 
-            # Append the row to the worksheet
-            worksheet.append_row(row_data)
+            # Buffer the row; it is written with the next batch
+            self.queue_rows(worksheet_name, [row_data])
 
-            display_success_message("Analysis results saved successfully!")
+            display_success_message("Analysis results queued for saving!")
             return True
 
-        except (IOError, OSError) as e:
+        except (gspread.exceptions.APIError, IOError, OSError) as e:
             display_error_message(f"Error saving results: {str(e)}")
             return False
 
@@ -276,6 +552,22 @@ class GoogleSheetsHandler:
             action (str): Action performed
             worksheet_name (str): Name of the worksheet for logging
 
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return self.log_session_rows(
+            [[timestamp, username, action, 'Success']], worksheet_name
+        )
+
+    def log_session_rows(self, rows, worksheet_name='session_log'):
+        """
+        Buffer already-built session log rows (see SessionLogger).
+
+        Args:
+            rows (list): [timestamp, username, action, status] rows
+            worksheet_name (str): Name of the worksheet for logging
+
         Returns:
             bool: True if successful, False otherwise
         """
@@ -283,37 +575,36 @@ class GoogleSheetsHandler:
             return False
 
         try:
-            # Try to get existing worksheet, create if doesn't exist
-            try:
-                worksheet = self.spreadsheet.worksheet(worksheet_name)
-            except gspread.exceptions.WorksheetNotFound:
-                worksheet = self.spreadsheet.add_worksheet(
-                    title=worksheet_name,
-                    rows=1000,
-                    cols=5
-                )
-                # Add headers
-                worksheet.append_row(
-                    ['Timestamp', 'Username', 'Action', 'Status']
-                )
+            # Get existing worksheet, create it (with headers) if needed
+            self.get_worksheet(
+                worksheet_name, rows=1000, cols=5,
+                headers=['Timestamp', 'Username', 'Action', 'Status']
+            )
 
-            # Log the session
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            worksheet.append_row([timestamp, username, action, 'Success'])
+            # Log the session with the next batch of writes
+            self.queue_rows(worksheet_name, rows)
 
             return True
 
-        except (IOError, OSError):
+        except (gspread.exceptions.APIError, IOError, OSError):
             # Silent fail for logging - don't interrupt user experience
             return False
 
-    def export_dataframe_to_sheets(self, df, worksheet_name='exported_data'):
+    def export_dataframe_to_sheets(self, df, worksheet_name='exported_data',
+                                   delta=False):
         """
         Export a pandas DataFrame to Google Sheets.
 
+        In delta mode a manifest of row hashes is kept for the worksheet
+        and only the runs of changed or added rows are written, in one
+        batch request. The whole frame is rewritten instead when there
+        is no manifest, the columns changed or the worksheet may have
+        been modified by someone else since the last export.
+
         Args:
             df (pd.DataFrame): DataFrame to export
             worksheet_name (str): Name of the worksheet
+            delta (bool): Write only the rows that changed
 
         Returns:
             bool: True if successful, False otherwise
@@ -327,32 +618,132 @@ class GoogleSheetsHandler:
                 f"Exporting data to worksheet: {worksheet_name}..."
             )
 
-            # Try to get existing worksheet, create if doesn't exist
-            try:
-                worksheet = self.spreadsheet.worksheet(worksheet_name)
-                worksheet.clear()  # Clear existing data
-            except gspread.exceptions.WorksheetNotFound:
-                worksheet = self.spreadsheet.add_worksheet(
-                    title=worksheet_name,
-                    rows=len(df) + 10,
-                    cols=len(df.columns) + 2
-                )
+            stats = {'mode': 'full', 'requests': 0, 'bytes': 0, 'rows': 0}
+            self.last_sync_stats = stats
+            columns = [str(col) for col in df.columns]
+            manifest = None
 
-            # Convert DataFrame to list of lists
-            data = [df.columns.tolist()] + df.values.tolist()
+            if delta:
+                hashes = row_hashes(df)
+                modified = self.api.call(
+                    'read', self.spreadsheet.get_lastUpdateTime
+                )
+                stats['requests'] += 1
+                manifest = self.sync_cache.load_manifest(
+                    self.spreadsheet.id, worksheet_name
+                )
+                if manifest is not None and (
+                        manifest['columns'] != columns
+                        or not self.sync_cache.is_current(
+                            self.spreadsheet.id, worksheet_name,
+                            manifest['modified'], modified
+                        )):
+                    manifest = None
+
+            if manifest is not None:
+                stats['mode'] = 'delta'
+                wrote = self._write_changed_rows(
+                    self.get_worksheet(worksheet_name), df,
+                    manifest['hashes'], hashes, stats, self.api
+                )
+            else:
+                # Try to get existing worksheet, create if doesn't exist
+                try:
+                    worksheet = self.get_worksheet(worksheet_name)
+                    # Clear existing data
+                    self.api.call('write', worksheet.clear)
+                    stats['requests'] += 1
+                except gspread.exceptions.WorksheetNotFound:
+                    worksheet = self.get_worksheet(
+                        worksheet_name,
+                        rows=len(df) + 10,
+                        cols=len(df.columns) + 2
+                    )
 
-            # Update worksheet
-            worksheet.update('A1', data)
+                # Convert DataFrame to list of lists
+                data = [df.columns.tolist()] + sheet_rows(df)
+
+                # Update worksheet
+                self.api.call('write', worksheet.update, 'A1', data)
+                stats['requests'] += 1
+                stats['bytes'] += _value_bytes(data)
+                stats['rows'] = len(df)
+                wrote = True
+
+            if delta:
+                if wrote:
+                    # Our own writes changed the modification time
+                    before = modified
+                    modified = self.api.call(
+                        'read', self.spreadsheet.get_lastUpdateTime
+                    )
+                    stats['requests'] += 1
+                    self.sync_cache.record_write(
+                        self.spreadsheet.id, before, modified,
+                        [worksheet_name]
+                    )
+                self.sync_cache.store_manifest(
+                    self.spreadsheet.id, worksheet_name, columns, hashes,
+                    modified
+                )
 
             display_success_message(
-                f"Data exported to '{worksheet_name}' successfully!"
+                f"Data exported to '{worksheet_name}' successfully! "
+                f"({stats['rows']} rows, {stats['requests']} requests, "
+                f"{stats['bytes']} bytes)"
             )
             return True
 
-        except (IOError, OSError) as e:
+        except (gspread.exceptions.APIError, IOError, OSError) as e:
             display_error_message(f"Error exporting data: {str(e)}")
             return False
 
+    @staticmethod
+    def _write_changed_rows(worksheet, df, old_hashes, new_hashes, stats,
+                            api):
+        """
+        Write the rows of df that differ from the last export.
+
+        Args:
+            worksheet (gspread.Worksheet): Worksheet last exported to
+            df (pd.DataFrame): Data to export
+            old_hashes (np.ndarray): Row hashes of the last export
+            new_hashes (np.ndarray): Row hashes of df
+            stats (dict): Sync counters to update
+            api (SheetsApiCaller): Caller the writes go through
+
+        Returns:
+            bool: True if anything was written
+        """
+        width = len(df.columns)
+        # Sheet rows are 1-based and row 1 holds the headers
+        if len(df) + 1 > worksheet.row_count:
+            api.call('write', worksheet.resize, rows=len(df) + 1)
+            stats['requests'] += 1
+
+        updates = []
+        for start, stop in changed_row_runs(old_hashes, new_hashes):
+            values = sheet_rows(df.iloc[start:stop])
+            updates.append({
+                'range': f"A{start + 2}:{rowcol_to_a1(stop + 1, width)}",
+                'values': values
+            })
+            stats['rows'] += stop - start
+            stats['bytes'] += _value_bytes(values)
+
+        if updates:
+            api.call('write', worksheet.batch_update, updates)
+            stats['requests'] += 1
+
+        # Rows left over from a longer previous export
+        if len(df) < len(old_hashes):
+            api.call('write', worksheet.batch_clear, [
+                f"A{len(df) + 2}:{rowcol_to_a1(len(old_hashes) + 1, width)}"
+            ])
+            stats['requests'] += 1
+
+        return bool(updates) or len(df) < len(old_hashes)
+
     def get_spreadsheet_info(self):
         """
         Get information about the current spreadsheet.
@@ -364,19 +755,27 @@ class GoogleSheetsHandler:
             return {"error": "No spreadsheet opened"}
 
         try:
+            worksheets = self.api.call('read', self.spreadsheet.worksheets)
             info = {
                 "title": self.spreadsheet.title,
                 "url": self.spreadsheet.url,
                 "id": self.spreadsheet.id,
-                "worksheets": len(self.spreadsheet.worksheets()),
-                "worksheet_names": [
-                    ws.title for ws in self.spreadsheet.worksheets()
-                ]
+                "worksheets": len(worksheets),
+                "worksheet_names": [ws.title for ws in worksheets]
             }
             return info
-        except (IOError, OSError) as e:
+        except (gspread.exceptions.APIError, IOError, OSError) as e:
             return {"error": str(e)}
 
+    def get_api_stats(self):
+        """
+        Get latency and retry metrics of the API calls made so far.
+
+        Returns:
+            dict: Metrics per API method (see SheetsApiCaller.stats)
+        """
+        return self.api.stats()
+
     def get_worksheet_list(self):
         """
         Get list of all worksheets in the current spreadsheet.
@@ -388,9 +787,9 @@ class GoogleSheetsHandler:
             return []
 
         try:
-            worksheets = self.spreadsheet.worksheets()
+            worksheets = self.api.call('read', self.spreadsheet.worksheets)
             return [ws.title for ws in worksheets]
-        except (IOError, OSError) as e:
+        except (gspread.exceptions.APIError, IOError, OSError) as e:
             display_error_message(f"Error getting worksheet list: {str(e)}")
             return []
 
@@ -413,11 +812,14 @@ class GoogleSheetsHandler:
             display_loading_message("Creating sample spreadsheet...")
 
             # Create new spreadsheet
-            spreadsheet = self.client.create(spreadsheet_name)
+            spreadsheet = self.api.call(
+                'write', self.client.create, spreadsheet_name,
+                idempotent=False
+            )
 
             # Get the default worksheet
-            worksheet = spreadsheet.sheet1
-            worksheet.update_title('survey_data')
+            worksheet = self.api.call('read', spreadsheet.get_worksheet, 0)
+            self.api.call('write', worksheet.update_title, 'survey_data')
 
             # Add headers
             headers = [
@@ -429,8 +831,6 @@ class GoogleSheetsHandler:
                 'financial_literacy_score', 'emergency_fund_months'
             ]
 
-            worksheet.append_row(headers)
-
             # Add sample data rows
             sample_data = [
                 [1, 25, 45000, 800, 'yes', 'yes', 'stocks',
@@ -441,8 +841,11 @@ class GoogleSheetsHandler:
                  700, 180, 250, 6, 2]
             ]
 
-            for row in sample_data:
-                worksheet.append_row(row)
+            # Headers and rows go in a single append request
+            self.api.call(
+                'write', worksheet.append_rows, [headers] + sample_data,
+                idempotent=False
+            )
 
             display_success_message(
                 f"Spreadsheet '{spreadsheet_name}' created successfully!"
@@ -458,12 +861,162 @@ class GoogleSheetsHandler:
 
             return True
 
-        except (IOError, OSError) as e:
+        except (gspread.exceptions.APIError, IOError, OSError) as e:
             display_error_message(f"Error creating spreadsheet: {str(e)}")
             return False
 
+    def get_worksheet(self, worksheet_name, rows=None, cols=None,
+                      headers=None):
+        """
+        Get a worksheet handle, looking it up only once.
+
+        Args:
+            worksheet_name (str): Name of the worksheet
+            rows (int): If given, create a missing worksheet this big
+            cols (int): Columns of a created worksheet
+            headers (list): Header row buffered for a created worksheet
+
+        Returns:
+            gspread.Worksheet: Worksheet handle
+
+        Raises:
+            gspread.exceptions.WorksheetNotFound: If the worksheet does
+                not exist and rows is not given
+        """
+        with self._write_lock:
+            worksheet = self._worksheets.get(worksheet_name)
+            if worksheet is not None:
+                return worksheet
+
+            try:
+                worksheet = self.api.call(
+                    'read', self.spreadsheet.worksheet, worksheet_name
+                )
+            except gspread.exceptions.WorksheetNotFound:
+                if rows is None:
+                    raise
+                worksheet = self._own_write(
+                    [worksheet_name], self.spreadsheet.add_worksheet,
+                    title=worksheet_name, rows=rows, cols=cols
+                )
+                if headers:
+                    self._pending_rows.setdefault(
+                        worksheet_name, []
+                    ).insert(0, headers)
+
+            self._worksheets[worksheet_name] = worksheet
+            return worksheet
+
+    def _own_write(self, worksheet_names, func, *args, idempotent=True,
+                   **kwargs):
+        """
+        Make a write request of the app's own.
+
+        Every write changes the spreadsheet's modification time. When
+        delta syncs keep state for the spreadsheet, the times read just
+        before and after the write are recorded, so that the synced
+        worksheets it did not touch stay current.
+
+        Args:
+            worksheet_names (list): Worksheets the write changes
+            func (callable): gspread method making the write
+            *args: Positional arguments for func
+            idempotent (bool): Whether repeating the write is harmless
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The result of func
+        """
+        if not self.sync_cache.tracks(self.spreadsheet.id):
+            return self.api.call(
+                'write', func, *args, idempotent=idempotent, **kwargs
+            )
+
+        before = self.api.call('read', self.spreadsheet.get_lastUpdateTime)
+        result = self.api.call(
+            'write', func, *args, idempotent=idempotent, **kwargs
+        )
+        after = self.api.call('read', self.spreadsheet.get_lastUpdateTime)
+        self.sync_cache.record_write(
+            self.spreadsheet.id, before, after, worksheet_names
+        )
+        return result
+
+    def queue_rows(self, worksheet_name, rows):
+        """
+        Buffer rows to append to a worksheet.
+
+        The buffer is flushed once batch_size rows are waiting, or
+        flush_interval seconds after it was started, whichever is first.
+
+        Args:
+            worksheet_name (str): Name of an existing worksheet
+            rows (list): Rows (lists of cell values) to append
+        """
+        with self._write_lock:
+            self._pending_rows.setdefault(worksheet_name, []).extend(rows)
+            pending = sum(map(len, self._pending_rows.values()))
+
+            if pending >= self.batch_size:
+                self.flush()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(
+                    self.flush_interval, self.flush
+                )
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self):
+        """
+        Write every buffered row in one batch request.
+
+        Rows for all worksheets go into a single spreadsheet batch
+        update (one appendCells request per worksheet). If the write
+        fails, the rows stay buffered for the next flush.
+
+        Returns:
+            bool: True if nothing was left unwritten, False otherwise
+        """
+        with self._write_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+            if not self._pending_rows or not self.spreadsheet:
+                return True
+
+            requests = [
+                {
+                    'appendCells': {
+                        'sheetId': self.get_worksheet(name).id,
+                        'rows': [
+                            {'values': [_cell_data(value) for value in row]}
+                            for row in rows
+                        ],
+                        'fields': 'userEnteredValue'
+                    }
+                }
+                for name, rows in self._pending_rows.items()
+            ]
+
+            try:
+                # Appended rows would be written twice by a retry
+                self._own_write(
+                    list(self._pending_rows), self.spreadsheet.batch_update,
+                    {'requests': requests}, idempotent=False
+                )
+            except (gspread.exceptions.APIError, IOError, OSError) as e:
+                display_error_message(f"Error writing to sheets: {str(e)}")
+                return False
+
+            self._pending_rows = {}
+            return True
+
     def close_connection(self):
-        """Close the connection and cleanup."""
+        """Flush buffered rows, close the connection and cleanup."""
+        self.flush()
+        self._worksheets = {}
+        # The client stays in the pool for the next connect()
         self.client = None
         self.spreadsheet = None
         self.connected = False
@@ -0,0 +1,176 @@
+"""
+Import Budget Module for Personal Finance Survey Analyzer.
+
+This module checks that starting the terminal app stays fast: it imports
+run.py in a fresh interpreter with `-X importtime`, and fails if the
+import takes longer than a budget or loads a stack that should only load
+when its menu option is first used. It also starts the app up to its
+first prompt, so work kicked off by main() (such as a background
+thread) is caught too.
+
+Run it from the project root; it exits with status 1 on a regression:
+
+    python -m src.import_budget [budget_seconds]
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+
+# Seconds `import run` may take, best of several runs
+STARTUP_BUDGET = 1.0
+
+# Stacks run.py must leave to the menu options that use them
+LAZY_MODULES = ('matplotlib', 'seaborn', 'gspread', 'google.auth',
+                'google.oauth2')
+
+
+def measure_imports(module='run', cwd=None):
+    """
+    Import a module in a fresh interpreter and time every import.
+
+    Args:
+        module (str): Module to import
+        cwd (str): Directory to run in, defaults to the project root
+
+    Returns:
+        dict: Cumulative seconds of each imported module, by name
+
+    Raises:
+        subprocess.CalledProcessError: If the import fails
+    """
+    if cwd is None:
+        cwd = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=cwd, capture_output=True, text=True, check=True
+    )
+
+    # Lines look like "import time:   self |   cumulative | name"
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if cumulative.strip().isdigit():
+            timings[name.strip()] = int(cumulative) / 1_000_000
+    return timings
+
+
+# Run in a fresh interpreter: start the app and, at its first prompt,
+# report the loaded modules and running threads
+_STARTUP_PROBE = """
+import builtins, json, sys, threading
+import run
+
+def probe(prompt=''):
+    json.dump({
+        'modules': sorted(sys.modules),
+        'threads': [thread.name for thread in threading.enumerate()
+                    if thread is not threading.main_thread()]
+    }, sys.stderr)
+    sys.exit(0)
+
+builtins.input = probe
+run.main([])
+"""
+
+
+def probe_startup(cwd=None, env=None):
+    """
+    Start run.py in a fresh interpreter and stop it at its first prompt.
+
+    Args:
+        cwd (str): Directory to run in, defaults to the project root
+        env (dict): Extra environment variables
+
+    Returns:
+        dict: 'modules' loaded and background 'threads' running when
+            the app first waits for input
+
+    Raises:
+        subprocess.CalledProcessError: If the app fails to start
+    """
+    if cwd is None:
+        cwd = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    result = subprocess.run(
+        [sys.executable, '-c', _STARTUP_PROBE], cwd=cwd,
+        env={**os.environ, **(env or {})}, stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE, text=True, check=True
+    )
+    return json.loads(result.stderr[result.stderr.index('{'):])
+
+
+def _loaded(lazy_modules, names):
+    """List the lazily loaded packages found among module names."""
+    return [
+        lazy for lazy in lazy_modules
+        if any(name == lazy or name.startswith(lazy + '.')
+               for name in names)
+    ]
+
+
+def check_import_budget(module='run', budget=STARTUP_BUDGET, runs=3,
+                        lazy_modules=LAZY_MODULES):
+    """
+    Check the startup import time and lazily loaded stacks of a module.
+
+    The best of several runs is compared, so a busy machine does not
+    fail the check. For run.py the app is also started up to its first
+    prompt, with Sheets credentials configured, and must not have
+    loaded a lazy stack or started a thread by then.
+
+    Args:
+        module (str): Module to import
+        budget (float): Most seconds the import may take
+        runs (int): Number of timed imports
+        lazy_modules (tuple): Packages the import must not load
+
+    Returns:
+        tuple: (best import seconds, list of problems found)
+    """
+    best = None
+    problems = []
+    for _ in range(runs):
+        timings = measure_imports(module)
+        seconds = timings[module]
+        best = seconds if best is None else min(best, seconds)
+
+    loaded = _loaded(lazy_modules, timings)
+    if loaded:
+        problems.append(f"{module} imports {', '.join(loaded)} at startup")
+
+    if module == 'run':
+        startup = probe_startup(env={'CREDS': '{}'})
+        loaded = _loaded(lazy_modules, startup['modules'])
+        if loaded:
+            problems.append(
+                f"run.main loads {', '.join(loaded)} before the first "
+                f"prompt"
+            )
+        if startup['threads']:
+            problems.append(
+                f"run.main starts {', '.join(startup['threads'])} before "
+                f"the first prompt"
+            )
+    if best > budget:
+        problems.append(
+            f"import {module} took {best:.3f}s, over the {budget:.3f}s "
+            f"budget"
+        )
+    return best, problems
+
+
+if __name__ == '__main__':
+    limit = float(sys.argv[1]) if len(sys.argv) > 1 else STARTUP_BUDGET
+    startup, issues = check_import_budget(budget=limit)
+    print(f"import run: {startup:.3f}s (budget {limit:.3f}s)")
+    for issue in issues:
+        print(f"❌ {issue}")
+    if not issues:
+        print("✅ Startup is within budget")
+    sys.exit(1 if issues else 0)
@@ -0,0 +1,172 @@
+"""
+Parallel Analysis Module for Personal Finance Survey Analyzer.
+
+This module splits survey data into row partitions, aggregates each
+partition in a separate process and merges the partial aggregates, so
+large datasets are analyzed on every core instead of one.
+"""
+
+import mmap
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from src.aggregates import DERIVED_COLUMNS, SurveyAggregates
+
+
+# Partitions smaller than this cost more to schedule than to aggregate
+MIN_PARTITION_ROWS = 250_000
+
+# Data and shared derived-column buffers inherited by forked workers
+_partition_source = None
+_source_lock = threading.Lock()
+
+
+def partition_bounds(row_count, partitions):
+    """
+    Split a row range into contiguous, nearly equal partitions.
+
+    Args:
+        row_count (int): Number of rows
+        partitions (int): Number of partitions
+
+    Returns:
+        list: (start, stop) row positions for each partition
+    """
+    edges = np.linspace(0, row_count, partitions + 1).astype(int)
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def _shared_array(size):
+    """Allocate a float64 array that forked workers can write into."""
+    buffer = mmap.mmap(-1, max(size, 1) * 8)
+    return np.frombuffer(buffer, dtype='float64', count=size)
+
+
+def _aggregate_shared_partition(start, stop, quantile_error):
+    """
+    Aggregate one partition of the data inherited from the parent.
+
+    Derived columns are written straight into the shared buffers rather
+    than sent back, so only the small statistics are pickled.
+    """
+    data, derived_buffers = _partition_source
+    aggregates = SurveyAggregates(
+        data.iloc[start:stop], quantile_error=quantile_error
+    )
+    for name, values in aggregates.derived.items():
+        derived_buffers[name][start:stop] = values
+    aggregates.detach_derived()
+    return aggregates
+
+
+def _aggregate_partition(partition, quantile_error):
+    """Aggregate one partition sent to the worker."""
+    return SurveyAggregates(partition, quantile_error=quantile_error)
+
+
+def _can_fork():
+    """
+    Check whether workers can safely be forked from this process.
+
+    A thread holding a lock (in logging, an HTTP pool, the allocator)
+    while the process forks leaves it held forever in the child, so
+    only a single-threaded process is forked.
+
+    Returns:
+        bool: True if the platform can fork and no other thread runs
+    """
+    return ('fork' in multiprocessing.get_all_start_methods()
+            and threading.active_count() == 1)
+
+
+def _pickling_context():
+    """
+    Get a start method that does not fork the calling process.
+
+    Returns:
+        multiprocessing.context.BaseContext: forkserver where available,
+            spawn otherwise
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+
+def aggregate_in_parallel(data, workers=None, quantile_error=None):
+    """
+    Compute SurveyAggregates for data using a pool of processes.
+
+    Each worker aggregates a contiguous row partition; the partial
+    aggregates are merged in row order, giving the same statistics as
+    the serial path up to floating-point summation order. Exact medians
+    cannot be merged, so they are still computed once over all rows
+    (use quantile_error to merge sketches instead).
+
+    Where the platform can fork and no other thread is running, workers
+    read the data from the parent's memory; otherwise each partition is
+    pickled to a worker started without forking this process.
+
+    Args:
+        data (pd.DataFrame): Survey data
+        workers (int): Number of processes, defaults to the CPU count
+        quantile_error (float): Optional sketch rank error for medians
+
+    Returns:
+        SurveyAggregates: Aggregates of the whole dataset
+    """
+    global _partition_source
+
+    workers = workers or os.cpu_count() or 1
+    partitions = min(workers, len(data) // MIN_PARTITION_ROWS)
+    if partitions < 2:
+        return SurveyAggregates(data, quantile_error=quantile_error)
+
+    bounds = partition_bounds(len(data), partitions)
+
+    if not _can_fork():
+        with ProcessPoolExecutor(
+                max_workers=partitions, mp_context=_pickling_context()
+        ) as executor:
+            partials = list(executor.map(
+                _aggregate_partition,
+                [data.iloc[start:stop] for start, stop in bounds],
+                [quantile_error] * partitions
+            ))
+        return _merge_partials(partials)
+
+    derived_buffers = {
+        name: _shared_array(len(data)) for name in DERIVED_COLUMNS
+    }
+    with _source_lock:
+        _partition_source = (data, derived_buffers)
+        try:
+            with ProcessPoolExecutor(
+                    max_workers=partitions,
+                    mp_context=multiprocessing.get_context('fork')
+            ) as executor:
+                partials = list(executor.map(
+                    _aggregate_shared_partition,
+                    [start for start, _ in bounds],
+                    [stop for _, stop in bounds],
+                    [quantile_error] * partitions
+                ))
+        finally:
+            _partition_source = None
+
+    aggregates = _merge_partials(partials)
+    aggregates.attach_derived({
+        name: buffer for name, buffer in derived_buffers.items()
+        if name in partials[0].derived_names
+    })
+    return aggregates
+
+
+def _merge_partials(partials):
+    """Merge partial aggregates in row order into the first one."""
+    aggregates = partials[0]
+    for partial in partials[1:]:
+        aggregates.merge(partial)
+    return aggregates
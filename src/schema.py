@@ -0,0 +1,242 @@
+"""
+Survey Schema Module for Personal Finance Survey Analyzer.
+
+This module declares the column types of the personal finance survey so
+that every loader (CSV files, Google Sheets) parses the data into the
+same compact dtypes.
+"""
+
+import hashlib
+import json
+
+import numpy as np
+import pandas as pd
+
+
+# Bump when cleaning changes without a change to the declared types
+# (SurveySchema.coerce/compact, data_handler.clean_frame): cleaned data
+# cached on disk is keyed on it
+CLEANING_VERSION = 1
+
+
+class SurveySchema:
+    """Declared column types for personal finance survey data."""
+
+    # Whole-number columns and the smallest nullable integer type that
+    # holds their realistic range
+    INTEGER_COLUMNS = {
+        'age': 'Int16',
+        'financial_literacy_score': 'Int8',
+    }
+
+    # Money and other fractional columns (spending columns are matched
+    # by name, see is_spending_column)
+    FLOAT_COLUMNS = [
+        'annual_income', 'monthly_savings', 'emergency_fund_months'
+    ]
+    FLOAT_DTYPE = 'float32'
+
+    BOOLEAN_COLUMNS = ['uses_mobile_banking', 'owns_crypto']
+
+    CATEGORY_COLUMNS = ['primary_investment']
+
+    @property
+    def version(self):
+        """str: Hash of the declared types and the cleaning version."""
+        declaration = json.dumps([
+            CLEANING_VERSION, self.INTEGER_COLUMNS, self.FLOAT_COLUMNS,
+            self.FLOAT_DTYPE, self.BOOLEAN_COLUMNS, self.CATEGORY_COLUMNS
+        ], sort_keys=True)
+        return hashlib.sha256(declaration.encode('utf-8')).hexdigest()[:16]
+
+    @staticmethod
+    def is_spending_column(column):
+        """
+        Check whether a column holds monthly spending amounts.
+
+        Args:
+            column (str): Column name
+
+        Returns:
+            bool: True for spending columns
+        """
+        return 'spending' in column.lower()
+
+    def dtypes(self, columns):
+        """
+        Build the declared dtype for each known column.
+
+        Args:
+            columns (iterable): Column names present in the source
+
+        Returns:
+            dict: Column name to dtype for columns covered by the schema
+        """
+        dtypes = {}
+        for col in columns:
+            if col in self.INTEGER_COLUMNS:
+                dtypes[col] = self.INTEGER_COLUMNS[col]
+            elif col in self.FLOAT_COLUMNS or self.is_spending_column(col):
+                dtypes[col] = self.FLOAT_DTYPE
+            elif col in self.BOOLEAN_COLUMNS:
+                dtypes[col] = 'boolean'
+            elif col in self.CATEGORY_COLUMNS:
+                dtypes[col] = 'category'
+        return dtypes
+
+    def read_csv_kwargs(self, columns):
+        """
+        Build pd.read_csv arguments that parse into compact types.
+
+        The C parser handles masked (nullable) dtypes through a slow
+        object path, so integer columns are parsed as float32 and yes/no
+        columns as categoricals. coerce() then turns both into their
+        declared types with cheap vectorised conversions.
+
+        Args:
+            columns (iterable): Column names from the CSV header
+
+        Returns:
+            dict: Keyword arguments for pd.read_csv
+        """
+        dtypes = self.dtypes(columns)
+        for col in dtypes:
+            if col in self.INTEGER_COLUMNS:
+                dtypes[col] = self.FLOAT_DTYPE
+            elif col in self.BOOLEAN_COLUMNS:
+                dtypes[col] = 'category'
+        return {'dtype': dtypes}
+
+    def coerce(self, data):
+        """
+        Convert columns that are not yet in their declared type.
+
+        Values that cannot be converted become missing, matching the
+        errors='coerce' behaviour of the original cleaning step. Columns
+        that already have their declared type are left untouched.
+
+        Args:
+            data (pd.DataFrame): Survey rows, typically parsed as strings
+
+        Returns:
+            pd.DataFrame: The same frame with converted columns
+        """
+        for col, dtype in self.dtypes(data.columns).items():
+            if data[col].dtype == dtype:
+                continue
+
+            if col in self.INTEGER_COLUMNS:
+                data[col] = self._to_integer(data[col], dtype)
+            elif dtype == self.FLOAT_DTYPE:
+                data[col] = pd.to_numeric(
+                    data[col], errors='coerce'
+                ).astype(self.FLOAT_DTYPE)
+            elif dtype == 'boolean':
+                data[col] = self._to_boolean(data[col])
+            else:
+                data[col] = data[col].astype('category')
+
+        return data
+
+    def _to_integer(self, series, dtype):
+        """
+        Convert a column to a small integer type when its values allow.
+
+        Args:
+            series (pd.Series): Column to convert
+            dtype (str): Target nullable integer dtype
+
+        Returns:
+            pd.Series: Integer column (plain NumPy ints when nothing is
+                missing), or float32 if values are fractional or out of
+                range for the target type
+        """
+        numeric = pd.to_numeric(series, errors='coerce')
+        values = numeric.dropna()
+        limits = np.iinfo(dtype.lower())
+
+        if (values == values.round()).all() and (
+                values.empty or
+                (limits.min <= values.min() and
+                 values.max() <= limits.max)):
+            if len(values) == len(numeric):
+                return numeric.astype(dtype.lower())
+            return numeric.astype(dtype)
+        return numeric.astype(self.FLOAT_DTYPE)
+
+    @staticmethod
+    def _to_boolean(series):
+        """
+        Convert a yes/no column to nullable boolean.
+
+        Args:
+            series (pd.Series): Column of yes/no answers
+
+        Returns:
+            pd.Series: Boolean column, missing where the answer is neither
+        """
+        if not isinstance(series.dtype, pd.CategoricalDtype):
+            series = series.astype('category')
+
+        # Map each distinct answer once, then broadcast through the codes;
+        # code -1 (missing) picks the trailing NA
+        answers = pd.Series(series.cat.categories).astype(str)
+        answers = answers.str.strip().str.lower().map(
+            {'yes': True, 'no': False}
+        )
+        lookup = pd.array(list(answers) + [pd.NA], dtype='boolean')
+        return pd.Series(
+            lookup[series.cat.codes.to_numpy()], index=series.index
+        )
+
+    @staticmethod
+    def compact(data):
+        """
+        Swap nullable columns that have no missing values for NumPy types.
+
+        Plain int/bool arrays are smaller than their masked equivalents
+        and work with every NumPy routine used by the analysis code.
+
+        Args:
+            data (pd.DataFrame): Cleaned survey rows
+
+        Returns:
+            pd.DataFrame: The same frame with compacted columns
+        """
+        for col in data.columns:
+            dtype = data[col].dtype
+            if isinstance(dtype, pd.CategoricalDtype):
+                data[col] = data[col].cat.remove_unused_categories()
+            elif (isinstance(dtype, pd.api.extensions.ExtensionDtype) and
+                    dtype.kind in 'iub' and not data[col].hasnans):
+                data[col] = data[col].astype(dtype.numpy_dtype)
+        return data
+
+    def concat(self, frames):
+        """
+        Concatenate survey frames while keeping categorical columns.
+
+        pd.concat falls back to object dtype when categorical columns have
+        different categories, so the categories are unified first (and
+        sorted, as when the whole column is converted at once).
+
+        Args:
+            frames (list): Survey DataFrames with the same columns
+
+        Returns:
+            pd.DataFrame: Combined frame
+        """
+        for col in self.CATEGORY_COLUMNS:
+            if not frames or col not in frames[0].columns:
+                continue
+            categories = pd.api.types.union_categoricals(
+                [frame[col] for frame in frames]
+            ).categories.sort_values()
+            for frame in frames:
+                frame[col] = frame[col].cat.set_categories(categories)
+
+        return pd.concat(frames)
+
+
+# Shared schema instance used by every survey loader
+SURVEY_SCHEMA = SurveySchema()
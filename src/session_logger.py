@@ -0,0 +1,180 @@
+"""
+Session Logger Module for Personal Finance Survey Analyzer.
+
+This module logs user session activity to Google Sheets from a
+background thread, so menu actions only enqueue a row and never wait on
+a network round trip.
+"""
+
+import queue
+import threading
+from datetime import datetime
+
+
+class SessionLogger:
+    """Bounded queue of session log rows written by a worker thread."""
+
+    # What log() does when the queue is full
+    POLICIES = ('drop_newest', 'drop_oldest', 'block')
+
+    def __init__(self, sheets_handler, maxsize=1000, policy='drop_newest',
+                 batch_size=50, flush_interval=5.0, block_timeout=1.0):
+        """
+        Initialize the logger and start its worker thread.
+
+        Args:
+            sheets_handler (GoogleSheetsHandler): Handler the rows are
+                written with
+            maxsize (int): Most rows waiting in the queue
+            policy (str): When the queue is full, 'drop_newest' discards
+                the new row, 'drop_oldest' discards the oldest waiting
+                row and 'block' waits up to block_timeout for space
+                before discarding the new row
+            batch_size (int): Most rows written per request
+            flush_interval (float): Seconds the worker waits for more
+                rows before writing a partial batch
+            block_timeout (float): Seconds log() may block under the
+                'block' policy
+
+        Raises:
+            ValueError: If policy is not one of POLICIES
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(
+                f"policy must be one of {', '.join(self.POLICIES)}"
+            )
+
+        self.sheets_handler = sheets_handler
+        self.policy = policy
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.block_timeout = block_timeout
+        self.logged = 0
+        self.dropped = 0
+        self.failed = 0
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._closed = False
+        self._stop = object()
+        self._worker = threading.Thread(
+            target=self._run, name='session-logger', daemon=True
+        )
+        self._worker.start()
+
+    def log(self, username, action, status='Success'):
+        """
+        Queue a session log row without waiting for it to be written.
+
+        Args:
+            username (str): Name of the user
+            action (str): Action performed
+            status (str): Outcome of the action
+
+        Returns:
+            bool: True if the row was queued, False if it was dropped
+        """
+        if self._closed:
+            return False
+
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        row = [timestamp, username, action, status]
+
+        if self.policy == 'block':
+            try:
+                self._queue.put(row, timeout=self.block_timeout)
+                return True
+            except queue.Full:
+                self.dropped += 1
+                return False
+
+        while True:
+            try:
+                self._queue.put_nowait(row)
+                return True
+            except queue.Full:
+                if self.policy == 'drop_newest':
+                    self.dropped += 1
+                    return False
+            # Make room by discarding the oldest waiting row
+            try:
+                self._queue.get_nowait()
+                self.dropped += 1
+            except queue.Empty:
+                pass
+
+    def _run(self):
+        """Write queued rows in batches until the logger is closed."""
+        stopping = False
+        while not stopping:
+            batch = []
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+
+            # Gather whatever else is already waiting, up to a batch
+            while True:
+                if item is self._stop:
+                    stopping = True
+                else:
+                    batch.append(item)
+                if stopping or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if stopping:
+                # Nothing can be queued after close(), so drain the rest
+                while True:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+            if batch:
+                self._write(batch)
+
+    def _write(self, rows):
+        """Write a batch of rows, counting them as logged or failed."""
+        for start in range(0, len(rows), self.batch_size):
+            chunk = rows[start:start + self.batch_size]
+            if (self.sheets_handler.log_session_rows(chunk)
+                    and self.sheets_handler.flush()):
+                self.logged += len(chunk)
+            else:
+                self.failed += len(chunk)
+
+    def close(self, timeout=10.0):
+        """
+        Stop accepting rows and wait for the queued ones to be written.
+
+        Args:
+            timeout (float): Most seconds to wait for the worker
+
+        Returns:
+            bool: True if every queued row was handled in time
+        """
+        if not self._closed:
+            self._closed = True
+            # The worker makes room for the sentinel as it drains
+            try:
+                self._queue.put(self._stop, timeout=timeout)
+            except queue.Full:
+                return False
+        self._worker.join(timeout)
+        return not self._worker.is_alive()
+
+    def stats(self):
+        """
+        Get logging counters.
+
+        Returns:
+            dict: Rows logged, dropped, failed and still queued
+        """
+        return {
+            'logged': self.logged,
+            'dropped': self.dropped,
+            'failed': self.failed,
+            'queued': self._queue.qsize()
+        }
@@ -0,0 +1,315 @@
+"""
+Session Server Module for Personal Finance Survey Analyzer.
+
+This module serves terminal sessions of run.py from a pre-forked pool.
+The server imports the application and warms its caches once, then
+forks workers that wait for connections on a Unix socket. Each accepted
+connection gets the app on its own pseudo-terminal, so a session starts
+in milliseconds instead of paying for a fresh interpreter, imports and
+data load.
+
+    python3 -m src.session_server --socket /tmp/finance.sock
+"""
+
+import argparse
+import contextlib
+import errno
+import fcntl
+import io
+import os
+import pty
+import select
+import signal
+import socket
+import struct
+import sys
+import termios
+import time
+import traceback
+
+
+# Warm workers kept waiting for a connection
+POOL_SIZE = 4
+# Most sessions served at once; further connections are turned away
+MAX_SESSIONS = 20
+# Seconds without keyboard input before a session is ended
+IDLE_TIMEOUT = 15 * 60
+
+# Terminal the web client draws, as the node-pty spawn used
+TERMINAL = ('xterm-color', 24, 80)
+
+BUSY_MESSAGE = (
+    b"\r\nThe analyzer is at capacity. Please try again in a minute.\r\n"
+)
+IDLE_MESSAGE = b"\r\n\r\nSession ended after %d minutes without input.\r\n"
+
+
+def warm_up(base_dir):
+    """
+    Import the app and its lazily loaded stacks, and warm the data cache.
+
+    Done once in the server, so every forked session shares the work.
+    Nothing here may start a thread: the server forks afterwards.
+
+    Args:
+        base_dir (str): Project root holding run.py and data/
+    """
+    # Imported here: the server imports the app once, before forking
+    import run
+    import src.visualizer  # noqa: F401 - matplotlib and seaborn
+    import src.google_sheets_handler  # noqa: F401 - gspread, google-auth
+    import src.session_logger  # noqa: F401
+    from src.cache import SurveyDataCache
+    from src.utils import enable_copy_on_write
+
+    # Set before forking, so every session inherits it
+    enable_copy_on_write()
+
+    # Fills the on-disk cache and imports its Feather readers
+    with contextlib.redirect_stdout(io.StringIO()):
+        run.DataHandler(
+            cache=SurveyDataCache(
+                os.path.join(base_dir, '.cache', 'survey_data')
+            )
+        ).load_csv(os.path.join(base_dir, 'data', 'sample_survey.csv'))
+
+
+def run_app():
+    """Run the app on the pseudo-terminal this process was forked onto."""
+    name, rows, cols = TERMINAL
+    os.environ['TERM'] = name
+    # The inherited streams were set up for the server's pipes or files;
+    # open new ones on the terminal
+    sys.stdin = open(0, 'r', encoding='utf-8', closefd=False)
+    sys.stdout = open(1, 'w', encoding='utf-8', buffering=1, closefd=False)
+    sys.stderr = open(2, 'w', encoding='utf-8', buffering=1, closefd=False)
+
+    import run
+
+    status = 0
+    try:
+        # The server's own arguments are not the app's
+        run.main([])
+    except SystemExit as e:
+        status = e.code if isinstance(e.code, int) else 0
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(status)
+
+
+class SessionServer:
+    """Pre-forked pool of workers serving run.py over a Unix socket."""
+
+    def __init__(self, socket_path, pool_size=POOL_SIZE,
+                 max_sessions=MAX_SESSIONS, idle_timeout=IDLE_TIMEOUT):
+        """
+        Initialize the server.
+
+        Args:
+            socket_path (str): Unix socket the sessions are served on
+            pool_size (int): Warm workers kept waiting for a connection
+            max_sessions (int): Most sessions served at once, including
+                the warm workers
+            idle_timeout (float): Seconds without input before a session
+                is ended, freeing its slot
+        """
+        self.socket_path = socket_path
+        self.pool_size = max(1, min(pool_size, max_sessions))
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        # Worker pid -> True once it is serving a session
+        self.workers = {}
+        self.turned_away = 0
+        self._listener = None
+        self._status_read = None
+        self._status_write = None
+        self._running = False
+
+    def serve_forever(self):
+        """Keep the pool filled and reap finished sessions until stopped."""
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.socket_path)
+        self._listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._listener.bind(self.socket_path)
+        self._listener.listen(self.max_sessions)
+        self._status_read, self._status_write = os.pipe()
+        self._running = True
+        signal.signal(signal.SIGTERM, self._stop)
+        print(f"Serving sessions on {self.socket_path}", flush=True)
+
+        try:
+            while self._running:
+                self._reap()
+                self._fill_pool()
+                # Only with every slot busy does the server accept
+                # connections itself, to turn them away
+                full = len(self.workers) >= self.max_sessions
+                watched = [self._status_read]
+                if full and self.idle_workers == 0:
+                    watched.append(self._listener)
+                try:
+                    ready, _, _ = select.select(watched, [], [], 1.0)
+                except InterruptedError:
+                    continue
+                if self._status_read in ready:
+                    self._read_status()
+                if self._listener in ready:
+                    self._turn_away()
+        finally:
+            self._shutdown()
+
+    @property
+    def idle_workers(self):
+        """int: Workers waiting for a connection."""
+        return sum(not busy for busy in self.workers.values())
+
+    def _fill_pool(self):
+        """Fork workers until the pool is full or the cap is reached."""
+        while (self.idle_workers < self.pool_size
+               and len(self.workers) < self.max_sessions):
+            pid = os.fork()
+            if pid == 0:
+                self._worker()
+            self.workers[pid] = False
+
+    def _read_status(self):
+        """Mark workers that accepted a connection as busy."""
+        data = os.read(self._status_read, 4096)
+        for offset in range(0, len(data), 4):
+            pid, = struct.unpack('i', data[offset:offset + 4])
+            if pid in self.workers:
+                self.workers[pid] = True
+
+    def _reap(self):
+        """Collect finished workers, freeing their slots."""
+        while self.workers:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                break
+            self.workers.pop(pid, None)
+
+    def _turn_away(self):
+        """Accept a connection over the cap and tell the user to wait."""
+        try:
+            connection, _ = self._listener.accept()
+        except BlockingIOError:
+            return
+        self.turned_away += 1
+        with connection:
+            with contextlib.suppress(OSError):
+                connection.sendall(BUSY_MESSAGE)
+
+    def _stop(self, signum, frame):
+        """Stop serving at the next loop."""
+        self._running = False
+
+    def _shutdown(self):
+        """Stop the workers and remove the socket."""
+        for pid in list(self.workers):
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+        self._listener.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.socket_path)
+
+    def _worker(self):
+        """Wait for one connection, serve it and exit (forked child)."""
+        os.close(self._status_read)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        status = 0
+        try:
+            connection, _ = self._listener.accept()
+            self._listener.close()
+            os.write(self._status_write, struct.pack('i', os.getpid()))
+            self._serve(connection)
+        except Exception:
+            traceback.print_exc()
+            status = 1
+        finally:
+            os._exit(status)
+
+    def _serve(self, connection):
+        """Run the app on a new pseudo-terminal relayed to a connection."""
+        pid, master = pty.fork()
+        if pid == 0:
+            connection.close()
+            os.close(self._status_write)
+            run_app()
+
+        _, rows, cols = TERMINAL
+        fcntl.ioctl(
+            master, termios.TIOCSWINSZ, struct.pack('HHHH', rows, cols, 0, 0)
+        )
+        last_input = time.monotonic()
+        try:
+            while True:
+                timeout = last_input + self.idle_timeout - time.monotonic()
+                if timeout <= 0:
+                    connection.sendall(
+                        IDLE_MESSAGE % (self.idle_timeout // 60)
+                    )
+                    break
+                ready, _, _ = select.select(
+                    [connection, master], [], [], timeout
+                )
+                if connection in ready:
+                    data = connection.recv(65536)
+                    if not data:
+                        break
+                    os.write(master, data)
+                    last_input = time.monotonic()
+                if master in ready:
+                    try:
+                        data = os.read(master, 65536)
+                    except OSError as e:
+                        # EIO: the app exited and closed the terminal
+                        if e.errno != errno.EIO:
+                            raise
+                        data = b''
+                    if not data:
+                        break
+                    connection.sendall(data)
+        except OSError:
+            pass
+        finally:
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+            connection.close()
+
+
+def main():
+    """Parse the options, warm the app up and serve sessions."""
+    parser = argparse.ArgumentParser(
+        description="Serve run.py sessions from a pre-forked pool"
+    )
+    parser.add_argument('--socket', required=True,
+                        help="Unix socket to serve sessions on")
+    parser.add_argument('--size', type=int, default=POOL_SIZE,
+                        help="warm workers kept waiting (default %(default)s)")
+    parser.add_argument('--max-sessions', type=int, default=MAX_SESSIONS,
+                        help="most sessions at once (default %(default)s)")
+    parser.add_argument('--idle-timeout', type=float, default=IDLE_TIMEOUT,
+                        help="seconds without input before a session ends "
+                             "(default %(default)s)")
+    args = parser.parse_args()
+
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    os.chdir(base_dir)
+    start_time = time.perf_counter()
+    warm_up(base_dir)
+    print(f"Session server warmed up in "
+          f"{time.perf_counter() - start_time:.2f}s", flush=True)
+
+    SessionServer(
+        args.socket, pool_size=args.size, max_sessions=args.max_sessions,
+        idle_timeout=args.idle_timeout
+    ).serve_forever()
+
+
+if __name__ == '__main__':
+    main()
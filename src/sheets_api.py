@@ -0,0 +1,256 @@
+"""
+Sheets API Call Module for Personal Finance Survey Analyzer.
+
+This module routes Google Sheets API calls through client-side rate
+limiting and retries, so bursts of requests wait for quota instead of
+failing, and records latency and retry figures for every call.
+"""
+
+import random
+import threading
+import time
+
+import gspread
+import requests
+import urllib3
+
+
+# HTTP statuses worth retrying: quota exceeded and transient server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Statuses of requests the server rejected without applying them
+UNAPPLIED_STATUSES = {429}
+
+
+def _not_sent(error):
+    """
+    Check whether a failed request never reached the server.
+
+    Args:
+        error (Exception): Error raised by the call
+
+    Returns:
+        bool: True if the connection could not be opened
+    """
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    if isinstance(error, requests.ConnectionError) and error.args:
+        reason = getattr(error.args[0], 'reason', None)
+        return isinstance(reason, urllib3.exceptions.NewConnectionError)
+    return False
+
+
+class TokenBucket:
+    """Thread-safe token bucket that makes callers wait for capacity."""
+
+    def __init__(self, rate, capacity):
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate (float): Tokens added per second
+            capacity (float): Most tokens held, i.e. the largest burst
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        """
+        Take tokens, sleeping until the bucket can provide them.
+
+        Tokens are reserved before sleeping, so concurrent callers are
+        served in arrival order instead of racing for each refill.
+
+        Args:
+            tokens (float): Tokens needed
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= tokens
+            wait = max(0.0, -self._tokens / self.rate)
+
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+class SheetsApiCaller:
+    """Rate-limited, retrying wrapper for Google Sheets API calls."""
+
+    # Sheets allows 60 read and 60 write requests per minute per user
+    REQUESTS_PER_MINUTE = 60
+    BURST = 10
+
+    def __init__(self, requests_per_minute=REQUESTS_PER_MINUTE, burst=BURST,
+                 max_retries=5, base_delay=1.0, max_delay=32.0):
+        """
+        Initialize the caller with one token bucket per quota.
+
+        Args:
+            requests_per_minute (int): Sustained requests per minute for
+                each of the read and write quotas
+            burst (int): Requests that may be sent at once; kept small
+                so no rolling minute goes far over the quota
+            max_retries (int): Retries of a failing call before giving up
+            base_delay (float): Backoff ceiling of the first retry, in
+                seconds, doubling with each further retry
+            max_delay (float): Largest backoff ceiling, in seconds
+        """
+        self.buckets = {
+            kind: TokenBucket(requests_per_minute / 60, burst)
+            for kind in ('read', 'write')
+        }
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def call(self, kind, func, *args, idempotent=True, **kwargs):
+        """
+        Call an API function within quota, retrying transient errors.
+
+        Retries back off exponentially with full jitter (a random delay
+        up to the current ceiling), or wait as long as a Retry-After
+        header asks. A write that is not idempotent (appending rows,
+        creating a spreadsheet) may have been applied even though it
+        timed out or got a server error, so it is only retried when the
+        server rejected it for quota or it was never sent.
+
+        Args:
+            kind (str): Quota the call counts against, 'read' or 'write'
+            func (callable): gspread method or function to call
+            *args: Positional arguments for func
+            idempotent (bool): Whether repeating the call is harmless
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The value returned by func
+
+        Raises:
+            gspread.exceptions.APIError: If the call fails with a status
+                that is not retryable, or after max_retries retries
+            requests.RequestException: If the connection keeps failing
+        """
+        name = getattr(func, '__name__', repr(func))
+        for attempt in range(self.max_retries + 1):
+            throttled = self.buckets[kind].acquire()
+            start_time = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except (gspread.exceptions.APIError,
+                    requests.ConnectionError, requests.Timeout) as e:
+                self._record(
+                    name, time.perf_counter() - start_time, throttled,
+                    failed=True
+                )
+                delay = self._retry_delay(e, attempt, idempotent)
+                if delay is None:
+                    raise
+                self._record_retry(name)
+                time.sleep(delay)
+            else:
+                self._record(
+                    name, time.perf_counter() - start_time, throttled
+                )
+                return result
+
+    def _retry_delay(self, error, attempt, idempotent=True):
+        """
+        Work out how long to wait before retrying a failed call.
+
+        Args:
+            error (Exception): Error raised by the call
+            attempt (int): Number of retries made so far
+            idempotent (bool): Whether repeating the call is harmless
+
+        Returns:
+            float or None: Seconds to wait, or None to give up
+        """
+        if attempt >= self.max_retries:
+            return None
+
+        response = getattr(error, 'response', None)
+        if isinstance(error, gspread.exceptions.APIError):
+            retryable = (
+                RETRY_STATUSES if idempotent else UNAPPLIED_STATUSES
+            )
+            if response is None or (
+                    response.status_code not in retryable):
+                return None
+        elif not idempotent and not _not_sent(error):
+            return None
+
+        retry_after = (
+            response.headers.get('Retry-After')
+            if response is not None else None
+        )
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+
+        ceiling = min(self.max_delay, self.base_delay * 2 ** attempt)
+        return random.uniform(0, ceiling)
+
+    def _record(self, name, seconds, throttled, failed=False):
+        """Add one attempt of a call to its metrics."""
+        with self._lock:
+            metrics = self._metrics.setdefault(name, {
+                'calls': 0, 'failures': 0, 'retries': 0,
+                'seconds': 0.0, 'max_seconds': 0.0, 'throttled_seconds': 0.0
+            })
+            metrics['calls'] += 1
+            metrics['failures'] += failed
+            metrics['seconds'] += seconds
+            metrics['max_seconds'] = max(metrics['max_seconds'], seconds)
+            metrics['throttled_seconds'] += throttled
+
+    def _record_retry(self, name):
+        """Count a retry of a call."""
+        with self._lock:
+            self._metrics[name]['retries'] += 1
+
+    def stats(self):
+        """
+        Get per-call metrics.
+
+        Returns:
+            dict: For each API method, the attempts, failed attempts,
+                retries, mean and max latency and the time spent waiting
+                for quota, in seconds
+        """
+        with self._lock:
+            return {
+                name: {
+                    'calls': metrics['calls'],
+                    'failures': metrics['failures'],
+                    'retries': metrics['retries'],
+                    'mean_seconds': round(
+                        metrics['seconds'] / metrics['calls'], 4
+                    ),
+                    'max_seconds': round(metrics['max_seconds'], 4),
+                    'throttled_seconds': round(
+                        metrics['throttled_seconds'], 3
+                    )
+                }
+                for name, metrics in self._metrics.items()
+            }
+
+    def reset_stats(self):
+        """Clear the per-call metrics."""
+        with self._lock:
+            self._metrics = {}
+
+
+# Caller shared by every handler, so all of them draw on the same quota
+SHEETS_API = SheetsApiCaller()
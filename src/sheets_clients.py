@@ -0,0 +1,219 @@
+"""
+Sheets Client Pool Module for Personal Finance Survey Analyzer.
+
+This module keeps authorized Google Sheets clients alive for the whole
+process. Credentials are parsed and clients authorized once per
+credentials source, so reconnecting handlers reuse the client and its
+keep-alive HTTP session, and a background thread refreshes access
+tokens before they expire so no request waits on a token fetch.
+"""
+
+import hashlib
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+
+import requests
+
+
+class SheetsClientPool:
+    """Process-wide cache of authorized clients with token refresh."""
+
+    # Tokens are refreshed once they have less than this left...
+    REFRESH_MARGIN = 300
+    # ...checking every this many seconds
+    CHECK_INTERVAL = 60
+
+    def __init__(self, refresh_margin=REFRESH_MARGIN,
+                 check_interval=CHECK_INTERVAL):
+        """
+        Initialize an empty pool.
+
+        Args:
+            refresh_margin (float): Seconds before expiry at which an
+                access token is refreshed
+            check_interval (float): Seconds between token expiry checks
+        """
+        self.refresh_margin = timedelta(seconds=refresh_margin)
+        self.check_interval = check_interval
+        self._clients = {}
+        self._key_locks = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._refresher = None
+        self._token_request = None
+        self._stats = {'authorized': 0, 'reused': 0, 'refreshed': 0,
+                       'refresh_failures': 0}
+
+    def client(self, backend, credentials_file):
+        """
+        Get an authorized client, authorizing one on first use.
+
+        Args:
+            backend: Sheets backend, e.g. GspreadBackend
+            credentials_file (str): Path to the credentials JSON file
+
+        Returns:
+            Client returned by backend.authorize()
+
+        Raises:
+            Whatever backend.authorize() raises; failures are not cached
+        """
+        key = self._key(backend, credentials_file)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # Callers of one key wait for a single authorization, e.g. one
+        # already started by prewarm()
+        with key_lock:
+            with self._lock:
+                if key in self._clients:
+                    self._stats['reused'] += 1
+                    return self._clients[key]
+
+            client = backend.authorize(credentials_file)
+            credentials = self._credentials(client)
+            if credentials is not None:
+                self._refresh(credentials)
+
+            with self._lock:
+                self._clients[key] = client
+                self._stats['authorized'] += 1
+                if credentials is not None:
+                    self._start_refresher()
+            return client
+
+    def prewarm(self, backend, credentials_file):
+        """
+        Authorize a client and fetch its first token in the background.
+
+        Errors are ignored here; they are reported when a handler
+        connects and the authorization is tried again.
+
+        Args:
+            backend: Sheets backend, e.g. GspreadBackend
+            credentials_file (str): Path to the credentials JSON file
+
+        Returns:
+            threading.Thread: The started thread
+        """
+        def warm():
+            try:
+                self.client(backend, credentials_file)
+            except Exception:
+                # Reported when connect() authorizes again
+                pass
+
+        thread = threading.Thread(
+            target=warm, name='sheets-prewarm', daemon=True
+        )
+        thread.start()
+        return thread
+
+    def _key(self, backend, credentials_file):
+        """Get the cache key of a backend and credentials source."""
+        cache_key = getattr(backend, 'cache_key', None)
+        if cache_key is None:
+            return (backend, credentials_file)
+        return cache_key(credentials_file)
+
+    @staticmethod
+    def _credentials(client):
+        """Get the google-auth credentials behind a gspread client."""
+        http_client = getattr(client, 'http_client', None)
+        credentials = getattr(http_client, 'auth', None)
+        return credentials if hasattr(credentials, 'refresh') else None
+
+    def _needs_refresh(self, credentials):
+        """Check whether a token is missing or close to expiry."""
+        if not credentials.token:
+            return True
+        if credentials.expiry is None:
+            return False
+        # google-auth keeps expiry as naive UTC
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return credentials.expiry - now < self.refresh_margin
+
+    def _refresh(self, credentials):
+        """Fetch a new access token over a reused session."""
+        # Imported here: only needed once there are live credentials
+        from google.auth.transport.requests import Request
+
+        # One transport for every refresh: dropping a Request closes its
+        # session, and with it the kept-alive connection
+        if self._token_request is None:
+            self._token_request = Request(requests.Session())
+        try:
+            credentials.refresh(self._token_request)
+        except Exception:
+            # The client's session refreshes on its next request instead
+            with self._lock:
+                self._stats['refresh_failures'] += 1
+            return False
+        with self._lock:
+            self._stats['refreshed'] += 1
+        return True
+
+    def _start_refresher(self):
+        """Start the token refresh thread if it is not running."""
+        if self._refresher is None or not self._refresher.is_alive():
+            self._stop.clear()
+            self._refresher = threading.Thread(
+                target=self._refresh_loop, name='sheets-token-refresh',
+                daemon=True
+            )
+            self._refresher.start()
+
+    def _refresh_loop(self):
+        """Refresh tokens nearing expiry until the pool is closed."""
+        while not self._stop.wait(self.check_interval):
+            with self._lock:
+                clients = list(self._clients.values())
+            for client in clients:
+                credentials = self._credentials(client)
+                if (credentials is not None
+                        and self._needs_refresh(credentials)):
+                    self._refresh(credentials)
+
+    def clear(self):
+        """Drop every client and stop the refresh thread."""
+        self._stop.set()
+        with self._lock:
+            self._clients = {}
+            self._key_locks = {}
+
+    def stats(self):
+        """
+        Get pool counters.
+
+        Returns:
+            dict: Clients held, authorizations, reuses, token refreshes
+                and failed refreshes
+        """
+        with self._lock:
+            return {'clients': len(self._clients), **self._stats}
+
+
+def credentials_key(credentials_file):
+    """
+    Identify a credentials source, changing when the credentials do.
+
+    Args:
+        credentials_file (str): Path to the credentials JSON file, used
+            unless the CREDS environment variable holds them
+
+    Returns:
+        tuple: Hash of CREDS, or the file path and modification time
+    """
+    creds_json = os.environ.get('CREDS')
+    if creds_json:
+        return ('env', hashlib.sha256(creds_json.encode()).hexdigest())
+    try:
+        modified = os.path.getmtime(credentials_file)
+    except OSError:
+        modified = None
+    return ('file', os.path.abspath(credentials_file), modified)
+
+
+# Pool shared by every handler in the process
+CLIENT_POOL = SheetsClientPool()
@@ -0,0 +1,263 @@
+"""
+Quantile Sketch Module for Personal Finance Survey Analyzer.
+
+This module provides a mergeable quantile sketch (KLL) so that medians
+and percentile bands can be estimated in one pass over streamed or
+partitioned survey data, using memory that does not grow with the
+number of rows. It also provides MedianWindow, which keeps an exact
+median up to date as rows are appended.
+"""
+
+import math
+import numpy as np
+
+
+class QuantileSketch:
+    """KLL sketch answering rank queries within a configurable error."""
+
+    # Capacity ratio between a level and the one above it
+    CAPACITY_DECAY = 2 / 3
+    MIN_CAPACITY = 2
+
+    def __init__(self, error=0.01, seed=0):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            error (float): Target normalized rank error, e.g. 0.01 means
+                an estimated median lies between the 49th and 51st
+                percentile (with 99% confidence)
+            seed (int): Seed for the compaction coin flips, fixed by
+                default so reports are reproducible
+        """
+        if not 0 < error < 1:
+            raise ValueError("error must be between 0 and 1")
+
+        self.error = error
+        # Inverse of the empirical KLL bound, error ~ 2.446 / k ** 0.9433
+        self.k = max(8, math.ceil((2.446 / error) ** (1 / 0.9433)))
+        self.count = 0
+        self.min = np.nan
+        self.max = np.nan
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level):
+        """Get the number of items a level may hold before compaction."""
+        depth = len(self.levels) - level - 1
+        return max(
+            self.MIN_CAPACITY,
+            math.ceil(self.k * self.CAPACITY_DECAY ** depth)
+        )
+
+    def update(self, values):
+        """
+        Add a batch of values to the sketch.
+
+        Args:
+            values (np.ndarray): Float64 values, NaN for missing
+        """
+        values = np.asarray(values, dtype='float64')
+        values = values[~np.isnan(values)]
+        if not values.size:
+            return
+
+        self.count += values.size
+        self.min = np.fmin(self.min, values.min())
+        self.max = np.fmax(self.max, values.max())
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other):
+        """
+        Fold another sketch (built with the same error) into this one.
+
+        Args:
+            other (QuantileSketch): Sketch of further values
+
+        Raises:
+            ValueError: If the sketches were built with different errors
+        """
+        if other.k != self.k:
+            raise ValueError("Cannot merge sketches with different errors")
+        if not other.count:
+            return
+
+        self.count += other.count
+        self.min = np.fmin(self.min, other.min)
+        self.max = np.fmax(self.max, other.max)
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self._compress()
+
+    def _compress(self):
+        """Compact the lowest overfull level until every level fits."""
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if items.size <= self._capacity(level):
+                level += 1
+                continue
+
+            if level + 1 == len(self.levels):
+                self.levels.append(np.empty(0))
+
+            # Raw values need a full sort; higher levels are made of
+            # sorted runs, which the stable (merging) sort handles cheaply
+            items = np.sort(items, kind='stable' if level else 'quicksort')
+            # An odd item out stays behind so every compacted pair is whole
+            kept = items[:items.size % 2]
+            paired = items[items.size % 2:]
+
+            # Promote one item of each pair, chosen at random, with the
+            # level above counting every item twice
+            promoted = paired[self._rng.integers(2)::2]
+            self.levels[level] = kept
+            self.levels[level + 1] = np.concatenate(
+                [self.levels[level + 1], promoted]
+            )
+
+            # A new top level shrinks the capacity of the levels below
+            level = 0
+
+    def quantiles(self, probabilities):
+        """
+        Estimate several quantiles at once.
+
+        Args:
+            probabilities (iterable): Quantiles to estimate, each in [0, 1]
+
+        Returns:
+            np.ndarray: Estimated values, NaN if the sketch is empty
+        """
+        probabilities = np.asarray(probabilities, dtype='float64')
+        if not self.count:
+            return np.full(probabilities.shape, np.nan)
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([
+            np.full(level.size, 2 ** depth, dtype='float64')
+            for depth, level in enumerate(self.levels)
+        ])
+        order = np.argsort(items, kind='stable')
+        items = items[order]
+        cumulative = np.cumsum(weights[order])
+
+        positions = np.searchsorted(
+            cumulative, probabilities * cumulative[-1], side='left'
+        )
+        estimates = items[np.minimum(positions, items.size - 1)]
+
+        # The exact extremes are tracked, so use them at either end
+        estimates = np.where(probabilities <= 0, self.min, estimates)
+        return np.where(probabilities >= 1, self.max, estimates)
+
+    def quantile(self, probability):
+        """
+        Estimate a single quantile.
+
+        Args:
+            probability (float): Quantile to estimate, in [0, 1]
+
+        Returns:
+            float: Estimated value, NaN if the sketch is empty
+        """
+        return float(self.quantiles([probability])[0])
+
+    def median(self):
+        """
+        Estimate the median.
+
+        Returns:
+            float: Estimated median, NaN if the sketch is empty
+        """
+        return self.quantile(0.5)
+
+    @property
+    def nbytes(self):
+        """int: Memory held by the retained items."""
+        return sum(level.nbytes for level in self.levels)
+
+
+class MedianWindow:
+    """Exact median of a growing set of values, from a window around it."""
+
+    # Values kept on either side of the median
+    HALF_WIDTH = 1 << 14
+
+    def __init__(self, values, half_width=HALF_WIDTH):
+        """
+        Keep the values around the median, sorted.
+
+        Only the values ranked within half_width of the median are kept,
+        with counts of those below and above. Appended values are merged
+        into the window (or counted) until the median moves out of it.
+
+        Args:
+            values (np.ndarray): Float64 values, NaN for missing
+            half_width (int): Values kept on either side of the median
+        """
+        values = np.asarray(values, dtype='float64')
+        values = values[~np.isnan(values)]
+        self.count = values.size
+        self.below = 0
+        if values.size > 2 * half_width + 1:
+            middle = values.size // 2
+            low, high = middle - half_width, middle + half_width
+            values = np.partition(values, [low, high])[low:high + 1]
+            self.below = low
+        self.window = np.sort(values)
+
+    @property
+    def complete(self):
+        """bool: Whether the window holds every value."""
+        return self.window.size == self.count
+
+    def merge(self, other):
+        """
+        Fold in the values of another window.
+
+        Args:
+            other (MedianWindow): Window of further values
+
+        Returns:
+            bool: True if merged; False if other does not hold all of
+                its values, which cannot then be placed
+        """
+        if not other.complete:
+            return False
+
+        values = other.window
+        if not self.complete and self.window.size:
+            below = values < self.window[0]
+            above = values > self.window[-1]
+            self.below += int(np.count_nonzero(below))
+            values = values[~(below | above)]
+        self.count += other.count
+        self.window = np.insert(
+            self.window, np.searchsorted(self.window, values), values
+        )
+        return True
+
+    def median(self):
+        """
+        Get the median, averaging the middle two of an even count.
+
+        Returns:
+            float or None: Median (NaN if there are no values), or None
+                if it has moved out of the window
+        """
+        if not self.count:
+            return np.nan
+        first = (self.count - 1) // 2 - self.below
+        second = self.count // 2 - self.below
+        if first < 0 or second >= self.window.size:
+            return None
+        return (self.window[first] + self.window[second]) / 2
+
+    @property
+    def nbytes(self):
+        """int: Memory held by the window."""
+        return self.window.nbytes
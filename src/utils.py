@@ -8,6 +8,54 @@ for input validation, screen management, and common operations.
 import os
 import sys
 
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+
+def copy_on_write_enabled():
+    """
+    Check whether pandas copy-on-write is on.
+
+    Returns:
+        bool: True if frames sharing buffers cannot modify each other
+    """
+    if int(pd.__version__.split('.')[0]) >= 3:
+        # Always on from pandas 3
+        return True
+    return bool(pd.get_option('mode.copy_on_write'))
+
+
+def enable_copy_on_write():
+    """
+    Turn on pandas copy-on-write for this process.
+
+    Called by the entry points (run.py, app.py, the batch workers and
+    the session server) rather than on import, so that importing src
+    does not change pandas behaviour for other code. With it on, the
+    handler, analyzer and visualizer share one survey frame's buffers.
+    """
+    if not copy_on_write_enabled():
+        pd.set_option('mode.copy_on_write', True)
+
+
+def shared_copy(data):
+    """
+    Copy a DataFrame for another component, sharing buffers if safe.
+
+    Args:
+        data (pd.DataFrame): Frame to copy
+
+    Returns:
+        pd.DataFrame: A shallow copy under copy-on-write, where a write
+            through either frame copies just the affected column; a deep
+            copy otherwise
+    """
+    return data.copy(deep=not copy_on_write_enabled())
+
 
 def clear_screen():
     """Clear the terminal screen for better user experience."""
@@ -169,6 +217,59 @@ def handle_file_error(error, filename):
         print(f"❌ Error processing file {filename}: {str(error)}")
 
 
+def _proc_status_mb(field):
+    """Read a memory field of /proc/self/status in megabytes (Linux)."""
+    try:
+        with open('/proc/self/status', encoding='ascii') as status:
+            for line in status:
+                if line.startswith(field + ':'):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return None
+
+
+def start_peak_memory_window():
+    """
+    Start measuring the peak resident set size from now.
+
+    On Linux the kernel's high-water mark is reset, so a following
+    get_peak_memory_mb() covers only what happened since. Elsewhere the
+    peak stays the lifetime high-water mark of the process.
+
+    Returns:
+        float or None: Current RSS in megabytes if the peak was reset,
+            None if it could not be
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w', encoding='ascii') as refs:
+            refs.write('5')
+    except OSError:
+        return None
+    return _proc_status_mb('VmRSS')
+
+
+def get_peak_memory_mb():
+    """
+    Get the peak resident set size of the current process.
+
+    This is the high-water mark since the last start_peak_memory_window()
+    on Linux, and over the whole process lifetime otherwise.
+
+    Returns:
+        float or None: Peak RSS in megabytes, or None if unavailable
+    """
+    peak = _proc_status_mb('VmHWM')
+    if peak is not None or resource is None:
+        return peak
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere
+    if sys.platform == 'darwin':
+        return round(peak / (1024 * 1024), 1)
+    return round(peak / 1024, 1)
+
+
 def create_directory_if_not_exists(directory_path):
     """
     Create directory if it doesn't exist.
@@ -3,32 +3,263 @@ Data Visualizer Module - STREAMLIT COMPATIBLE VERSION
 Modified to return figures for web display
 """
 
+import io
+import matplotlib
 import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
 import numpy as np
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from src.cache import FigureCache, dataset_fingerprint
+from src.chart_data import SCATTER_POINT_LIMIT, ChartData
+from src.utils import shared_copy
+
+
+# Charts written by export_all_charts: (chart name, file name)
+EXPORT_CHARTS = [
+    ('spending', 'spending_analysis.png'),
+    ('savings', 'savings_analysis.png'),
+    ('investment', 'investment_analysis.png'),
+    ('literacy', 'literacy_analysis.png'),
+    ('dashboard', 'comprehensive_dashboard.png'),
+]
+
+
+# Figure size of each chart, in inches
+CHART_FIGSIZES = {
+    'spending': (15, 12),
+    'savings': (15, 12),
+    'investment': (15, 12),
+    'literacy': (15, 12),
+    'dashboard': (20, 16),
+}
+
+# Resolution of charts shown in the app and of exported files
+DISPLAY_DPI = 200
+EXPORT_DPI = 300
+
+# Rendered chart images shared by every visualizer in the process
+FIGURE_CACHE = FigureCache(max_bytes=128 * 1024 * 1024)
+
+# A spawned render worker spends about as long importing pandas and
+# matplotlib as rendering a chart takes, and rendering barely grows with
+# the row count, so workers='auto' only uses a pool for large data on a
+# machine with cores to spare, and with few workers
+PARALLEL_EXPORT_MIN_ROWS = 1_000_000
+PARALLEL_EXPORT_MIN_CPUS = 4
+MAX_EXPORT_WORKERS = 3
+
+
+# Colour map used in place of each point colour for density rendering
+DENSITY_COLORMAPS = {'green': 'Greens', 'purple': 'Purples'}
+
+
+def setup_chart_style():
+    """Set up matplotlib and seaborn styling."""
+    plt.style.use('default')
+    sns.set_palette("husl")
+    plt.rcParams['figure.figsize'] = (10, 6)
+    plt.rcParams['font.size'] = 10
+
+
+def _init_render_worker():
+    """Prepare a chart render process: Agg backend and chart styling."""
+    matplotlib.use('Agg')
+    setup_chart_style()
+
+
+def _render_chart(chart, payload, fmt, dpi):
+    """
+    Render one chart to image bytes, here or in a worker process.
+
+    Args:
+        chart (str): Chart name (see EXPORT_CHARTS)
+        payload (dict): Chart payload from ChartData
+        fmt (str): Image format, 'png' or 'svg'
+        dpi (int): Resolution
+
+    Returns:
+        tuple: (image bytes or None if nothing was drawn, render time
+            in seconds)
+    """
+    start_time = time.perf_counter()
+    fig = DataVisualizer.DRAWERS[chart](payload)
+    image = _figure_bytes(fig, fmt, dpi) if fig is not None else None
+    return image, time.perf_counter() - start_time
+
+
+def _draw_histogram(ax, histogram, **style):
+    """Draw pre-binned counts as a histogram."""
+    ax.hist(
+        histogram['edges'][:-1], bins=histogram['edges'],
+        weights=histogram['counts'], **style
+    )
+
+
+def _draw_scatter(ax, scatter, color=None):
+    """
+    Draw a scatter payload as points or, for large data, as a density.
+
+    Args:
+        ax (Axes): Axes to draw on
+        scatter (dict): Scatter payload from ChartData
+        color (str): Point colour; also picks the density colour map
+    """
+    if scatter['kind'] == 'points':
+        ax.scatter(scatter['x'], scatter['y'], alpha=0.6, color=color)
+        return
+
+    counts = np.ma.masked_equal(scatter['counts'].T, 0)
+    mesh = ax.pcolormesh(
+        scatter['x_edges'], scatter['y_edges'], counts,
+        cmap=DENSITY_COLORMAPS.get(color, 'Blues')
+    )
+    ax.figure.colorbar(mesh, ax=ax, label='Respondents')
+
+
+def _draw_trend(ax, trend):
+    """Draw a fitted trend line, if there is one."""
+    if trend is not None:
+        ax.plot(trend['x'], trend['y'], "r--", alpha=0.8)
+
+
+def _figure_bytes(fig, fmt, dpi):
+    """Save a figure into memory and close it."""
+    buffer = io.BytesIO()
+    try:
+        fig.savefig(buffer, format=fmt, dpi=dpi, bbox_inches='tight')
+    finally:
+        plt.close(fig)
+    return buffer.getvalue()
+
+
+def _finish_figure(fig, save_path):
+    """Save and close a figure if a path is given, else return it."""
+    if save_path:
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        fig.savefig(save_path, dpi=EXPORT_DPI, bbox_inches='tight')
+        plt.close(fig)
+        return True
+    return fig  # Return figure for Streamlit display
+
+
+def default_export_workers(row_count):
+    """
+    Choose the number of processes rendering exported charts.
+
+    Args:
+        row_count (int): Rows of the visualized data
+
+    Returns:
+        int or None: Worker count, None to render in this process
+    """
+    cpus = os.cpu_count() or 1
+    if (row_count < PARALLEL_EXPORT_MIN_ROWS
+            or cpus < PARALLEL_EXPORT_MIN_CPUS):
+        return None
+    return min(cpus - 1, MAX_EXPORT_WORKERS)
 
 
 class DataVisualizer:
     """Handles data visualization and chart generation."""
 
-    def __init__(self, data):
+    def __init__(self, data, scatter_limit=SCATTER_POINT_LIMIT,
+                 large_scatter='density', figure_cache=None,
+                 fingerprint=None):
         """
         Initialize the visualizer with survey data.
 
+        The survey data is shared with the caller rather than copied
+        (see FinanceAnalyzer). Charts are drawn from payloads that
+        ChartData builds once per dataset, and rendered images are kept
+        in a figure cache keyed by the dataset fingerprint.
+
         Args:
             data (pd.DataFrame): Survey data to visualize
+            scatter_limit (int): Most points a scatter plot draws; above
+                it scatter plots use large_scatter rendering
+            large_scatter (str): 'density' (2D histogram) or 'sample'
+                (stratified sample of scatter_limit points)
+            figure_cache (FigureCache): Optional cache for rendered
+                images, defaults to the shared FIGURE_CACHE
+            fingerprint (str): dataset_fingerprint of data if already
+                known (see DataHandler.get_fingerprint)
         """
-        self.data = data.copy() if data is not None else pd.DataFrame()
+        self.data = (
+            shared_copy(data) if data is not None else pd.DataFrame()
+        )
+        self.scatter_limit = scatter_limit
+        self.large_scatter = large_scatter
+        self.chart_data = ChartData(
+            self.data, scatter_limit=scatter_limit,
+            large_scatter=large_scatter
+        )
+        self.figure_cache = (
+            figure_cache if figure_cache is not None else FIGURE_CACHE
+        )
+        self._fingerprint = fingerprint
+        # Seconds spent on each chart by the last export_all_charts call
+        self.render_timings = {}
         self.setup_style()
 
     def setup_style(self):
         """Set up matplotlib and seaborn styling."""
-        plt.style.use('default')
-        sns.set_palette("husl")
-        plt.rcParams['figure.figsize'] = (10, 6)
-        plt.rcParams['font.size'] = 10
+        setup_chart_style()
+
+    def get_fingerprint(self):
+        """
+        Get the fingerprint of the visualized dataset.
+
+        Returns:
+            str: Dataset fingerprint, computed once per visualizer
+        """
+        if self._fingerprint is None:
+            self._fingerprint = dataset_fingerprint(self.data)
+        return self._fingerprint
+
+    def _figure_key(self, chart, fmt, dpi):
+        """Build the figure cache key of a rendered chart."""
+        return (
+            self.get_fingerprint(), chart, CHART_FIGSIZES[chart], dpi, fmt,
+            self.scatter_limit, self.large_scatter
+        )
+
+    def render_chart(self, chart, fmt='png', dpi=DISPLAY_DPI):
+        """
+        Get a chart as image bytes, rendering it only on a cache miss.
+
+        The figure is closed once rendered, so repeated views neither
+        redraw the chart nor keep figures open.
+
+        Args:
+            chart (str): Chart name (see EXPORT_CHARTS)
+            fmt (str): Image format, 'png' or 'svg'
+            dpi (int): Resolution
+
+        Returns:
+            bytes: Rendered image, or None if the chart cannot be drawn
+        """
+        key = self._figure_key(chart, fmt, dpi)
+        image = self.figure_cache.get(key)
+        if image is None:
+            image, _ = _render_chart(
+                chart, self.chart_data.payload(chart), fmt, dpi
+            )
+            if image is not None:
+                self.figure_cache.put(key, image)
+        return image
+
+    def get_figure_cache_stats(self):
+        """
+        Get usage figures of the rendered figure cache.
+
+        Returns:
+            dict: Cache hits, misses, entries and bytes held
+        """
+        return self.figure_cache.stats()
 
     def create_spending_charts(self, save_path=None):
         """
@@ -40,32 +271,37 @@ class DataVisualizer:
         Returns:
             bool: True if successful
         """
-        if self.data.empty:
-            return None
+        return self.draw_spending_charts(
+            self.chart_data.payload('spending'), save_path
+        )
 
-        try:
-            # Find spending columns
-            spending_cols = [
-                col for col in self.data.columns
-                if 'spending' in col.lower()
-            ]
+    @staticmethod
+    def draw_spending_charts(payload, save_path=None):
+        """
+        Draw the spending charts from their payload.
 
-            if not spending_cols:
-                return None
+        Args:
+            payload (dict): Spending payload from ChartData
+            save_path (str): Optional path to save charts
 
+        Returns:
+            Figure, True if saved, or None if nothing can be drawn
+        """
+        if payload is None:
+            return None
+
+        try:
             # Create figure with 4 subplots (2 rows, 2 columns)
-            fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+            fig, axes = plt.subplots(
+                2, 2, figsize=CHART_FIGSIZES['spending']
+            )
             fig.suptitle(
                 'Personal Finance - Spending Analysis',
                 fontsize=16,
                 fontweight='bold')
 
             # Chart 1: Spending by category (pie chart)
-            spending_totals = {
-                col.replace('monthly_spending_', '').replace('_', ' ').title():
-                self.data[col].sum()
-                for col in spending_cols
-            }
+            spending_totals = payload['totals']
 
             axes[0, 0].pie(
                 spending_totals.values(),
@@ -75,11 +311,7 @@ class DataVisualizer:
             axes[0, 0].set_title('Spending Distribution by Category')
 
             # Chart 2: Average spending by category (bar chart)
-            avg_spending = {
-                col.replace('monthly_spending_', '').replace('_', ' ').title():
-                self.data[col].mean()
-                for col in spending_cols
-            }
+            avg_spending = payload['averages']
 
             categories = list(avg_spending.keys())
             values = list(avg_spending.values())
@@ -103,44 +335,28 @@ class DataVisualizer:
                 )
 
             # Chart 3: Spending vs Age (scatter plot with trend line)
-            if 'age' in self.data.columns:
-                total_spending = self.data[spending_cols].sum(axis=1)
-                axes[1, 0].scatter(
-                    self.data['age'], total_spending, alpha=0.6
-                )
+            if payload['age_scatter'] is not None:
+                _draw_scatter(axes[1, 0], payload['age_scatter'])
                 axes[1, 0].set_title('Total Spending vs Age')
                 axes[1, 0].set_xlabel('Age')
                 axes[1, 0].set_ylabel('Total Monthly Spending ($)')
 
                 # Add trend line
-                z = np.polyfit(self.data['age'], total_spending, 1)
-                p = np.poly1d(z)
-                axes[1, 0].plot(
-                    self.data['age'],
-                    p(self.data['age']),
-                    "r--",
-                    alpha=0.8
-                )
+                _draw_trend(axes[1, 0], payload['age_trend'])
 
             # Chart 4: Spending distribution (histogram)
-            total_spending = self.data[spending_cols].sum(axis=1)
-            axes[1, 1].hist(
-                total_spending, bins=10, alpha=0.7, edgecolor='black'
+            _draw_histogram(
+                axes[1, 1], payload['total_histogram'],
+                alpha=0.7, edgecolor='black'
             )
             axes[1, 1].set_title('Distribution of Total Monthly Spending')
             axes[1, 1].set_xlabel('Total Monthly Spending ($)')
             axes[1, 1].set_ylabel('Number of Respondents')
 
-            plt.tight_layout()
+            fig.tight_layout()
 
             # Save if path provided
-            if save_path:
-                os.makedirs(os.path.dirname(save_path), exist_ok=True)
-                plt.savefig(save_path, dpi=300, bbox_inches='tight')
-                plt.close()
-                return True
-            else:
-                return fig  # Return figure for Streamlit display
+            return _finish_figure(fig, save_path)
 
         except Exception as e:
             print(f"Error creating spending charts: {str(e)}")
@@ -148,20 +364,28 @@ class DataVisualizer:
 
     def create_savings_charts(self, save_path=None):
         """Create savings visualizations - returns figure for Streamlit."""
-        if (self.data.empty or
-                'monthly_savings' not in self.data.columns):
+        return self.draw_savings_charts(
+            self.chart_data.payload('savings'), save_path
+        )
+
+    @staticmethod
+    def draw_savings_charts(payload, save_path=None):
+        """Draw the savings charts from their payload."""
+        if payload is None:
             return None
 
         try:
-            fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+            fig, axes = plt.subplots(
+                2, 2, figsize=CHART_FIGSIZES['savings']
+            )
             fig.suptitle(
                 'Personal Finance - Savings Analysis',
                 fontsize=16,
                 fontweight='bold')
 
             # Chart 1: Savings distribution (histogram)
-            axes[0, 0].hist(
-                self.data['monthly_savings'], bins=12,
+            _draw_histogram(
+                axes[0, 0], payload['savings_histogram'],
                 alpha=0.7, edgecolor='black', color='green'
             )
             axes[0, 0].set_title('Distribution of Monthly Savings')
@@ -169,45 +393,20 @@ class DataVisualizer:
             axes[0, 0].set_ylabel('Number of Respondents')
 
             # Chart 2: Savings vs Income (scatter plot)
-            if 'annual_income' in self.data.columns:
-                axes[0, 1].scatter(
-                    self.data['annual_income'],
-                    self.data['monthly_savings'],
-                    alpha=0.6,
-                    color='green'
+            if payload['income_scatter'] is not None:
+                _draw_scatter(
+                    axes[0, 1], payload['income_scatter'], color='green'
                 )
                 axes[0, 1].set_title('Savings vs Annual Income')
                 axes[0, 1].set_xlabel('Annual Income ($)')
                 axes[0, 1].set_ylabel('Monthly Savings ($)')
 
                 # Add trend line
-                z = np.polyfit(
-                    self.data['annual_income'],
-                    self.data['monthly_savings'],
-                    1
-                )
-                p = np.poly1d(z)
-                axes[0, 1].plot(
-                    self.data['annual_income'],
-                    p(self.data['annual_income']),
-                    "r--",
-                    alpha=0.8
-                )
+                _draw_trend(axes[0, 1], payload['income_trend'])
 
             # Chart 3: Savings rate by age groups
-            if ('annual_income' in self.data.columns and
-                    'age' in self.data.columns):
-                monthly_income = self.data['annual_income'] / 12
-                savings_rate = (
-                    self.data['monthly_savings'] / monthly_income
-                )
-
-                age_groups = pd.cut(
-                    self.data['age'],
-                    bins=[0, 30, 40, 50, 100],
-                    labels=['<30', '30-40', '40-50', '50+']
-                )
-                avg_savings_rate = savings_rate.groupby(age_groups).mean()
+            if payload['rate_by_age'] is not None:
+                avg_savings_rate = payload['rate_by_age']
 
                 bars = axes[1, 0].bar(
                     range(len(avg_savings_rate)),
@@ -231,37 +430,18 @@ class DataVisualizer:
                     )
 
             # Chart 4: Emergency fund analysis (pie chart)
-            if 'emergency_fund_months' in self.data.columns:
-                fund_counts = [
-                    len(self.data[
-                        self.data['emergency_fund_months'] < 3
-                    ]),
-                    len(self.data[
-                        (self.data['emergency_fund_months'] >= 3) &
-                        (self.data['emergency_fund_months'] < 6)
-                    ]),
-                    len(self.data[
-                        self.data['emergency_fund_months'] >= 6
-                    ])
-                ]
-
+            if payload['emergency_fund_counts'] is not None:
                 axes[1, 1].pie(
-                    fund_counts,
+                    payload['emergency_fund_counts'],
                     labels=['<3 months', '3-6 months', '6+ months'],
                     autopct='%1.1f%%',
                     colors=['red', 'orange', 'green']
                 )
                 axes[1, 1].set_title('Emergency Fund Adequacy')
 
-            plt.tight_layout()
+            fig.tight_layout()
 
-            if save_path:
-                os.makedirs(os.path.dirname(save_path), exist_ok=True)
-                plt.savefig(save_path, dpi=300, bbox_inches='tight')
-                plt.close()
-                return True
-            else:
-                return fig
+            return _finish_figure(fig, save_path)
 
         except Exception as e:
             print(f"Error creating savings charts: {str(e)}")
@@ -269,21 +449,28 @@ class DataVisualizer:
 
     def create_investment_charts(self, save_path=None):
         """Create investment visualizations - returns figure for Streamlit."""
-        if self.data.empty:
+        return self.draw_investment_charts(
+            self.chart_data.payload('investment'), save_path
+        )
+
+    @staticmethod
+    def draw_investment_charts(payload, save_path=None):
+        """Draw the investment charts from their payload."""
+        if payload is None:
             return None
 
         try:
-            fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+            fig, axes = plt.subplots(
+                2, 2, figsize=CHART_FIGSIZES['investment']
+            )
             fig.suptitle(
                 'Personal Finance - Investment & Cryptocurrency Analysis',
                 fontsize=16,
                 fontweight='bold')
 
             # Chart 1: Investment preferences (pie chart)
-            if 'primary_investment' in self.data.columns:
-                investment_counts = (
-                    self.data['primary_investment'].value_counts()
-                )
+            if payload['investment_counts'] is not None:
+                investment_counts = payload['investment_counts']
 
                 axes[0, 0].pie(
                     investment_counts.values,
@@ -293,8 +480,8 @@ class DataVisualizer:
                 axes[0, 0].set_title('Investment Preferences Distribution')
 
             # Chart 2: Crypto ownership (pie chart)
-            if 'owns_crypto' in self.data.columns:
-                crypto_counts = self.data['owns_crypto'].value_counts()
+            if payload['crypto_counts'] is not None:
+                crypto_counts = payload['crypto_counts']
                 colors = ['lightcoral', 'lightblue']
 
                 axes[0, 1].pie(
@@ -306,18 +493,8 @@ class DataVisualizer:
                 axes[0, 1].set_title('Cryptocurrency Ownership')
 
             # Chart 3: Investment preference by age
-            if ('primary_investment' in self.data.columns and
-                    'age' in self.data.columns):
-                age_groups = pd.cut(
-                    self.data['age'],
-                    bins=[0, 30, 40, 50, 100],
-                    labels=['<30', '30-40', '40-50', '50+']
-                )
-                investment_age_crosstab = pd.crosstab(
-                    age_groups, self.data['primary_investment']
-                )
-
-                investment_age_crosstab.plot(
+            if payload['investment_by_age'] is not None:
+                payload['investment_by_age'].plot(
                     kind='bar', ax=axes[1, 0], width=0.8
                 )
                 axes[1, 0].set_title('Investment Preferences by Age Group')
@@ -331,29 +508,19 @@ class DataVisualizer:
                 axes[1, 0].tick_params(axis='x', rotation=45)
 
             # Chart 4: Crypto ownership vs Mobile banking
-            if ('owns_crypto' in self.data.columns and
-                    'uses_mobile_banking' in self.data.columns):
-                tech_adoption = pd.crosstab(
-                    self.data['uses_mobile_banking'],
-                    self.data['owns_crypto']
+            if payload['tech_adoption'] is not None:
+                payload['tech_adoption'].plot(
+                    kind='bar', ax=axes[1, 1], width=0.6
                 )
-
-                tech_adoption.plot(kind='bar', ax=axes[1, 1], width=0.6)
                 axes[1, 1].set_title('Technology Adoption Patterns')
                 axes[1, 1].set_xlabel('Uses Mobile Banking')
                 axes[1, 1].set_ylabel('Number of Respondents')
                 axes[1, 1].legend(title='Owns Crypto', labels=['No', 'Yes'])
                 axes[1, 1].tick_params(axis='x', rotation=0)
 
-            plt.tight_layout()
+            fig.tight_layout()
 
-            if save_path:
-                os.makedirs(os.path.dirname(save_path), exist_ok=True)
-                plt.savefig(save_path, dpi=300, bbox_inches='tight')
-                plt.close()
-                return True
-            else:
-                return fig
+            return _finish_figure(fig, save_path)
 
         except Exception as e:
             print(f"Error creating investment charts: {str(e)}")
@@ -365,62 +532,49 @@ class DataVisualizer:
 
         Returns figure for Streamlit.
         """
-        if (self.data.empty or
-                'financial_literacy_score' not in self.data.columns):
+        return self.draw_literacy_charts(
+            self.chart_data.payload('literacy'), save_path
+        )
+
+    @staticmethod
+    def draw_literacy_charts(payload, save_path=None):
+        """Draw the financial literacy charts from their payload."""
+        if payload is None:
             return None
 
         try:
-            fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+            fig, axes = plt.subplots(
+                2, 2, figsize=CHART_FIGSIZES['literacy']
+            )
             fig.suptitle(
                 'Personal Finance - Financial Literacy Analysis',
                 fontsize=16,
                 fontweight='bold')
 
             # Chart 1: Score distribution
-            axes[0, 0].hist(
-                self.data['financial_literacy_score'],
-                bins=10, alpha=0.7, edgecolor='black', color='purple'
+            _draw_histogram(
+                axes[0, 0], payload['score_histogram'],
+                alpha=0.7, edgecolor='black', color='purple'
             )
             axes[0, 0].set_title('Financial Literacy Score Distribution')
             axes[0, 0].set_xlabel('Literacy Score (1-10)')
             axes[0, 0].set_ylabel('Number of Respondents')
 
             # Chart 2: Literacy vs Income correlation
-            if 'annual_income' in self.data.columns:
-                axes[0, 1].scatter(
-                    self.data['financial_literacy_score'],
-                    self.data['annual_income'],
-                    alpha=0.6,
-                    color='purple'
+            if payload['income_scatter'] is not None:
+                _draw_scatter(
+                    axes[0, 1], payload['income_scatter'], color='purple'
                 )
                 axes[0, 1].set_title('Financial Literacy vs Income')
                 axes[0, 1].set_xlabel('Financial Literacy Score')
                 axes[0, 1].set_ylabel('Annual Income ($)')
 
                 # Add trend line
-                z = np.polyfit(
-                    self.data['financial_literacy_score'],
-                    self.data['annual_income'],
-                    1
-                )
-                p = np.poly1d(z)
-                axes[0, 1].plot(
-                    self.data['financial_literacy_score'],
-                    p(self.data['financial_literacy_score']),
-                    "r--",
-                    alpha=0.8
-                )
+                _draw_trend(axes[0, 1], payload['income_trend'])
 
             # Chart 3: Literacy by age groups
-            if 'age' in self.data.columns:
-                age_groups = pd.cut(
-                    self.data['age'],
-                    bins=[0, 30, 40, 50, 100],
-                    labels=['<30', '30-40', '40-50', '50+']
-                )
-                literacy_by_age = self.data.groupby(
-                    age_groups
-                )['financial_literacy_score'].mean()
+            if payload['score_by_age'] is not None:
+                literacy_by_age = payload['score_by_age']
 
                 bars = axes[1, 0].bar(
                     range(len(literacy_by_age)),
@@ -446,34 +600,17 @@ class DataVisualizer:
                     )
 
             # Chart 4: Literacy categories
-            high = len(
-                self.data[self.data['financial_literacy_score'] >= 8]
-            )
-            medium = len(self.data[
-                (self.data['financial_literacy_score'] >= 6) &
-                (self.data['financial_literacy_score'] < 8)
-            ])
-            low = len(
-                self.data[self.data['financial_literacy_score'] < 6]
-            )
-
             axes[1, 1].pie(
-                [low, medium, high],
+                payload['level_counts'],
                 labels=['Low (<6)', 'Medium (6-7)', 'High (8-10)'],
                 autopct='%1.1f%%',
                 colors=['red', 'orange', 'green']
             )
             axes[1, 1].set_title('Financial Literacy Categories')
 
-            plt.tight_layout()
+            fig.tight_layout()
 
-            if save_path:
-                os.makedirs(os.path.dirname(save_path), exist_ok=True)
-                plt.savefig(save_path, dpi=300, bbox_inches='tight')
-                plt.close()
-                return True
-            else:
-                return fig
+            return _finish_figure(fig, save_path)
 
         except Exception as e:
             print(f"Error creating literacy charts: {str(e)}")
@@ -481,11 +618,18 @@ class DataVisualizer:
 
     def create_comprehensive_dashboard(self, save_path=None):
         """Create comprehensive dashboard - returns figure for Streamlit."""
-        if self.data.empty:
+        return self.draw_dashboard(
+            self.chart_data.payload('dashboard'), save_path
+        )
+
+    @staticmethod
+    def draw_dashboard(payload, save_path=None):
+        """Draw the comprehensive dashboard from its payload."""
+        if payload is None:
             return None
 
         try:
-            fig = plt.figure(figsize=(20, 16))
+            fig = plt.figure(figsize=CHART_FIGSIZES['dashboard'])
             fig.suptitle(
                 'Personal Finance Survey - Comprehensive Dashboard',
                 fontsize=20,
@@ -497,12 +641,10 @@ class DataVisualizer:
             # Row 1: Demographics
             # Chart 1: Age distribution
             ax1 = fig.add_subplot(gs[0, 0])
-            if 'age' in self.data.columns:
-                ax1.hist(
-                    self.data['age'],
-                    bins=8,
-                    alpha=0.7,
-                    edgecolor='black'
+            if payload['age_histogram'] is not None:
+                _draw_histogram(
+                    ax1, payload['age_histogram'],
+                    alpha=0.7, edgecolor='black'
                 )
                 ax1.set_title('Age Distribution')
                 ax1.set_xlabel('Age')
@@ -510,13 +652,10 @@ class DataVisualizer:
 
             # Chart 2: Income distribution
             ax2 = fig.add_subplot(gs[0, 1])
-            if 'annual_income' in self.data.columns:
-                ax2.hist(
-                    self.data['annual_income'],
-                    bins=8,
-                    alpha=0.7,
-                    edgecolor='black',
-                    color='green'
+            if payload['income_histogram'] is not None:
+                _draw_histogram(
+                    ax2, payload['income_histogram'],
+                    alpha=0.7, edgecolor='black', color='green'
                 )
                 ax2.set_title('Income Distribution')
                 ax2.set_xlabel('Annual Income ($)')
@@ -524,13 +663,8 @@ class DataVisualizer:
 
             # Chart 3: Savings vs Income (large)
             ax3 = fig.add_subplot(gs[0, 2:])
-            if ('annual_income' in self.data.columns and
-                    'monthly_savings' in self.data.columns):
-                ax3.scatter(
-                    self.data['annual_income'],
-                    self.data['monthly_savings'],
-                    alpha=0.6
-                )
+            if payload['savings_scatter'] is not None:
+                _draw_scatter(ax3, payload['savings_scatter'])
                 ax3.set_title('Monthly Savings vs Annual Income')
                 ax3.set_xlabel('Annual Income ($)')
                 ax3.set_ylabel('Monthly Savings ($)')
@@ -538,10 +672,8 @@ class DataVisualizer:
             # Row 2: Investments and Tech
             # Chart 4: Investment preferences
             ax4 = fig.add_subplot(gs[1, 0])
-            if 'primary_investment' in self.data.columns:
-                investment_counts = (
-                    self.data['primary_investment'].value_counts()
-                )
+            if payload['investment_counts'] is not None:
+                investment_counts = payload['investment_counts']
                 ax4.pie(
                     investment_counts.values,
                     labels=investment_counts.index,
@@ -551,13 +683,10 @@ class DataVisualizer:
 
             # Chart 5: Technology adoption
             ax5 = fig.add_subplot(gs[1, 1])
-            if ('uses_mobile_banking' in self.data.columns and
-                    'owns_crypto' in self.data.columns):
-                mobile = self.data['uses_mobile_banking'].sum()
-                crypto = self.data['owns_crypto'].sum()
+            if payload['tech_users'] is not None:
                 ax5.bar(
                     ['Mobile Banking', 'Crypto'],
-                    [mobile, crypto],
+                    payload['tech_users'],
                     color=['blue', 'orange']
                 )
                 ax5.set_title('Technology Adoption')
@@ -565,17 +694,8 @@ class DataVisualizer:
 
             # Chart 6: Spending breakdown (large)
             ax6 = fig.add_subplot(gs[1, 2:])
-            spending_cols = [
-                col for col in self.data.columns
-                if 'spending' in col.lower()
-            ]
-            if spending_cols:
-                spending_totals = {
-                    col.replace('monthly_spending_', '').replace(
-                        '_', ' '
-                    ).title(): self.data[col].sum()
-                    for col in spending_cols
-                }
+            if payload['spending_totals'] is not None:
+                spending_totals = payload['spending_totals']
 
                 ax6.bar(
                     spending_totals.keys(),
@@ -589,13 +709,10 @@ class DataVisualizer:
             # Row 3: Financial Literacy
             # Chart 7: Financial literacy scores (wide)
             ax7 = fig.add_subplot(gs[2, :2])
-            if 'financial_literacy_score' in self.data.columns:
-                ax7.hist(
-                    self.data['financial_literacy_score'],
-                    bins=10,
-                    alpha=0.7,
-                    edgecolor='black',
-                    color='purple'
+            if payload['score_histogram'] is not None:
+                _draw_histogram(
+                    ax7, payload['score_histogram'],
+                    alpha=0.7, edgecolor='black', color='purple'
                 )
                 ax7.set_title('Financial Literacy Score Distribution')
                 ax7.set_xlabel('Literacy Score (1-10)')
@@ -603,21 +720,9 @@ class DataVisualizer:
 
             # Chart 8: Emergency fund adequacy (wide)
             ax8 = fig.add_subplot(gs[2, 2:])
-            if 'emergency_fund_months' in self.data.columns:
-                fund_counts = [
-                    len(self.data[
-                        self.data['emergency_fund_months'] < 3
-                    ]),
-                    len(self.data[
-                        (self.data['emergency_fund_months'] >= 3) &
-                        (self.data['emergency_fund_months'] < 6)
-                    ]),
-                    len(self.data[
-                        self.data['emergency_fund_months'] >= 6
-                    ])
-                ]
+            if payload['emergency_fund_counts'] is not None:
                 ax8.pie(
-                    fund_counts,
+                    payload['emergency_fund_counts'],
                     labels=['<3 months', '3-6 months', '6+ months'],
                     autopct='%1.1f%%',
                     colors=['red', 'orange', 'green']
@@ -628,25 +733,8 @@ class DataVisualizer:
             ax9 = fig.add_subplot(gs[3, :])
             ax9.axis('off')
 
-            # Create summary statistics
-            summary_data = [
-                ['Total Respondents', len(self.data)],
-                ['Avg Age', (
-                    f"{self.data['age'].mean():.1f}"
-                    if 'age' in self.data.columns else 'N/A'
-                )],
-                ['Avg Income', (
-                    f"${self.data['annual_income'].mean():,.0f}"
-                    if 'annual_income' in self.data.columns else 'N/A'
-                )],
-                ['Avg Savings', (
-                    f"${self.data['monthly_savings'].mean():.0f}"
-                    if 'monthly_savings' in self.data.columns else 'N/A'
-                )],
-            ]
-
             table = ax9.table(
-                cellText=summary_data,
+                cellText=payload['summary'],
                 colLabels=['Metric', 'Value'],
                 cellLoc='center',
                 loc='center',
@@ -657,39 +745,107 @@ class DataVisualizer:
             table.scale(1.2, 1.5)
             ax9.set_title('Key Statistics', fontsize=14, fontweight='bold')
 
-            if save_path:
-                os.makedirs(os.path.dirname(save_path), exist_ok=True)
-                plt.savefig(save_path, dpi=300, bbox_inches='tight')
-                plt.close()
-                return True
-            else:
-                return fig
+            return _finish_figure(fig, save_path)
 
         except Exception as e:
             print(f"Error creating dashboard: {str(e)}")
             return None
 
-    def export_all_charts(self, base_path="exports/charts"):
-        """Export all charts to files."""
+    # Drawing function for each chart name, used by render workers
+    DRAWERS = {
+        'spending': draw_spending_charts,
+        'savings': draw_savings_charts,
+        'investment': draw_investment_charts,
+        'literacy': draw_literacy_charts,
+        'dashboard': draw_dashboard,
+    }
+
+    def export_all_charts(self, base_path="exports/charts", workers=None):
+        """
+        Export all charts to files.
+
+        Charts already in the figure cache at export resolution are
+        written straight from it. Matplotlib's pyplot state is not
+        thread-safe, so the others are rendered in parallel with
+        processes: each worker uses the Agg backend and receives only
+        its chart's payload.
+
+        Args:
+            base_path (str): Directory for the PNG files
+            workers (int or str): If greater than 1, render charts in
+                this many processes instead of one after another; 'auto'
+                chooses with default_export_workers
+
+        Returns:
+            bool: True if successful; per-chart render seconds (and the
+                overall 'total') are left in self.render_timings
+        """
         try:
             os.makedirs(base_path, exist_ok=True)
+            if workers == 'auto':
+                workers = default_export_workers(len(self.data))
+            self.render_timings = {}
+            start_time = time.perf_counter()
+
+            images = {}
+            for chart, _ in EXPORT_CHARTS:
+                chart_start = time.perf_counter()
+                image = self.figure_cache.get(
+                    self._figure_key(chart, 'png', EXPORT_DPI)
+                )
+                if image is not None:
+                    images[chart] = image
+                    self.render_timings[chart] = round(
+                        time.perf_counter() - chart_start, 3
+                    )
+            missing = [
+                chart for chart, _ in EXPORT_CHARTS if chart not in images
+            ]
 
-            self.create_spending_charts(
-                f"{base_path}/spending_analysis.png"
-            )
-            self.create_savings_charts(
-                f"{base_path}/savings_analysis.png"
-            )
-            self.create_investment_charts(
-                f"{base_path}/investment_analysis.png"
-            )
-            self.create_financial_literacy_charts(
-                f"{base_path}/literacy_analysis.png"
-            )
-            self.create_comprehensive_dashboard(
-                f"{base_path}/comprehensive_dashboard.png"
-            )
+            if workers and workers > 1 and len(missing) > 1:
+                # Fresh (spawned) processes do not inherit pyplot state
+                with ProcessPoolExecutor(
+                        max_workers=min(workers, len(missing)),
+                        mp_context=get_context('spawn'),
+                        initializer=_init_render_worker
+                ) as executor:
+                    futures = {
+                        chart: executor.submit(
+                            _render_chart, chart,
+                            self.chart_data.payload(chart),
+                            'png', EXPORT_DPI
+                        )
+                        for chart in missing
+                    }
+                    rendered = {
+                        chart: future.result()
+                        for chart, future in futures.items()
+                    }
+            else:
+                rendered = {
+                    chart: _render_chart(
+                        chart, self.chart_data.payload(chart),
+                        'png', EXPORT_DPI
+                    )
+                    for chart in missing
+                }
+
+            for chart, (image, seconds) in rendered.items():
+                self.render_timings[chart] = round(seconds, 3)
+                if image is not None:
+                    images[chart] = image
+                    self.figure_cache.put(
+                        self._figure_key(chart, 'png', EXPORT_DPI), image
+                    )
 
+            for chart, file_name in EXPORT_CHARTS:
+                if chart in images:
+                    with open(f"{base_path}/{file_name}", 'wb') as f:
+                        f.write(images[chart])
+
+            self.render_timings['total'] = round(
+                time.perf_counter() - start_time, 3
+            )
             return True
         except Exception as e:
             print(f"Error exporting charts: {str(e)}")